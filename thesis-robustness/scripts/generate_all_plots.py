@@ -1,11 +1,22 @@
 #!/usr/bin/env python3
 """Generate professional plots for all severity grid results."""
 import json
+import sys
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
 import re
 
+# Add project root for imports
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+from src.common.robustness import (
+    compute_robustness_table,
+    results_to_long,
+    save_robustness_table,
+)
+
 # Professional styling
 plt.rcParams.update({
     'font.family': 'sans-serif',
@@ -235,32 +246,13 @@ def print_results_table(results, name, is_regression=False):
             print(f"{r['severity']:<12.2f} {acc:<14} {f1:<14} {auroc:<14}")
 
 
-def compute_degradation_summary(results, metric_key='test_accuracy'):
-    """Compute degradation summary statistics."""
-    values = [r[metric_key] for r in results if r.get(metric_key) is not None]
-    severities = [r['severity'] for r in results if r.get(metric_key) is not None]
-    
-    if len(values) < 2:
-        return None
-    
-    clean_value = values[0] if severities[0] == 0.0 else values[0]
-    worst_value = min(values)
-    
-    # Compute slope using linear regression
-    coeffs = np.polyfit(severities, values, 1)
-    slope = coeffs[0]
-    
-    # Area under degradation curve (normalized)
-    auc = np.trapz(values, severities) / max(severities)
-    
-    return {
-        'clean': clean_value,
-        'worst': worst_value,
-        'drop': clean_value - worst_value,
-        'drop_pct': (clean_value - worst_value) / clean_value * 100 if clean_value > 0 else 0,
-        'slope': slope,
-        'auc': auc
-    }
+def compute_degradation_table(results_by_grid):
+    """Compute robustness statistics for every grid and metric in one pass."""
+    frames = [
+        results_to_long(pd.DataFrame(results), grid=grid_name)
+        for grid_name, results in results_by_grid.items()
+    ]
+    return compute_robustness_table(pd.concat(frames, ignore_index=True))
 
 
 def main():
@@ -279,7 +271,7 @@ def main():
         'imdb_token_dropout': ('IMDB - Token Dropout', False),
     }
     
-    all_summaries = {}
+    all_results = {}
     
     for grid_name, (display_name, is_regression) in grids.items():
         grid_path = base_dir / grid_name
@@ -302,21 +294,24 @@ def main():
         else:
             plot_classification_degradation(results, plot_path, title=display_name)
         
-        # Compute summary
-        if not is_regression:
-            summary = compute_degradation_summary(results, 'test_accuracy')
-            if summary:
-                all_summaries[grid_name] = summary
+        all_results[grid_name] = results
     
-    # Print overall summary
-    if all_summaries:
+    # Robustness table shared by all downstream plots
+    if all_results:
+        table = compute_degradation_table(all_results)
+        table_path = output_dir / 'robustness_table.csv'
+        save_robustness_table(table, table_path)
+        print(f"\nRobustness table saved to: {table_path}")
+        
+        accuracy = table[(table['metric'] == 'test_accuracy') & (table['n_severities'] > 1)]
         print("\n" + "=" * 70)
         print("DEGRADATION SUMMARY")
         print("=" * 70)
         print(f"{'Experiment':<30} {'Clean':<10} {'Worst':<10} {'Drop %':<10} {'Slope':<10}")
         print("-" * 70)
-        for name, s in all_summaries.items():
-            print(f"{name:<30} {s['clean']:.4f}    {s['worst']:.4f}    {s['drop_pct']:.1f}%      {s['slope']:.4f}")
+        for _, s in accuracy.iterrows():
+            print(f"{s['grid']:<30} {s['clean_performance']:.4f}    {s['worst_performance']:.4f}    "
+                  f"{s['relative_drop'] * 100:.1f}%      {s['degradation_slope']:.4f}")
     
     print("\n" + "=" * 70)
     print("DONE")
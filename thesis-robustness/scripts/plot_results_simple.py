@@ -1,55 +1,21 @@
 #!/usr/bin/env python3
 """Simple script to plot results from severity grid runs."""
-import json
-import numpy as np
+import sys
 import matplotlib.pyplot as plt
 from pathlib import Path
-import re
 
-
-def extract_severity_from_dirname(dirname):
-    """Extract severity value from directory name."""
-    # Pattern: ..._additive_noise_0.30_...
-    match = re.search(r'_(\d+\.?\d*)_\d{8}_', dirname)
-    if match:
-        return float(match.group(1))
-    return None
+# Add project root for imports
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+from src.common.robustness import load_grid_summary
 
 
 def load_results_from_dirs(base_dir):
-    """Load results from individual run directories."""
-    base_path = Path(base_dir)
+    """Load per-severity metrics (mean across seeds) from the shared robustness tables."""
     results = []
-    
-    for run_dir in sorted(base_path.iterdir()):
-        if not run_dir.is_dir():
-            continue
-        
-        metrics_file = run_dir / 'final_metrics.json'
-        if not metrics_file.exists():
-            continue
-        
-        # Extract severity from directory name
-        severity = extract_severity_from_dirname(run_dir.name)
-        if severity is None:
-            continue
-        
-        # Load metrics
-        with open(metrics_file, 'r') as f:
-            metrics = json.load(f)
-        
-        results.append({
-            'severity': severity,
-            'test_accuracy': metrics.get('test_accuracy'),
-            'test_f1': metrics.get('test_f1'),
-            'test_auroc': metrics.get('test_auroc'),
-            'val_accuracy': metrics.get('val_accuracy'),
-            'val_f1': metrics.get('val_f1'),
-            'val_auroc': metrics.get('val_auroc'),
-        })
-    
-    # Sort by severity
-    results.sort(key=lambda x: x['severity'])
+    for row in load_grid_summary(Path(base_dir)):
+        metrics = {k[:-len('_mean')]: v for k, v in row.items() if k.endswith('_mean')}
+        results.append({'severity': row['severity'], **metrics})
     return results
 
 
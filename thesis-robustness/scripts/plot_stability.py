@@ -1,57 +1,23 @@
 #!/usr/bin/env python3
 """Plot stability/variance (degradation curves with error bars) and model comparison."""
-import json
-import re
+import sys
 import argparse
 from pathlib import Path
-from collections import defaultdict
-import numpy as np
 import matplotlib.pyplot as plt
 
-
-def _extract_severity_seed(dirname):
-    m = re.search(r'_(\d+\.?\d*)_seed(\d+)_', dirname)
-    if m:
-        return float(m.group(1)), int(m.group(2))
-    m = re.search(r'_(\d+\.?\d*)_\d{8}_', dirname)
-    if m:
-        return float(m.group(1)), None
-    return None, None
+# Add project root for imports
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+from src.common.robustness import load_grid_summary
 
 
 def load_results_from_grid_dir(grid_dir):
-    """Load grid dir: use stability_summary.json if present, else aggregate from run dirs."""
+    """Per-severity mean/std across seeds from the shared robustness tables."""
     grid_path = Path(grid_dir)
     if not grid_path.exists():
         return []
-    stability_file = grid_path / 'stability_summary.json'
-    if stability_file.exists():
-        with open(stability_file, 'r') as f:
-            return json.load(f)
-    by_severity = defaultdict(list)
-    for run_dir in grid_path.iterdir():
-        if not run_dir.is_dir():
-            continue
-        mfile = run_dir / 'final_metrics.json'
-        if not mfile.exists():
-            continue
-        sev, seed = _extract_severity_seed(run_dir.name)
-        if sev is None:
-            continue
-        with open(mfile, 'r') as f:
-            metrics = json.load(f)
-        by_severity[sev].append(metrics)
-    out = []
-    for sev in sorted(by_severity.keys()):
-        runs = by_severity[sev]
-        agg = {'severity': sev, 'n_seeds': len(runs)}
-        for key in ('test_accuracy', 'test_f1', 'test_auroc', 'val_accuracy', 'val_f1', 'val_auroc'):
-            vals = [float(r[key]) for r in runs if r.get(key) is not None]
-            if vals:
-                agg[f'{key}_mean'] = float(np.mean(vals))
-                agg[f'{key}_std'] = float(np.std(vals))
-        out.append(agg)
-    return out
+    return load_grid_summary(grid_path)
+
 
 plt.rcParams.update({
     'font.family': 'sans-serif',
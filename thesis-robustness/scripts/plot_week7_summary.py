@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """Create additional Week 7 summary plots."""
 import json
+import sys
 import argparse
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Add project root for imports
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+from src.common.robustness import load_grid_summary
+
 
 plt.rcParams.update({
     'font.family': 'sans-serif',
@@ -41,18 +47,17 @@ def _load_json(path: Path):
 
 
 def load_token_dropout_summaries(week7_dir: Path):
-    """Load stability_summary.json per model for IMDB token-dropout runs."""
+    """Load per-severity aggregates per model for IMDB token-dropout grids."""
     dir_map = {
-        'linear_svm': week7_dir / 'imdb_token_dropout_linear_svm' / 'stability_summary.json',
-        'xgboost': week7_dir / 'imdb_token_dropout_xgb' / 'stability_summary.json',
-        'random_forest': week7_dir / 'imdb_token_dropout_rf' / 'stability_summary.json',
+        'linear_svm': week7_dir / 'imdb_token_dropout_linear_svm',
+        'xgboost': week7_dir / 'imdb_token_dropout_xgb',
+        'random_forest': week7_dir / 'imdb_token_dropout_rf',
     }
     out = {}
-    for model, path in dir_map.items():
-        if not path.exists():
-            raise FileNotFoundError(f"Missing summary: {path}")
-        rows = _load_json(path)
-        out[model] = sorted(rows, key=lambda r: r['severity'])
+    for model, grid_dir in dir_map.items():
+        if not grid_dir.exists():
+            raise FileNotFoundError(f"Missing grid: {grid_dir}")
+        out[model] = load_grid_summary(grid_dir)
     return out
 
 
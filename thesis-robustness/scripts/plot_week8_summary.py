@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 """Create Week 8 Airbnb regression summary plots."""
 import argparse
-import json
+import sys
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 
+# Add project root for imports
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+from src.common.robustness import load_grid_summary
+
 
 plt.rcParams.update({
     "font.family": "sans-serif",
@@ -33,33 +38,27 @@ MODEL_COLOR = {
 }
 
 
-def _load_json(path: Path):
-    with open(path, "r") as f:
-        return json.load(f)
-
-
 def load_regression_stability(week8_dir: Path, corruption: str):
     if corruption == "noise":
         dir_map = {
-            "rf": week8_dir / "airbnb_noise_rf" / "stability_summary.json",
-            "linear": week8_dir / "airbnb_noise_linear" / "stability_summary.json",
-            "xgb": week8_dir / "airbnb_noise_xgb" / "stability_summary.json",
+            "rf": week8_dir / "airbnb_noise_rf",
+            "linear": week8_dir / "airbnb_noise_linear",
+            "xgb": week8_dir / "airbnb_noise_xgb",
         }
     elif corruption == "missingness":
         dir_map = {
-            "rf": week8_dir / "airbnb_missingness_rf" / "stability_summary.json",
-            "linear": week8_dir / "airbnb_missingness_linear" / "stability_summary.json",
-            "xgb": week8_dir / "airbnb_missingness_xgb" / "stability_summary.json",
+            "rf": week8_dir / "airbnb_missingness_rf",
+            "linear": week8_dir / "airbnb_missingness_linear",
+            "xgb": week8_dir / "airbnb_missingness_xgb",
         }
     else:
         raise ValueError(f"Unknown corruption: {corruption}")
 
     out = {}
-    for model, path in dir_map.items():
-        if not path.exists():
-            raise FileNotFoundError(f"Missing summary: {path}")
-        rows = _load_json(path)
-        out[model] = sorted(rows, key=lambda r: r["severity"])
+    for model, grid_dir in dir_map.items():
+        if not grid_dir.exists():
+            raise FileNotFoundError(f"Missing grid: {grid_dir}")
+        out[model] = load_grid_summary(grid_dir)
     return out
 
 
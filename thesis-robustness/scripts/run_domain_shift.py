@@ -20,7 +20,7 @@ _repo = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(_repo))
 from src.common.seed import set_seed
 from src.common.metrics import compute_classification_metrics
-from src.common.registry import get_model
+from src.common.registry import get_model, get_fit_params
 # Trigger model registration (tabular + text)
 import src.models.tabular  # noqa: F401
 import src.models.text     # noqa: F401
@@ -149,7 +149,8 @@ def run_domain_shift(
                 X_train_full, y_train_full, test_size=val_frac, random_state=seed, stratify=y_train_full
             )
             model = get_model(model_name, random_state=seed)
-            model.fit(X_train, y_train)
+            # Early-stopping models (xgboost) stop on the IMDB validation split
+            model.fit(X_train, y_train, **get_fit_params(model_name, X_val, y_val, model=model))
 
             def get_proba(model, X):
                 if hasattr(model, 'predict_proba'):
@@ -5,10 +5,54 @@ import matplotlib.pyplot as plt
 from pathlib import Path
 import argparse
 import base64
+import pandas as pd
+
+from ..common.io import load_jsonl
+from ..common.robustness import (
+    ROBUSTNESS_TABLE_FILENAME,
+    compute_robustness_table,
+    results_to_long,
+    save_robustness_table,
+)
+
+
+def load_grid_results(results_path):
+    """Load typed severity grid results (JSON Lines) as a DataFrame."""
+    return pd.DataFrame.from_records(load_jsonl(Path(results_path)))
+
+
+def summary_from_grid_results(df):
+    """Build the summary dict used by the table/plot helpers from grid results."""
+    val_cols = [c for c in df.columns if c.startswith('val_')]
+    test_cols = [c for c in df.columns if c.startswith('test_')]
+    results = []
+    for row in df.to_dict('records'):
+        results.append({
+            'severity': row['severity'],
+            'seed': row.get('seed'),
+            'val_metrics': {c[len('val_'):]: row[c] for c in val_cols},
+            'test_metrics': {c[len('test_'):]: row[c] for c in test_cols},
+            'run_dir': row.get('run_dir'),
+        })
+    return {
+        'severities': sorted(df['severity'].unique().tolist()) if len(df) else [],
+        'seeds': sorted(df['seed'].dropna().unique().tolist()) if 'seed' in df else [],
+        'model': df['model'].iloc[0] if len(df) and 'model' in df else None,
+        'results': results,
+        'table': df,
+    }
 
 
 def load_severity_grid_summary(summary_path):
-    """Load severity grid summary YAML."""
+    """Load a severity grid summary (JSON Lines results or legacy YAML)."""
+    summary_path = Path(summary_path)
+    if summary_path.suffix == '.jsonl':
+        return summary_from_grid_results(load_grid_results(summary_path))
+    return _load_legacy_yaml_summary(summary_path)
+
+
+def _load_legacy_yaml_summary(summary_path):
+    """Load legacy severity grid summary YAML (may contain numpy tags)."""
     import yaml.constructor
     
     # Custom loader to handle numpy serialization
@@ -75,6 +119,15 @@ def extract_numpy_value(value):
 
 def extract_metrics(summary, metric='accuracy', split='test'):
     """Extract metrics across severities."""
+    table = summary.get('table')
+    if table is not None:
+        column = f'{split}_{metric}'
+        if column not in table:
+            return np.array([]), np.array([])
+        valid = table[column].notna()
+        return (table.loc[valid, 'severity'].to_numpy(dtype=float),
+                table.loc[valid, column].to_numpy(dtype=float))
+    
     severities = []
     metrics = []
     
@@ -92,35 +145,24 @@ def extract_metrics(summary, metric='accuracy', split='test'):
 
 
 def compute_robustness_summary(severities, metrics):
-    """Compute robustness summary statistics."""
+    """Compute robustness summary statistics for a single degradation curve."""
     if len(metrics) == 0:
         return None
     
-    # Area under curve (normalized)
-    if len(severities) > 1:
-        auc = np.trapz(metrics, severities) / (severities.max() - severities.min())
-    else:
-        auc = metrics[0]
-    
-    # Performance drop
-    clean_perf = metrics[0]  # severity = 0
-    worst_perf = metrics.min()
-    max_drop = clean_perf - worst_perf
-    relative_drop = max_drop / clean_perf if clean_perf > 0 else 0
-    
-    # Degradation rate (slope)
-    if len(severities) > 1:
-        slope = np.polyfit(severities, metrics, 1)[0]  # Linear fit slope
-    else:
-        slope = 0
-    
+    long_df = pd.DataFrame({
+        'grid': 'grid', 'model': 'model', 'corruption': 'corruption', 'seed': -1,
+        'severity': np.asarray(severities, dtype=float),
+        'metric': 'value',
+        'value': np.asarray(metrics, dtype=float),
+    })
+    row = compute_robustness_table(long_df).iloc[0]
     return {
-        'auc': auc,
-        'clean_performance': clean_perf,
-        'worst_performance': worst_perf,
-        'max_drop': max_drop,
-        'relative_drop': relative_drop,
-        'degradation_slope': slope
+        'auc': row['auc'],
+        'clean_performance': row['clean_performance'],
+        'worst_performance': row['worst_performance'],
+        'max_drop': row['max_drop'],
+        'relative_drop': row['relative_drop'],
+        'degradation_slope': row['degradation_slope']
     }
 
 
@@ -236,8 +278,8 @@ def print_summary_table(summary):
 def main():
     parser = argparse.ArgumentParser(description='Analyze severity grid results')
     parser.add_argument('--summary', type=str, 
-                       default='outputs/severity_grids/severity_grid_summary.yaml',
-                       help='Path to severity grid summary YAML')
+                       default='outputs/severity_grids/severity_grid_results.jsonl',
+                       help='Path to severity grid results (.jsonl) or legacy summary YAML')
     parser.add_argument('--plot', type=str, default=None,
                        help='Path to save plot (default: show interactively)')
     parser.add_argument('--no-plot', action='store_true',
@@ -247,6 +289,11 @@ def main():
     
     # Load summary
     summary_path = Path(args.summary)
+    if not summary_path.exists() and summary_path.suffix == '.jsonl':
+        # Fall back to a legacy YAML summary written by older grid runs
+        legacy_path = summary_path.with_name('severity_grid_summary.yaml')
+        if legacy_path.exists():
+            summary_path = legacy_path
     if not summary_path.exists():
         print(f"Error: Summary file not found: {summary_path}")
         return
@@ -257,6 +304,15 @@ def main():
     # Print summary table
     print_summary_table(summary)
     
+    # Robustness statistics for every metric in one pass
+    if summary.get('table') is not None and len(summary['table']):
+        table = compute_robustness_table(
+            results_to_long(summary['table'], grid=summary_path.parent.name)
+        )
+        table_path = summary_path.parent / ROBUSTNESS_TABLE_FILENAME
+        save_robustness_table(table, table_path)
+        print(f"\nRobustness table saved to: {table_path}")
+    
     # Plot degradation curves
     if not args.no_plot:
         plot_path = args.plot or (summary_path.parent / 'degradation_curves.png')
@@ -0,0 +1,56 @@
+"""CLI entrypoint for evaluating stored models on many evaluation sets."""
+import argparse
+import yaml
+from pathlib import Path
+
+# Import datasets and models to trigger registration
+from .. import datasets, models, corruptions
+from ..common.artifacts import ArtifactStore
+from ..common.io import append_jsonl
+from ..pipelines.evaluate import expand_eval_sets, evaluate_artifacts
+
+EVALUATIONS_FILENAME = 'evaluations.jsonl'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Evaluate stored models (save_model: true) without retraining'
+    )
+    parser.add_argument('--spec', type=str, required=True,
+                        help='YAML with eval_sets (and optionally store, keys)')
+    parser.add_argument('--store', type=str, default=None,
+                        help='Artifact store directory (default: spec store, else outputs/runs/_artifacts)')
+    parser.add_argument('--keys', type=str, default=None,
+                        help='Comma-separated artifact keys (default: spec keys, else every stored model)')
+    parser.add_argument('--chunk-rows', type=int, default=None,
+                        help='Rows predicted per chunk (default: spec prediction.chunk_rows, else 8192)')
+    parser.add_argument('--predict-jobs', type=int, default=None,
+                        help='Chunks predicted concurrently in threads')
+    parser.add_argument('--output', type=str, default=None,
+                        help=f'Results file to append to (default: <store>/../{EVALUATIONS_FILENAME})')
+
+    args = parser.parse_args()
+
+    with open(args.spec, 'r') as f:
+        spec = yaml.safe_load(f)
+    store = ArtifactStore(Path(args.store or spec.get('store', 'outputs/runs/_artifacts')))
+    keys = args.keys.split(',') if args.keys else spec.get('keys')
+    eval_sets = expand_eval_sets(spec['eval_sets'])
+    n_models = len(keys) if keys is not None else len(store.keys())
+    print(f"Evaluating {n_models} stored models on {len(eval_sets)} evaluation sets")
+
+    prediction_cfg = dict(spec.get('prediction') or {})
+    if args.chunk_rows is not None:
+        prediction_cfg['chunk_rows'] = args.chunk_rows
+    if args.predict_jobs is not None:
+        prediction_cfg['n_jobs'] = args.predict_jobs
+
+    records = evaluate_artifacts(store, eval_sets, keys=keys, prediction_cfg=prediction_cfg)
+
+    output = Path(args.output) if args.output else store.root.parent / EVALUATIONS_FILENAME
+    append_jsonl(records, output)
+    print(f"\nAppended {len(records)} evaluation records to: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Build a single robustness table across many severity grids."""
+import argparse
+from pathlib import Path
+
+from ..common.robustness import (
+    compute_robustness_table,
+    load_grid_long,
+    save_robustness_table,
+)
+
+
+def find_grid_dirs(root: Path):
+    """Find severity grid directories (with results JSONL or stability summary) under root."""
+    markers = ('severity_grid_results.jsonl', 'stability_summary.json')
+    grid_dirs = set()
+    for marker in markers:
+        grid_dirs.update(p.parent for p in root.rglob(marker))
+    return sorted(grid_dirs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute robustness statistics for all grids at once')
+    parser.add_argument('--grid-dir', type=str, action='append', default=[],
+                        help='Severity grid directory (can repeat)')
+    parser.add_argument('--root', type=str, default=None,
+                        help='Search this directory recursively for severity grids')
+    parser.add_argument('--output', type=str, default='outputs/robustness_table.csv',
+                        help='Output CSV path')
+    parser.add_argument('--metric', type=str, default='test_accuracy',
+                        help='Metric to print after building the table')
+    args = parser.parse_args()
+    
+    grid_dirs = [Path(d) for d in args.grid_dir]
+    if args.root:
+        grid_dirs.extend(find_grid_dirs(Path(args.root)))
+    if not grid_dirs:
+        print("Provide at least one --grid-dir or --root")
+        return
+    
+    long_df = load_grid_long(grid_dirs)
+    table = compute_robustness_table(long_df)
+    save_robustness_table(table, Path(args.output))
+    
+    print(f"Robustness table saved to: {args.output}")
+    print(f"Grids: {long_df['grid'].nunique()}, curves: {len(table)}")
+    if len(table):
+        shown = table[table['metric'] == args.metric]
+        if len(shown):
+            print(shown.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
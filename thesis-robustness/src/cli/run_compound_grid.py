@@ -0,0 +1,151 @@
+"""Run compound (multi-axis) corruption grids, e.g. noise x missingness."""
+import argparse
+import itertools
+import traceback
+import yaml
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+
+# Import datasets and models to trigger registration
+from .. import datasets, models, corruptions
+from ..common.io import save_csv, save_jsonl
+from ..common.robustness import compound_surface, surface_matrix
+from ..common.seed import set_seed
+from ..pipelines.corruption import prepare_data, corrupt_training_data, fit_and_evaluate
+
+RESULTS_FILENAME = 'compound_grid_results.jsonl'
+SURFACE_FILENAME = 'compound_surface.csv'
+
+
+def axis_names(steps):
+    """Column name of each step's severity axis ('<type>_severity', indexed if repeated)."""
+    types = [step['type'] for step in steps]
+    return [
+        f'{t}_severity' if types.count(t) == 1 else f'{t}_{i}_severity'
+        for i, t in enumerate(types)
+    ]
+
+
+def expand_compound_grid(corruption_config):
+    """
+    Expand a compound corruption with per-step 'severities' lists into cells.
+
+    Returns:
+        List of step lists, in lexicographic order of the severity axes (so
+        consecutive cells share the longest possible prefix)
+    """
+    steps = corruption_config['steps']
+    axes = [step.get('severities', [step.get('severity', 0.0)]) for step in steps]
+    cells = []
+    for combo in itertools.product(*axes):
+        cell_steps = []
+        for step, severity in zip(steps, combo):
+            cell_step = {k: v for k, v in step.items() if k != 'severities'}
+            cell_step['severity'] = float(severity)
+            cell_steps.append(cell_step)
+        cells.append(cell_steps)
+    return cells
+
+
+def compound_result_record(result, config, steps, seed):
+    """Flatten one compound grid result into a JSON Lines record."""
+    record = {
+        'seed': int(seed),
+        'dataset': config['dataset'],
+        'model': config['model'],
+        'corruption': 'compound',
+        'run_dir': str(result['run_dir']),
+        'fit_time': float(result['fit_time']),
+        'eval_time': float(result['eval_time']),
+    }
+    for name, step in zip(axis_names(steps), steps):
+        record[name] = float(step['severity'])
+    for key, value in (result.get('data_stats') or {}).items():
+        record[key] = int(value)
+    for split in ('val', 'test'):
+        for k, v in result[f'{split}_metrics'].items():
+            record[f'{split}_{k}'] = None if v is None else float(v)
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run a compound corruption grid (one severity axis per step)'
+    )
+    parser.add_argument('--config', type=str, required=True,
+                        help="Config whose corruption is {type: compound, steps: [...]}; "
+                             "each step lists its 'severities'")
+    parser.add_argument('--output-dir', type=str, default='outputs/compound_grids',
+                        help='Output directory for results')
+    parser.add_argument('--seeds', type=str, default=None,
+                        help='Comma-separated seeds (default: single seed from config)')
+    parser.add_argument('--model', type=str, default=None,
+                        help='Override model from config')
+
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as f:
+        base_config = yaml.safe_load(f)
+    corruption_config = base_config.get('corruption') or {}
+    if corruption_config.get('type') != 'compound':
+        raise ValueError("Config corruption must have type 'compound' with a list of steps")
+
+    if args.seeds:
+        seeds = [int(s.strip()) for s in args.seeds.split(',')]
+    else:
+        seeds = [base_config.get('seed', 42)]
+    if args.model:
+        base_config['model'] = args.model
+        base_config.pop('model_params', None)
+    base_config['output_dir'] = args.output_dir
+
+    grid = expand_compound_grid(corruption_config)
+    axes = axis_names(corruption_config['steps'])
+    print(f"Compound grid: {' x '.join(axes)} = {len(grid)} cells x {len(seeds)} seeds")
+
+    records = []
+    for seed in seeds:
+        seed_config = dict(base_config, seed=seed)
+        set_seed(seed)
+        prepared = prepare_data(seed_config)
+        # Prefix cache: each noisy matrix is reused for every later-step severity
+        cache = {}
+        for steps in grid:
+            config = dict(seed_config, corruption={'type': 'compound', 'steps': steps})
+            label = '_'.join(f"{step['type']}{step['severity']:.2f}" for step in steps)
+            ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+            run_name = f"{config['dataset']}_{config['model']}_{label}_seed{seed}_{ts}"
+            try:
+                set_seed(seed)
+                data = corrupt_training_data(config, prepared, cache=cache)
+                result = fit_and_evaluate(config, data, run_name=run_name)
+            except Exception:
+                print(f"\nError at {label} seed {seed}: {traceback.format_exc().strip().splitlines()[-1]}")
+                continue
+            records.append(compound_result_record(result, config, steps, seed))
+
+    output_dir = Path(args.output_dir)
+    results_path = output_dir / RESULTS_FILENAME
+    save_jsonl(records, results_path)
+    print(f"Compound grid results saved to: {results_path}")
+
+    df = pd.DataFrame.from_records(records)
+    metrics = [c for c in df.columns if c.startswith('test_')]
+    if metrics:
+        surface = compound_surface(df, axes, metrics[0])
+        for metric in metrics[1:]:
+            surface = surface.merge(compound_surface(df, axes, metric).drop(columns='n_seeds'), on=axes)
+        save_csv(surface, output_dir / SURFACE_FILENAME)
+        print(f"Surface saved to: {output_dir / SURFACE_FILENAME}")
+        if len(axes) == 2:
+            for metric in metrics:
+                matrix = surface_matrix(surface, axes, metric)
+                matrix.to_csv(output_dir / f'surface_{metric}.csv')
+            print(f"2-D surface matrices saved to: {output_dir}/surface_<metric>.csv")
+
+    print(f"Completed {len(records)}/{len(grid) * len(seeds)} experiments")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,13 +5,44 @@ from pathlib import Path
 
 # Import datasets and models to trigger registration
 from .. import datasets, models, corruptions
-from ..pipelines.corruption import run_corruption_experiment
+from ..common.io import save_jsonl
+from ..pipelines.corruption import run_corruption_experiment, run_regularization_path
+
+
+def path_result_record(result, config):
+    """Flatten one regularization-path point into a JSON Lines record."""
+    corruption = result['corruption_config'] or {}
+    record = {
+        'dataset': config['dataset'],
+        'model': config['model'],
+        'corruption': corruption.get('type', 'none'),
+        'severity': corruption.get('severity'),
+        'seed': config.get('seed', 42),
+        'path_param': result['path_param'],
+        'path_value': float(result['path_value']),
+        'run_dir': str(result['run_dir']),
+        'fit_time': float(result['fit_time']),
+        'eval_time': float(result['eval_time']),
+    }
+    if result.get('path_solve_time') is not None:
+        record['path_solve_time'] = float(result['path_solve_time'])
+    if result.get('fit_iterations') is not None:
+        record['fit_iterations'] = int(result['fit_iterations'])
+    if result.get('warm_started'):
+        record['warm_started'] = True
+    for split in ('val', 'test'):
+        for k, v in (result.get(f'{split}_metrics') or {}).items():
+            record[f'{split}_{k}'] = None if v is None else float(v)
+    return record
 
 
 def main():
     parser = argparse.ArgumentParser(description='Run corruption robustness experiment')
     parser.add_argument('--config', type=str, required=True, help='Path to config YAML file')
     parser.add_argument('--run-name', type=str, default=None, help='Optional run name')
+    parser.add_argument('--path-values', type=str, default=None,
+                        help='Comma-separated C/alpha values: fit a regularization path '
+                             '(overrides regularization_path.values in the config)')
     
     args = parser.parse_args()
     
@@ -19,10 +50,24 @@ def main():
     with open(args.config, 'r') as f:
         config = yaml.safe_load(f)
     
-    # Run experiment
-    results = run_corruption_experiment(config, run_name=args.run_name)
+    values = [float(v) for v in args.path_values.split(',')] if args.path_values else None
+    if values is None and not config.get('regularization_path'):
+        # Run experiment
+        results = run_corruption_experiment(config, run_name=args.run_name)
+        print(f"\nResults saved to: {results['run_dir']}")
+        return
     
-    print(f"\nResults saved to: {results['run_dir']}")
+    # Regularization path: one run per point plus a JSON Lines summary
+    results = run_regularization_path(config, values=values, run_name=args.run_name)
+    records = [path_result_record(r, config) for r in results]
+    prefix = Path(results[0]['run_dir']).name.rsplit('_', 1)[0]
+    results_path = Path(config.get('output_dir', 'outputs/runs')) / f'{prefix}_path.jsonl'
+    save_jsonl(records, results_path)
+    metric = 'test_rmse' if 'test_rmse' in records[0] else 'test_accuracy'
+    print(f"\n{records[0]['path_param']:>12}{metric:>16}{'fit (s)':>10}")
+    for record in records:
+        print(f"{record['path_value']:>12g}{record.get(metric, float('nan')):>16.4f}{record['fit_time']:>10.2f}")
+    print(f"\nPath results saved to: {results_path}")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,87 @@
+"""CLI entrypoint for declarative experiment matrices."""
+import argparse
+import yaml
+from pathlib import Path
+
+# Import datasets and models to trigger registration
+from .. import datasets, models, corruptions
+from ..common.io import save_jsonl
+from ..common.supervisor import STATUS_OK
+from ..pipelines.matrix import expand_matrix, group_cells, run_matrix
+from .run_severity_grid import grid_result_record, cell_params
+
+RESULTS_FILENAME = 'matrix_results.jsonl'
+FAILURES_FILENAME = 'matrix_failures.jsonl'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run a datasets x models x corruptions x severities x seeds matrix'
+    )
+    parser.add_argument('--spec', type=str, required=True, help='Path to matrix spec YAML')
+    parser.add_argument('--output-dir', type=str, default=None,
+                        help='Override output_dir from the spec')
+    parser.add_argument('--model-jobs', type=int, default=None,
+                        help='Models fit concurrently per corrupted dataset (default: one per model)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Only print the expanded cells and data groups')
+
+    args = parser.parse_args()
+
+    with open(args.spec, 'r') as f:
+        spec = yaml.safe_load(f)
+    if args.output_dir:
+        spec['output_dir'] = args.output_dir
+
+    configs = expand_matrix(spec)
+    groups = group_cells(configs)
+    print(f"Matrix: {len(configs)} unique cells, {len(groups)} (dataset, seed) data groups")
+    if args.dry_run:
+        for group_configs in groups.values():
+            first = group_configs[0]
+            print(f"  {first['dataset']} seed {first['seed']}: {len(group_configs)} cells")
+            for config in group_configs:
+                corruption = config['corruption']
+                print(f"    {config['model']:<16} {corruption.get('type', 'none'):<16} "
+                      f"{corruption.get('severity', 0.0):.2f}")
+        return
+
+    outcomes = run_matrix(configs, n_jobs=args.model_jobs)
+
+    records = []
+    failures = []
+    for outcome in outcomes:
+        config = outcome['config']
+        if outcome['status'] == STATUS_OK:
+            result = dict(outcome['result'])
+            result['severity'] = config['corruption'].get('severity', 0.0)
+            result['seed'] = config['seed']
+            result['fit_time'] = outcome['fit_time']
+            result['eval_time'] = outcome['eval_time']
+            records.append(grid_result_record(result, config))
+        else:
+            failures.append({
+                'dataset': config['dataset'],
+                'model': config['model'],
+                'corruption': config['corruption'].get('type', 'none'),
+                'severity': float(config['corruption'].get('severity', 0.0)),
+                'seed': config['seed'],
+                **cell_params(config),
+                'status': outcome['status'],
+                'error': outcome['error'],
+            })
+
+    output_dir = Path(configs[0]['output_dir']) if configs else Path(spec.get('output_dir', 'outputs/matrix'))
+    results_path = output_dir / RESULTS_FILENAME
+    save_jsonl(records, results_path)
+    print(f"Matrix results saved to: {results_path}")
+    if failures:
+        failures_path = output_dir / FAILURES_FILENAME
+        save_jsonl(failures, failures_path)
+        print(f"Failed cells recorded in: {failures_path}")
+
+    print(f"Completed {len(records)}/{len(configs)} cells")
+
+
+if __name__ == '__main__':
+    main()
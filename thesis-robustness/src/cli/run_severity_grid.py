@@ -5,11 +5,20 @@ import yaml
 import numpy as np
 from pathlib import Path
 from datetime import datetime
-from tqdm import tqdm
 
 # Import datasets and models to trigger registration
 from .. import datasets, models, corruptions
-from ..pipelines.corruption import run_corruption_experiment
+from ..common.adaptive import plan_next_round
+from ..common.cost_model import CostModel, load_timing_history
+from ..common.io import save_jsonl, to_builtin
+from ..common.supervisor import STATUS_OK
+from ..pipelines.grid import run_cells, run_warm_start_chains, WARM_START_CHECKS
+
+RESULTS_FILENAME = 'severity_grid_results.jsonl'
+FAILURES_FILENAME = 'severity_grid_failures.jsonl'
+
+# Resource usage fields copied from cell outcomes into result records.
+_USAGE_KEYS = ('wall_time', 'cpu_time', 'max_rss_mb')
 
 
 def generate_severity_grid(min_severity=0.0, max_severity=1.0, n_points=11):
@@ -47,6 +56,104 @@ def _aggregate_stability(results, severities):
     return out
 
 
+def build_cells(base_config, severities, seeds, output_dir):
+    """One grid cell per (severity, seed)."""
+    cells = []
+    for severity in severities:
+        for seed in seeds:
+            config = base_config.copy()
+            config['corruption'] = base_config['corruption'].copy()
+            config['corruption']['severity'] = severity
+            config['seed'] = seed
+            config['output_dir'] = output_dir
+            dataset_name = config['dataset']
+            model_name = config['model']
+            corruption_str = config['corruption'].get('type', 'none')
+            ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+            run_name = f"{dataset_name}_{model_name}_{corruption_str}_{severity:.2f}_seed{seed}_{ts}"
+            cells.append({'config': config, 'run_name': run_name, 'severity': severity, 'seed': seed})
+    return cells
+
+
+def _default_adaptive_metric(results):
+    """First available of val_accuracy / val_rmse (refinement never looks at the test split by default)."""
+    for r in results:
+        for name in ('accuracy', 'rmse'):
+            if name in r['val_metrics']:
+                return f'val_{name}'
+    return 'val_accuracy'
+
+
+def cell_params(config):
+    """model_params and the corruption's parameters other than type/severity."""
+    return {
+        'model_params': dict(config.get('model_params') or {}),
+        'corruption_params': {k: v for k, v in config['corruption'].items() if k not in ('type', 'severity')},
+    }
+
+
+def grid_result_record(result, config):
+    """Flatten one grid result into a typed JSON Lines record."""
+    record = {
+        'severity': float(result['severity']),
+        'seed': int(result['seed']) if result.get('seed') is not None else None,
+        'dataset': config['dataset'],
+        'model': config['model'],
+        'corruption': config['corruption'].get('type', 'none'),
+        **cell_params(config),
+        'run_dir': str(result['run_dir']),
+    }
+    for key in _USAGE_KEYS + ('fit_time', 'eval_time'):
+        if result.get(key) is not None:
+            record[key] = float(result[key])
+    for key, value in (result.get('data_stats') or {}).items():
+        record[key] = int(value)
+    for key in ('fit_iterations', 'cold_fit_iterations'):
+        if result.get(key) is not None:
+            record[key] = int(result[key])
+    if result.get('warm_started'):
+        record['warm_started'] = True
+    for split in ('val', 'test', 'cold_test'):
+        for k, v in (result.get(f'{split}_metrics') or {}).items():
+            record[f'{split}_{k}'] = None if v is None else float(v)
+    return record
+
+
+def grid_failure_record(outcome, config):
+    """Describe a failed grid cell (status, error and resource usage)."""
+    record = {
+        'severity': float(outcome['severity']),
+        'seed': outcome.get('seed'),
+        'dataset': config['dataset'],
+        'model': config['model'],
+        'corruption': config['corruption'].get('type', 'none'),
+        'run_name': outcome['run_name'],
+        'status': outcome['status'],
+        'error': outcome.get('error'),
+    }
+    for key in _USAGE_KEYS + ('exitcode',):
+        if outcome.get(key) is not None:
+            record[key] = outcome[key]
+    return record
+
+
+def _print_warm_start_fidelity(results):
+    """Summarise warm vs cold fits (iterations and test metric differences)."""
+    checked = [r for r in results if r.get('cold_test_metrics')]
+    warm = [r for r in results if r.get('warm_started') and r.get('fit_iterations') is not None]
+    if warm:
+        print(f"Warm-started fits: {len(warm)}, mean iterations "
+              f"{np.mean([r['fit_iterations'] for r in warm]):.1f}")
+    for r in checked:
+        diffs = ', '.join(
+            f"{k} {r['test_metrics'][k] - v:+.4f}"
+            for k, v in r['cold_test_metrics'].items()
+            if v is not None and r['test_metrics'].get(k) is not None
+        )
+        print(f"Fidelity at severity {r['severity']:.2f} seed {r['seed']}: warm - cold: {diffs}; "
+              f"iterations {r.get('fit_iterations')} warm vs {r.get('cold_fit_iterations')} cold")
+
+
 def _save_stability_json(path, stability):
     """Save stability summary as JSON (float-safe)."""
     with open(path, 'w') as f:
@@ -69,8 +176,46 @@ def main():
                         help='Comma-separated seeds for stability (e.g. 42,43,44). Default: single seed from config.')
     parser.add_argument('--model', type=str, default=None,
                         help='Override model from config (e.g. xgboost, random_forest)')
+    parser.add_argument('--write-yaml', action='store_true',
+                        help='Also write the legacy severity_grid_summary.yaml')
+    parser.add_argument('--isolate', action='store_true',
+                        help='Run each cell in its own supervised process')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='Per-cell wall-clock timeout in seconds (implies --isolate)')
+    parser.add_argument('--memory-limit-mb', type=float, default=None,
+                        help='Per-cell resident-memory (RSS) ceiling in MB (implies --isolate)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of cells run concurrently (implies --isolate)')
+    parser.add_argument('--history', action='append', default=None,
+                        help='Directory with past grid results used to predict cell costs '
+                             '(repeatable; default: --output-dir)')
+    parser.add_argument('--warm-start', action='store_true',
+                        help='Fit each seed\'s severities in order, initialising every model from '
+                             'the previous severity\'s fit (models with a warm_start trait)')
+    parser.add_argument('--warm-start-check', choices=WARM_START_CHECKS, default='last',
+                        help='Warm-started cells that are also fit cold for comparison')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='Start from a coarse grid and add severities where the curve '
+                             'changes fastest or seeds disagree most')
+    parser.add_argument('--coarse-points', type=int, default=5,
+                        help='Initial grid size in adaptive mode')
+    parser.add_argument('--tolerance', type=float, default=0.01,
+                        help='Adaptive mode: stop when no interval scores above this '
+                             '(metric change + seed std)')
+    parser.add_argument('--max-runs', type=int, default=None,
+                        help='Adaptive mode: total run budget (default: --n-points x seeds)')
+    parser.add_argument('--refine-batch', type=int, default=2,
+                        help='Adaptive mode: severities added per round')
+    parser.add_argument('--min-spacing', type=float, default=0.01,
+                        help='Adaptive mode: smallest severity spacing')
+    parser.add_argument('--adaptive-metric', type=str, default=None,
+                        help='Adaptive mode: metric to refine on (default: val_accuracy or val_rmse; '
+                             'test_* metrics only if given explicitly)')
     
     args = parser.parse_args()
+    if args.warm_start and (args.isolate or args.workers > 1 or args.timeout is not None
+                            or args.memory_limit_mb is not None):
+        parser.error('--warm-start chains run in-process; drop --isolate/--workers/--timeout/--memory-limit-mb')
     
     # Load base config
     with open(args.config, 'r') as f:
@@ -88,82 +233,117 @@ def main():
     
     if args.severities:
         severities = [float(s.strip()) for s in args.severities.split(',')]
+    elif args.adaptive:
+        severities = generate_severity_grid(args.min_severity, args.max_severity, args.coarse_points)
     else:
         severities = generate_severity_grid(args.min_severity, args.max_severity, args.n_points)
     
-    n_runs = len(severities) * len(seeds)
-    print(f"Running {n_runs} experiments: {len(severities)} severities x {len(seeds)} seeds")
+    if args.adaptive:
+        max_runs = args.max_runs if args.max_runs is not None else args.n_points * len(seeds)
+        print(f"Adaptive grid: {len(severities)} initial severities x {len(seeds)} seeds, "
+              f"budget {max_runs} runs, tolerance {args.tolerance}")
+    else:
+        n_runs = len(severities) * len(seeds)
+        print(f"Running {n_runs} experiments: {len(severities)} severities x {len(seeds)} seeds")
     print(f"Severities: {severities}, Seeds: {seeds}, Model: {base_config['model']}")
     
     if 'corruption' not in base_config:
         raise ValueError("Config must include 'corruption' section")
     
+    history = load_timing_history(args.history or [args.output_dir])
+    cost_model = CostModel.from_records(history)
+    print(f"Cost model fitted on {len(history)} timed runs")
+    
     results = []
-    for severity in tqdm(severities, desc="Severity grid"):
-        for seed in seeds:
-            config = base_config.copy()
-            config['corruption'] = base_config['corruption'].copy()
-            config['corruption']['severity'] = severity
-            config['seed'] = seed
-            config['output_dir'] = args.output_dir
-            dataset_name = config['dataset']
-            model_name = config['model']
-            corruption_str = config['corruption'].get('type', 'none')
-            ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-            run_name = f"{dataset_name}_{model_name}_{corruption_str}_{severity:.2f}_seed{seed}_{ts}"
-            try:
-                result = run_corruption_experiment(config, run_name=run_name)
-                result['severity'] = severity
-                result['seed'] = seed
+    failures = []
+    pending = list(severities)
+    severities = []
+    n_runs = 0
+    # Warm-start chains {seed: {severity: model}}, kept across adaptive rounds
+    fitted = {} if args.adaptive else None
+    while pending:
+        cells = build_cells(base_config, pending, seeds, args.output_dir)
+        if args.warm_start:
+            outcomes = run_warm_start_chains(cells, fitted=fitted, check=args.warm_start_check)
+        else:
+            outcomes = run_cells(
+                cells,
+                isolate=args.isolate,
+                timeout=args.timeout,
+                memory_limit_mb=args.memory_limit_mb,
+                desc="Severity grid",
+                workers=args.workers,
+                costs=cost_model.predict_cells(cells),
+            )
+        severities = sorted(severities + pending)
+        n_runs += len(cells)
+        for outcome in outcomes:
+            if outcome['status'] == STATUS_OK:
+                result = dict(outcome['result'])
+                result['severity'] = outcome['severity']
+                result['seed'] = outcome['seed']
+                for key in _USAGE_KEYS:
+                    result[key] = outcome.get(key)
                 results.append(result)
-            except Exception as e:
-                print(f"\nError at severity {severity} seed {seed}: {e}")
-                continue
+            else:
+                failures.append(grid_failure_record(outcome, base_config))
+        
+        if not args.adaptive or not results:
+            break
+        metric = args.adaptive_metric or _default_adaptive_metric(results)
+        pending = [s for s in plan_next_round(
+            results, metric, n_seeds=len(seeds), runs_done=n_runs, max_runs=max_runs,
+            tolerance=args.tolerance, batch=args.refine_batch, min_spacing=args.min_spacing,
+        ) if s not in severities]
+        if pending:
+            print(f"Refining {metric} at severities: {pending}")
+        else:
+            print(f"Adaptive grid stopped after {n_runs} runs on {len(severities)} severities")
     
-    summary_path = Path(args.output_dir) / 'severity_grid_summary.yaml'
-    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    if args.warm_start:
+        _print_warm_start_fidelity(results)
     
-    summary = {
-        'config_file': args.config,
-        'severities': severities,
-        'seeds': seeds,
-        'model': base_config['model'],
-        'results': [
-            {
-                'severity': r['severity'],
-                'seed': r.get('seed'),
-                'val_metrics': r['val_metrics'],
-                'test_metrics': r['test_metrics'],
-                'run_dir': str(r['run_dir'])
-            }
-            for r in results
-        ]
-    }
+    output_dir = Path(args.output_dir)
+    results_path = output_dir / RESULTS_FILENAME
+    save_jsonl((grid_result_record(r, base_config) for r in results), results_path)
+    print(f"Severity grid results saved to: {results_path}")
     
     if len(seeds) > 1:
         stability = _aggregate_stability(results, severities)
-        stability_path = Path(args.output_dir) / 'stability_summary.json'
+        stability_path = output_dir / 'stability_summary.json'
         _save_stability_json(stability_path, stability)
-        summary['stability_aggregates'] = stability
         print(f"Stability summary saved to: {stability_path}")
     
-    def convert_numpy_types(obj):
-        if isinstance(obj, (np.integer, np.int64)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float64)):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, dict):
-            return {k: convert_numpy_types(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_numpy_types(x) for x in obj]
-        return obj
+    if args.write_yaml:
+        # Legacy YAML summary (slower to load; kept for older analysis scripts)
+        summary = {
+            'config_file': args.config,
+            'severities': severities,
+            'seeds': seeds,
+            'model': base_config['model'],
+            'results': [
+                {
+                    'severity': r['severity'],
+                    'seed': r.get('seed'),
+                    'val_metrics': r['val_metrics'],
+                    'test_metrics': r['test_metrics'],
+                    'run_dir': str(r['run_dir'])
+                }
+                for r in results
+            ]
+        }
+        if len(seeds) > 1:
+            summary['stability_aggregates'] = stability
+        summary_path = output_dir / 'severity_grid_summary.yaml'
+        with open(summary_path, 'w') as f:
+            yaml.dump(to_builtin(summary), f, default_flow_style=False)
+        print(f"Severity grid summary saved to: {summary_path}")
     
-    with open(summary_path, 'w') as f:
-        yaml.dump(convert_numpy_types(summary), f, default_flow_style=False)
+    if failures:
+        failures_path = output_dir / FAILURES_FILENAME
+        save_jsonl(failures, failures_path)
+        print(f"Failed cells recorded in: {failures_path}")
     
-    print(f"Severity grid summary saved to: {summary_path}")
     print(f"Completed {len(results)}/{n_runs} experiments")
 
 
@@ -2,14 +2,18 @@
 import argparse
 import pandas as pd
 from pathlib import Path
-import json
-from ..common.io import load_json, save_csv
+from ..common.io import save_csv
+from ..common.run_index import scan_runs
 
 
 def main():
     parser = argparse.ArgumentParser(description='Summarize experiment results')
     parser.add_argument('--runs-dir', type=str, default='outputs/runs', help='Directory containing run results')
     parser.add_argument('--output', type=str, required=True, help='Output CSV path')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Ignore the persistent run index and re-parse every run')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Threads used to scan run directories (default: auto)')
     
     args = parser.parse_args()
     
@@ -18,28 +22,8 @@ def main():
         print(f"Runs directory not found: {runs_dir}")
         return
     
-    # Collect all results
-    results = []
-    for run_dir in runs_dir.iterdir():
-        if not run_dir.is_dir():
-            continue
-        
-        metrics_file = run_dir / 'final_metrics.json'
-        config_file = run_dir / 'config.json'
-        
-        if not metrics_file.exists() or not config_file.exists():
-            continue
-        
-        metrics = load_json(metrics_file)
-        config = load_json(config_file)
-        
-        result = {
-            'run_name': run_dir.name,
-            'dataset': config.get('dataset'),
-            'model': config.get('model'),
-            **metrics
-        }
-        results.append(result)
+    # Collect all results (only new/changed runs are re-parsed)
+    results = scan_runs(runs_dir, use_index=not args.no_index, max_workers=args.workers)
     
     # Create summary DataFrame
     df = pd.DataFrame(results)
@@ -0,0 +1,104 @@
+"""Adaptive refinement of severity grids.
+
+A uniform ``linspace`` grid spends most runs on the flat parts of a
+degradation curve. Starting from a coarse grid, we score every interval
+between neighbouring severities by how much the mean metric changes across
+it plus how much the seeds disagree at its ends, and bisect the worst
+intervals. Refinement stops once every interval scores below the tolerance,
+intervals become narrower than ``min_spacing``, or the run budget is spent.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+def severity_curve(results: Iterable[Dict], metric: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mean and std (across seeds) of a metric at each severity.
+
+    Args:
+        results: Grid results with 'severity' and '<split>_metrics' dicts
+        metric: Split-prefixed metric name, e.g. 'test_accuracy'
+
+    Returns:
+        (severities, means, stds) sorted by severity
+    """
+    split, name = metric.split('_', 1)
+    by_severity = defaultdict(list)
+    for r in results:
+        value = r[f'{split}_metrics'].get(name)
+        if value is not None:
+            by_severity[float(r['severity'])].append(float(value))
+    severities = np.array(sorted(by_severity))
+    means = np.array([np.mean(by_severity[s]) for s in severities])
+    stds = np.array([np.std(by_severity[s]) for s in severities])
+    return severities, means, stds
+
+
+def interval_scores(means: np.ndarray, stds: np.ndarray, seed_weight: float = 1.0) -> np.ndarray:
+    """Score each interval by |change of the mean| plus the average seed std at its ends."""
+    change = np.abs(np.diff(means))
+    disagreement = (stds[1:] + stds[:-1]) / 2.0
+    return change + seed_weight * disagreement
+
+
+def propose_severities(
+    severities: np.ndarray,
+    means: np.ndarray,
+    stds: np.ndarray,
+    tolerance: float = 0.01,
+    max_new: int = 2,
+    min_spacing: float = 0.01,
+    seed_weight: float = 1.0,
+) -> List[float]:
+    """
+    Pick midpoints of the intervals that most need refinement.
+
+    Args:
+        severities: Evaluated severities (sorted)
+        means: Mean metric per severity
+        stds: Std across seeds per severity
+        tolerance: Intervals scoring at or below this are left alone
+        max_new: Maximum number of new severities
+        min_spacing: Intervals narrower than 2 * min_spacing are not split
+        seed_weight: Weight of seed disagreement relative to the change in mean
+
+    Returns:
+        New severities (sorted), possibly empty when the curve is resolved
+    """
+    if len(severities) < 2 or max_new <= 0:
+        return []
+    scores = interval_scores(means, stds, seed_weight)
+    widths = np.diff(severities)
+    candidates = np.flatnonzero((scores > tolerance) & (widths >= 2 * min_spacing))
+    best = candidates[np.argsort(-scores[candidates], kind='stable')][:max_new]
+    midpoints = (severities[best] + severities[best + 1]) / 2.0
+    return sorted(round(float(s), 6) for s in midpoints)
+
+
+def plan_next_round(
+    results: Iterable[Dict],
+    metric: str,
+    n_seeds: int,
+    runs_done: int,
+    max_runs: Optional[int] = None,
+    tolerance: float = 0.01,
+    batch: int = 2,
+    min_spacing: float = 0.01,
+    seed_weight: float = 1.0,
+) -> List[float]:
+    """
+    Severities to evaluate next, respecting the run budget.
+
+    Returns:
+        New severities; empty when refinement should stop
+    """
+    max_new = batch
+    if max_runs is not None:
+        max_new = min(max_new, (max_runs - runs_done) // max(1, n_seeds))
+    severities, means, stds = severity_curve(results, metric)
+    return propose_severities(
+        severities, means, stds, tolerance=tolerance, max_new=max_new,
+        min_spacing=min_spacing, seed_weight=seed_weight,
+    )
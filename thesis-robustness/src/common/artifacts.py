@@ -0,0 +1,131 @@
+"""On-disk store of fitted models and their preprocessing, keyed by run hash.
+
+Each artifact is a directory ``<root>/<run_hash>/`` holding the fitted model,
+the fitted preprocessors (TF-IDF vectorizer, scaler, imputer) and, for runs
+with ``calibration``, the validation-calibrated scorer as uncompressed joblib
+files plus a ``meta.json``. Their numpy arrays are
+memory-mapped read-only on load, so evaluation jobs neither retrain nor
+deserialize a private copy of large arrays: concurrent processes loading the
+same artifact share its pages. Loads are lazy (nothing is read until
+``load``) and memoised per store.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import joblib
+
+from .io import ensure_dir, save_json, load_json, to_builtin
+
+ARTIFACTS_DIRNAME = '_artifacts'
+MODEL_FILENAME = 'model.joblib'
+PREPROCESSORS_FILENAME = 'preprocessors.joblib'
+SCORER_FILENAME = 'scorer.joblib'
+META_FILENAME = 'meta.json'
+
+# Config keys that only affect logging/outputs, not the fitted model
+RUN_HASH_IGNORED = ('output_dir', 'save_predictions', 'save_model', 'bootstrap')
+
+
+def run_hash(config: Dict[str, Any]) -> str:
+    """Stable short hash of everything in a config that determines the fitted model."""
+    relevant = {k: v for k, v in config.items() if k not in RUN_HASH_IGNORED}
+    return hashlib.sha1(json.dumps(relevant, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+class ArtifactStore:
+    """
+    Directory of fitted-model artifacts.
+
+    Args:
+        root: Store directory (e.g. ``<output_dir>/_artifacts``)
+        mmap_mode: numpy memory-map mode for loaded arrays (None reads them
+                   into memory)
+    """
+
+    def __init__(self, root: Path, mmap_mode: Optional[str] = 'r'):
+        self.root = Path(root)
+        self.mmap_mode = mmap_mode
+        self._loaded: Dict[str, Dict[str, Any]] = {}
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    def exists(self, key: str) -> bool:
+        # meta.json is written last, so its presence marks a complete artifact
+        return (self.path(key) / META_FILENAME).exists()
+
+    def keys(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / META_FILENAME).exists())
+
+    def save(
+        self,
+        key: str,
+        model: Any,
+        preprocessors: Optional[Dict[str, Any]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        scorer: Any = None
+    ) -> Path:
+        """
+        Save a fitted model (and preprocessors) under key.
+
+        scorer is an optional estimator providing the run's scores (e.g. the
+        calibrated wrapper of model); labels still come from model.
+
+        The artifact is written to a temporary directory and renamed into
+        place, so concurrent writers of the same key never expose a partial
+        artifact; the first complete one wins.
+
+        Returns:
+            Artifact directory
+        """
+        target = self.path(key)
+        if self.exists(key):
+            return target
+        ensure_dir(self.root)
+        tmp = Path(tempfile.mkdtemp(prefix=f'.{key}.', dir=self.root))
+        try:
+            # Uncompressed, so the arrays can be memory-mapped on load
+            joblib.dump(model, tmp / MODEL_FILENAME)
+            joblib.dump(preprocessors or {}, tmp / PREPROCESSORS_FILENAME)
+            if scorer is not None:
+                joblib.dump(scorer, tmp / SCORER_FILENAME)
+            meta = dict(meta or {}, key=key, model_type=type(model).__name__)
+            save_json(to_builtin(meta), tmp / META_FILENAME)
+            os.replace(tmp, target)
+        except OSError:
+            if not self.exists(key):
+                raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        return target
+
+    def load(self, key: str) -> Dict[str, Any]:
+        """
+        Load an artifact ('model', 'preprocessors', 'scorer', 'meta'), memory-mapping its arrays.
+
+        'scorer' is None unless the model was saved with one.
+
+        Raises:
+            FileNotFoundError: If no complete artifact exists under key
+        """
+        if key in self._loaded:
+            return self._loaded[key]
+        if not self.exists(key):
+            raise FileNotFoundError(f"No artifact {key} in {self.root}")
+        path = self.path(key)
+        artifact = {
+            'model': joblib.load(path / MODEL_FILENAME, mmap_mode=self.mmap_mode),
+            'preprocessors': joblib.load(path / PREPROCESSORS_FILENAME, mmap_mode=self.mmap_mode),
+            'scorer': (joblib.load(path / SCORER_FILENAME, mmap_mode=self.mmap_mode)
+                       if (path / SCORER_FILENAME).exists() else None),
+            'meta': load_json(path / META_FILENAME),
+        }
+        self._loaded[key] = artifact
+        return artifact
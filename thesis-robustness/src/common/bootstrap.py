@@ -0,0 +1,211 @@
+"""Vectorized bootstrap confidence intervals for evaluation metrics.
+
+Instead of re-running seeds (full retrains), we resample the stored test
+predictions. Resamples are drawn as an index matrix and turned into a
+per-resample count matrix ``C`` of shape (n_resamples, n_samples); every
+metric is then a handful of matrix-vector products against ``C``. AUROC uses
+the rank (Mann-Whitney) formulation over a single global sort of the scores,
+so there is no per-resample sklearn call.
+"""
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .logging import load_predictions
+
+CLASSIFICATION_METRICS = ('accuracy', 'f1', 'auroc')
+REGRESSION_METRICS = ('rmse', 'mae')
+
+
+def _resample_counts(n: int, n_resamples: int, rng: np.random.RandomState) -> np.ndarray:
+    """Draw an index matrix and return how often each sample appears per resample."""
+    idx = rng.randint(0, n, size=(n_resamples, n))
+    offsets = (np.arange(n_resamples) * n)[:, None]
+    counts = np.bincount((idx + offsets).ravel(), minlength=n_resamples * n)
+    return counts.reshape(n_resamples, n).astype(np.float32)
+
+
+def _weighted_f1(counts, y_true, y_pred, labels):
+    """Support-weighted F1 (sklearn average='weighted') for each resample."""
+    n = y_true.shape[0]
+    f1 = np.zeros(counts.shape[0])
+    for label in labels:
+        is_true = (y_true == label).astype(np.float32)
+        is_pred = (y_pred == label).astype(np.float32)
+        # Counts are small integers, so float32 sums are exact
+        support = (counts @ is_true).astype(np.float64)
+        tp = (counts @ (is_true * is_pred)).astype(np.float64)
+        denom = support + counts @ is_pred
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f1_label = np.where(denom > 0, 2.0 * tp / denom, 0.0)
+        f1 += support * f1_label
+    return f1 / n
+
+
+def _rank_auroc(counts, y_true, y_score, positive_label):
+    """AUROC per resample from tie-grouped rank statistics."""
+    order = np.argsort(y_score, kind='mergesort')
+    sorted_score = y_score[order]
+    starts = np.flatnonzero(np.r_[True, sorted_score[1:] != sorted_score[:-1]])
+    is_pos = (y_true[order] == positive_label).astype(np.float32)
+
+    sorted_counts = counts[:, order]
+    pos = np.add.reduceat(sorted_counts * is_pos, starts, axis=1).astype(np.float64)
+    neg = np.add.reduceat(sorted_counts * (1.0 - is_pos), starts, axis=1).astype(np.float64)
+
+    # Negatives strictly below each tie group, plus half of tied negatives
+    neg_below = np.cumsum(neg, axis=1) - neg
+    n_pos = pos.sum(axis=1)
+    n_neg = neg.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        auc = (pos * (neg_below + 0.5 * neg)).sum(axis=1) / (n_pos * n_neg)
+    return np.where((n_pos > 0) & (n_neg > 0), auc, np.nan)
+
+
+def bootstrap_metrics(
+    y_true,
+    y_pred,
+    y_score=None,
+    task: str = 'classification',
+    n_resamples: int = 2000,
+    random_state: Optional[int] = None,
+    block_size: int = 250,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute metrics on bootstrap resamples of a fixed set of predictions.
+
+    Args:
+        y_true: True labels / targets
+        y_pred: Predicted labels / values
+        y_score: Optional scores for AUROC (binary classification only)
+        task: 'classification' or 'regression'
+        n_resamples: Number of bootstrap resamples
+        random_state: Random seed for reproducibility
+        block_size: Resamples processed per batch (bounds peak memory)
+
+    Returns:
+        Dict mapping metric name to an array of shape (n_resamples,)
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    n = y_true.shape[0]
+    rng = np.random.RandomState(random_state)
+
+    if task == 'regression':
+        err = (y_pred.astype(np.float64) - y_true.astype(np.float64))
+        sq_err = (err ** 2).astype(np.float32)
+        abs_err = np.abs(err).astype(np.float32)
+        names = REGRESSION_METRICS
+    else:
+        correct = (y_true == y_pred).astype(np.float32)
+        labels = np.unique(np.concatenate([y_true, y_pred]))
+        classes = np.unique(y_true)
+        use_auroc = y_score is not None and len(classes) == 2
+        if use_auroc:
+            y_score = np.asarray(y_score, dtype=np.float64)
+        names = CLASSIFICATION_METRICS if use_auroc else CLASSIFICATION_METRICS[:2]
+
+    out = {name: np.empty(n_resamples) for name in names}
+    for start in range(0, n_resamples, block_size):
+        stop = min(start + block_size, n_resamples)
+        counts = _resample_counts(n, stop - start, rng)
+        if task == 'regression':
+            out['rmse'][start:stop] = np.sqrt((counts @ sq_err).astype(np.float64) / n)
+            out['mae'][start:stop] = (counts @ abs_err).astype(np.float64) / n
+        else:
+            out['accuracy'][start:stop] = (counts @ correct).astype(np.float64) / n
+            out['f1'][start:stop] = _weighted_f1(counts, y_true, y_pred, labels)
+            if use_auroc:
+                out['auroc'][start:stop] = _rank_auroc(counts, y_true, y_score, classes[1])
+    return out
+
+
+def bootstrap_ci(
+    y_true,
+    y_pred,
+    y_score=None,
+    task: str = 'classification',
+    n_resamples: int = 2000,
+    confidence: float = 0.95,
+    random_state: Optional[int] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Percentile bootstrap confidence intervals for test metrics.
+
+    Returns:
+        Dict mapping metric name to {'ci_low', 'ci_high', 'std'}
+    """
+    samples = bootstrap_metrics(
+        y_true, y_pred, y_score, task=task,
+        n_resamples=n_resamples, random_state=random_state
+    )
+    alpha = (1.0 - confidence) / 2.0
+    intervals = {}
+    for name, values in samples.items():
+        if np.all(np.isnan(values)):
+            continue
+        low, high = np.nanpercentile(values, [100 * alpha, 100 * (1 - alpha)])
+        intervals[name] = {
+            'ci_low': float(low),
+            'ci_high': float(high),
+            'std': float(np.nanstd(values)),
+        }
+    return intervals
+
+
+def bootstrap_from_config(
+    bootstrap_cfg: Any,
+    y_true,
+    y_pred,
+    y_score=None,
+    task: str = 'classification',
+    random_state: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Run the bootstrap described by a config entry and flatten the result.
+
+    ``bootstrap_cfg`` may be ``True`` (defaults) or a dict with
+    ``n_resamples`` and ``confidence``. Returns keys like ``accuracy_ci_low``.
+    """
+    if not bootstrap_cfg:
+        return {}
+    if not isinstance(bootstrap_cfg, dict):
+        bootstrap_cfg = {}
+    intervals = bootstrap_ci(
+        y_true, y_pred, y_score, task=task,
+        n_resamples=bootstrap_cfg.get('n_resamples', 2000),
+        confidence=bootstrap_cfg.get('confidence', 0.95),
+        random_state=random_state,
+    )
+    flat = {}
+    for name, stats in intervals.items():
+        for k, v in stats.items():
+            flat[f'{name}_{k}'] = v
+    return flat
+
+
+def bootstrap_ci_from_run(
+    run_dir: Path,
+    split: str = 'test',
+    n_resamples: int = 2000,
+    confidence: float = 0.95,
+    random_state: Optional[int] = None,
+    task: Optional[str] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Bootstrap confidence intervals from a run's stored prediction archive.
+
+    The task is read from the archive; pass ``task`` only for archives
+    written before it was recorded.
+    """
+    stored = load_predictions(run_dir)[split]
+    if 'y_true' not in stored:
+        raise ValueError(f"Prediction archive in {run_dir} has no split reference")
+    task = stored['task'] or task
+    if task is None:
+        raise ValueError(f"Prediction archive in {run_dir} does not record its task; pass task=")
+    return bootstrap_ci(
+        stored['y_true'], stored['y_pred'], stored.get('y_score'), task=task,
+        n_resamples=n_resamples, confidence=confidence, random_state=random_state
+    )
@@ -0,0 +1,164 @@
+"""Cost model for grid cells, fitted on recorded timings of past runs.
+
+Grid cells differ by orders of magnitude in cost (an RBF SVM on full Adult
+versus a heavily subsampled imbalance cell). Past severity grid records
+carry the cell's wall time and the size of its training matrix
+(``n_samples``, ``nnz``), so we fit a per-model power law
+
+    log(wall_time) = a_model + offset_(dataset, model) + b_model * log(nnz)
+
+and estimate the training size of a new cell from any earlier run on the same
+dataset/corruption (interpolated over severity). Unknown combinations fall
+back to coarser medians so every cell gets a finite estimate.
+"""
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .io import load_jsonl
+
+RESULTS_FILENAME = 'severity_grid_results.jsonl'
+
+# Estimate used when there is no timing history at all.
+DEFAULT_COST = 1.0
+
+
+def load_timing_history(roots: Sequence[Path]) -> List[Dict[str, Any]]:
+    """Collect grid result records that carry a wall time under the given directories."""
+    records = []
+    for root in roots:
+        root = Path(root)
+        if not root.exists():
+            continue
+        paths = [root] if root.is_file() else sorted(root.rglob(RESULTS_FILENAME))
+        for path in paths:
+            records.extend(r for r in load_jsonl(path) if r.get('wall_time'))
+    return records
+
+
+class CostModel:
+    """Predict the wall time of a grid cell from past timings."""
+
+    def __init__(self):
+        self.model_fits = {}
+        self.offsets = {}
+        self.exact = {}
+        self.sizes = defaultdict(list)
+        self.dataset_sizes = {}
+        self.model_medians = {}
+        self.global_median = DEFAULT_COST
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'CostModel':
+        """
+        Fit the cost model.
+
+        Args:
+            records: Grid result records with dataset, model, corruption,
+                     severity, wall_time and optionally nnz
+
+        Returns:
+            Fitted CostModel
+        """
+        cost_model = cls()
+        records = [r for r in records if r.get('wall_time')]
+        if not records:
+            return cost_model
+
+        times = defaultdict(list)
+        by_model = defaultdict(list)
+        sizes = defaultdict(list)
+        for r in records:
+            key = (r['dataset'], r['model'], r.get('corruption', 'none'), round(float(r['severity']), 4))
+            times[key].append(float(r['wall_time']))
+            if r.get('nnz'):
+                nnz = float(r['nnz'])
+                by_model[r['model']].append((r['dataset'], np.log(nnz), np.log(r['wall_time'])))
+                sizes[(r['dataset'], r.get('corruption', 'none'))].append((float(r['severity']), nnz))
+
+        cost_model.exact = {k: float(np.median(v)) for k, v in times.items()}
+        all_times = np.array([float(r['wall_time']) for r in records])
+        cost_model.global_median = float(np.median(all_times))
+        model_times = defaultdict(list)
+        for r in records:
+            model_times[r['model']].append(float(r['wall_time']))
+        cost_model.model_medians = {m: float(np.median(v)) for m, v in model_times.items()}
+
+        # Per-model power law over training size, plus a per-dataset offset
+        for model, rows in by_model.items():
+            log_nnz = np.array([row[1] for row in rows])
+            log_t = np.array([row[2] for row in rows])
+            if np.ptp(log_nnz) > 0:
+                slope, intercept = np.polyfit(log_nnz, log_t, 1)
+                slope = float(np.clip(slope, 0.0, 3.0))
+            else:
+                slope = 1.0
+            intercept = float(np.mean(log_t - slope * log_nnz))
+            cost_model.model_fits[model] = (intercept, slope)
+            residuals = defaultdict(list)
+            for (dataset, x, t) in rows:
+                residuals[dataset].append(t - intercept - slope * x)
+            for dataset, res in residuals.items():
+                cost_model.offsets[(dataset, model)] = float(np.mean(res))
+
+        # Training size as a function of severity per dataset/corruption
+        for key, pairs in sizes.items():
+            pairs = sorted(pairs)
+            severities = np.array([p[0] for p in pairs])
+            values = np.array([p[1] for p in pairs])
+            unique_sev = np.unique(severities)
+            medians = np.array([np.median(values[severities == s]) for s in unique_sev])
+            cost_model.sizes[key] = (unique_sev, medians)
+        dataset_nnz = defaultdict(list)
+        for (dataset, _), (_, medians) in cost_model.sizes.items():
+            dataset_nnz[dataset].extend(medians.tolist())
+        cost_model.dataset_sizes = {d: float(np.median(v)) for d, v in dataset_nnz.items()}
+        return cost_model
+
+    def estimate_size(self, dataset: str, corruption: str, severity: float) -> Optional[float]:
+        """Estimated training nnz of a cell, or None if the dataset was never seen."""
+        if (dataset, corruption) in self.sizes:
+            severities, values = self.sizes[(dataset, corruption)]
+            return float(np.interp(severity, severities, values))
+        return self.dataset_sizes.get(dataset)
+
+    def predict(self, dataset: str, model: str, corruption: str = 'none', severity: float = 0.0) -> float:
+        """Predicted wall time of one cell in seconds."""
+        exact = self.exact.get((dataset, model, corruption, round(float(severity), 4)))
+        if exact is not None:
+            return exact
+        size = self.estimate_size(dataset, corruption, severity)
+        if model in self.model_fits and size:
+            intercept, slope = self.model_fits[model]
+            offset = self.offsets.get((dataset, model), 0.0)
+            return float(np.exp(intercept + offset + slope * np.log(size)))
+        return self.model_medians.get(model, self.global_median)
+
+    def predict_cells(self, cells: Sequence[Dict[str, Any]]) -> List[float]:
+        """Predicted wall times for grid cells (dicts with a 'config')."""
+        costs = []
+        for cell in cells:
+            config = cell['config']
+            corruption = config.get('corruption') or {}
+            costs.append(self.predict(
+                config['dataset'], config['model'],
+                corruption.get('type', 'none'), corruption.get('severity', 0.0)
+            ))
+        return costs
+
+
+def longest_first(costs: Sequence[float]) -> List[int]:
+    """Cell indices ordered by decreasing predicted cost (LPT scheduling)."""
+    return sorted(range(len(costs)), key=lambda i: -costs[i])
+
+
+def estimate_makespan(costs: Sequence[float], workers: int = 1) -> float:
+    """Simulate longest-first dispatch on ``workers`` slots and return the finish time."""
+    if not costs:
+        return 0.0
+    loads = np.zeros(max(1, workers))
+    for i in longest_first(costs):
+        loads[np.argmin(loads)] += costs[i]
+    return float(loads.max())
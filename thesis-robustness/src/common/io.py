@@ -37,6 +37,45 @@ def load_json(path: Path):
         return json.load(f)
 
 
+def save_jsonl(records, path: Path):
+    """Save an iterable of flat dicts as JSON Lines (one record per line)."""
+    ensure_dir(path.parent)
+    with open(path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record))
+            f.write('\n')
+
+
+def append_jsonl(records, path: Path):
+    """Append flat dicts to a JSON Lines file (created if missing)."""
+    ensure_dir(path.parent)
+    with open(path, 'a') as f:
+        for record in records:
+            f.write(json.dumps(record))
+            f.write('\n')
+
+
+def load_jsonl(path: Path):
+    """Load JSON Lines records as a list of dicts."""
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def to_builtin(obj):
+    """Recursively convert numpy scalars/arrays to plain Python types."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, np.floating):
+        return float(obj)
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, dict):
+        return {k: to_builtin(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [to_builtin(x) for x in obj]
+    return obj
+
+
 def save_csv(df: pd.DataFrame, path: Path):
     """Save DataFrame as CSV."""
     ensure_dir(path.parent)
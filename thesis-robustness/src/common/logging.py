@@ -1,12 +1,49 @@
 """Logging utilities for experiment tracking."""
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 from .io import ensure_dir, save_json, save_csv
 
+PREDICTIONS_FILENAME = 'predictions.npz'
+
+
+def _compact_labels(y: np.ndarray) -> np.ndarray:
+    """Store integer labels as int8 when they fit; keep other dtypes as-is."""
+    y = np.asarray(y)
+    if np.issubdtype(y.dtype, np.integer) and y.size and y.min() >= -128 and y.max() <= 127:
+        return y.astype(np.int8)
+    if np.issubdtype(y.dtype, np.floating):
+        return y.astype(np.float32)
+    return y
+
+
+def save_split_reference(path: Path, indices: Dict[str, np.ndarray], y: np.ndarray):
+    """
+    Save evaluation split indices and labels once, shared by every run.
+    
+    Args:
+        path: Target .npz path (skipped if it already exists)
+        indices: Mapping split name ('val', 'test') -> row indices into the dataset
+        y: Full target vector of the dataset
+    """
+    path = Path(path)
+    if path.exists():
+        return
+    ensure_dir(path.parent)
+    arrays = {}
+    for split, idx in indices.items():
+        arrays[f'{split}_index'] = np.asarray(idx, dtype=np.int32)
+        arrays[f'{split}_true'] = _compact_labels(y[idx])
+    # Write to a temp file first so concurrent runs never see a partial file
+    tmp_path = path.with_name(f'{path.stem}.{os.getpid()}.tmp.npz')
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
 
 class RunLogger:
     """Logger for experiment runs."""
@@ -35,9 +72,71 @@ class RunLogger:
         df = pd.DataFrame(self.metrics)
         save_csv(df, self.run_dir / 'metrics.csv')
         save_json(metrics, self.run_dir / 'final_metrics.json')
+    
+    def log_predictions(
+        self,
+        predictions: Dict[str, Tuple[np.ndarray, Optional[np.ndarray]]],
+        split_ref: Optional[Path] = None,
+        is_regression: bool = False
+    ):
+        """
+        Save per-sample predictions as a compact array archive.
+        
+        Labels are stored as int8 and scores as float16 (regression
+        predictions as float32), together with the task. True labels are not
+        copied: the archive points at a shared split reference written by
+        save_split_reference.
+        
+        Args:
+            predictions: Mapping split name -> (y_pred, y_score or None)
+            split_ref: Path of the shared split reference file
+            is_regression: Whether predictions are continuous targets
+        """
+        arrays = {'task': np.array('regression' if is_regression else 'classification')}
+        for split, (y_pred, y_score) in predictions.items():
+            if is_regression:
+                arrays[f'{split}_pred'] = np.asarray(y_pred, dtype=np.float32)
+            else:
+                arrays[f'{split}_pred'] = _compact_labels(y_pred)
+            if y_score is not None:
+                arrays[f'{split}_score'] = np.asarray(y_score, dtype=np.float16)
+        if split_ref is not None:
+            arrays['split_ref'] = np.array(os.path.relpath(split_ref, self.run_dir))
+        np.savez(self.run_dir / PREDICTIONS_FILENAME, **arrays)
         
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of logged metrics."""
         if not self.metrics:
             return {}
         return self.metrics[-1]  # Return most recent entry
+
+
+def load_predictions(run_dir: Path) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Load a run's prediction archive, resolving true labels from the split reference.
+    
+    Returns:
+        Mapping split name -> {'y_pred', 'y_score' (optional), 'y_true', 'index',
+        'task' ('classification' or 'regression')}
+    """
+    run_dir = Path(run_dir)
+    out = {}
+    with np.load(run_dir / PREDICTIONS_FILENAME) as archive:
+        ref = None
+        task = str(archive['task']) if 'task' in archive.files else None
+        if 'split_ref' in archive.files:
+            ref = np.load(run_dir / str(archive['split_ref']))
+        for key in archive.files:
+            if not key.endswith('_pred'):
+                continue
+            split = key[:-len('_pred')]
+            entry = {'y_pred': archive[key], 'task': task}
+            if f'{split}_score' in archive.files:
+                entry['y_score'] = archive[f'{split}_score']
+            if ref is not None and f'{split}_true' in ref.files:
+                entry['y_true'] = ref[f'{split}_true']
+                entry['index'] = ref[f'{split}_index']
+            out[split] = entry
+        if ref is not None:
+            ref.close()
+    return out
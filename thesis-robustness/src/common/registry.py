@@ -4,14 +4,28 @@ from typing import Dict, Callable, Any
 # Model registry
 MODELS: Dict[str, Callable] = {}
 
+# Optional per-model traits the pipelines act on:
+#   native_missing: the model handles NaN itself, so imputation is skipped
+#   eval_set: fit() accepts the validation split as eval_set (XGBoost early stopping)
+#   early_stopping_rounds: patience set on eval_set models once a validation
+#                          split is passed (XGBoost takes it as a constructor
+#                          parameter and refuses to fit without an eval_set)
+#   val_split: fit() accepts the validation split as X_val/y_val (sklearn early stopping)
+#   warm_start: how a fit can start from a neighbouring fit ('coef', see
+#               models.warm_start)
+#   reg_path: the parameter a regularization path sweeps ('C' or 'alpha', see
+#             models.reg_path)
+MODEL_TRAITS: Dict[str, Dict[str, Any]] = {}
+
 # Dataset registry
 DATASETS: Dict[str, Callable] = {}
 
 
-def register_model(name: str):
-    """Decorator to register a model factory."""
+def register_model(name: str, **traits):
+    """Decorator to register a model factory (with optional traits, see MODEL_TRAITS)."""
     def decorator(func: Callable):
         MODELS[name] = func
+        MODEL_TRAITS[name] = dict(traits)
         return func
     return decorator
 
@@ -31,6 +45,32 @@ def get_model(name: str, **kwargs):
     return MODELS[name](**kwargs)
 
 
+def get_model_traits(name: str) -> Dict[str, Any]:
+    """Traits registered for a model (empty for unknown models)."""
+    return MODEL_TRAITS.get(name, {})
+
+
+def get_fit_params(name: str, X_val=None, y_val=None, model=None) -> Dict[str, Any]:
+    """
+    Extra fit() keyword arguments for a model, e.g. the validation split for early stopping.
+    
+    For eval_set models, ``model`` also gets its early_stopping_rounds trait
+    (unless model_params already set it), so early stopping is only enabled
+    when a validation split is actually supplied.
+    """
+    traits = get_model_traits(name)
+    if X_val is None:
+        return {}
+    if traits.get('eval_set'):
+        rounds = traits.get('early_stopping_rounds')
+        if model is not None and rounds and model.get_params().get('early_stopping_rounds') is None:
+            model.set_params(early_stopping_rounds=rounds)
+        return {'eval_set': [(X_val, y_val)], 'verbose': False}
+    if traits.get('val_split'):
+        return {'X_val': X_val, 'y_val': y_val}
+    return {}
+
+
 def get_dataset(name: str, **kwargs):
     """Get a dataset by name."""
     if name not in DATASETS:
@@ -0,0 +1,234 @@
+"""Robustness summary statistics over degradation curves.
+
+All grids are handled in one pass: results are kept in a long-format table
+with one row per (grid, model, corruption, seed, severity, metric) and the
+per-curve statistics are computed with grouped numpy reductions instead of
+one Python loop per grid/metric.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .io import load_jsonl, save_csv
+from .run_index import scan_runs
+
+CURVE_KEYS = ['grid', 'model', 'corruption', 'metric']
+LONG_COLUMNS = CURVE_KEYS[:3] + ['seed', 'severity', 'metric', 'value']
+
+# Metrics where a larger value means worse performance.
+LOWER_IS_BETTER = ('rmse', 'mae')
+
+ROBUSTNESS_TABLE_FILENAME = 'robustness_table.csv'
+
+
+def is_lower_better(metric: str) -> bool:
+    """Return True for error metrics such as rmse/mae (optionally split-prefixed)."""
+    return metric.split('_')[-1] in LOWER_IS_BETTER
+
+
+def results_to_long(
+    df: pd.DataFrame,
+    grid: Optional[str] = None,
+    metric_prefixes: Sequence[str] = ('val_', 'test_'),
+) -> pd.DataFrame:
+    """
+    Melt wide per-run results into the long robustness format.
+
+    Args:
+        df: One row per run with 'severity', optional 'seed', 'model',
+            'corruption' columns and metric columns such as 'test_accuracy'
+        grid: Grid name; defaults to the existing 'grid' column (or 'grid')
+        metric_prefixes: Column prefixes that identify metric columns
+
+    Returns:
+        DataFrame with columns grid, model, corruption, seed, severity, metric, value
+    """
+    df = df.copy()
+    if grid is not None or 'grid' not in df:
+        df['grid'] = grid if grid is not None else 'grid'
+    for col, default in (('model', 'unknown'), ('corruption', 'none'), ('seed', -1)):
+        if col not in df:
+            df[col] = default
+    df['seed'] = df['seed'].fillna(-1)
+    metric_cols = [c for c in df.columns if c.startswith(tuple(metric_prefixes))]
+    long_df = df.melt(
+        id_vars=['grid', 'model', 'corruption', 'seed', 'severity'],
+        value_vars=metric_cols,
+        var_name='metric',
+        value_name='value',
+    )
+    long_df['value'] = pd.to_numeric(long_df['value'], errors='coerce')
+    long_df['severity'] = long_df['severity'].astype(float)
+    return long_df.dropna(subset=['severity', 'value'])[LONG_COLUMNS]
+
+
+def severity_curves(long_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Average seeds per (curve, severity).
+
+    Returns:
+        DataFrame with columns grid, model, corruption, metric, severity,
+        mean, std (np.std across seeds) and n_seeds, sorted by curve and severity
+    """
+    grouped = long_df.groupby(CURVE_KEYS + ['severity'], sort=True)['value']
+    return pd.DataFrame({
+        'mean': grouped.mean(),
+        'std': grouped.std(ddof=0),
+        'n_seeds': grouped.count(),
+    }).reset_index()
+
+
+def compute_robustness_table(long_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute robustness statistics for every degradation curve at once.
+
+    Seeds are first averaged per (curve, severity). For each curve
+    (grid, model, corruption, metric) the returned table contains:
+        - clean_performance: mean value at the lowest severity
+        - worst_performance: worst mean value (min, or max for rmse/mae)
+        - max_drop / relative_drop: degradation from clean to worst
+        - auc: trapezoid area under the mean curve divided by the severity range
+        - degradation_slope: least-squares slope of the mean curve
+        - seed_std_mean / seed_std_max: dispersion across seeds (np.std)
+    """
+    curves = severity_curves(long_df)
+    if curves.empty:
+        return pd.DataFrame(columns=CURVE_KEYS + ['n_severities'])
+
+    group_id = curves.groupby(CURVE_KEYS, sort=False).ngroup().to_numpy()
+    n_groups = int(group_id.max()) + 1
+    starts = np.flatnonzero(np.r_[True, group_id[1:] != group_id[:-1]])
+    x = curves['severity'].to_numpy(dtype=float)
+    y = curves['mean'].to_numpy(dtype=float)
+    std = curves['std'].to_numpy(dtype=float)
+
+    def group_sum(values):
+        return np.bincount(group_id, weights=values, minlength=n_groups)
+
+    n = np.bincount(group_id, minlength=n_groups).astype(float)
+    x_range = np.maximum.reduceat(x, starts) - np.minimum.reduceat(x, starts)
+
+    # Trapezoid area over consecutive severities of the same curve
+    same = group_id[1:] == group_id[:-1]
+    segment_area = np.diff(x) * (y[1:] + y[:-1]) / 2.0
+    area = np.bincount(group_id[1:][same], weights=segment_area[same], minlength=n_groups)
+    clean = y[starts]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        auc = np.where(x_range > 0, area / x_range, clean)
+
+    # Worst performance / drop, respecting metric direction
+    keys = curves.iloc[starts][CURVE_KEYS].reset_index(drop=True)
+    lower_better = keys['metric'].map(is_lower_better).to_numpy(dtype=bool)
+    worst = np.where(lower_better, np.maximum.reduceat(y, starts), np.minimum.reduceat(y, starts))
+    max_drop = np.where(lower_better, worst - clean, clean - worst)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_drop = np.where(clean != 0, max_drop / np.abs(clean), 0.0)
+
+    # Least-squares slope from grouped sums
+    sx, sy = group_sum(x), group_sum(y)
+    denom = n * group_sum(x * x) - sx * sx
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(denom > 0, (n * group_sum(x * y) - sx * sy) / denom, 0.0)
+
+    table = keys
+    table['n_severities'] = n.astype(int)
+    table['n_seeds'] = np.maximum.reduceat(curves['n_seeds'].to_numpy(), starts)
+    table['clean_performance'] = clean
+    table['worst_performance'] = worst
+    table['max_drop'] = max_drop
+    table['relative_drop'] = relative_drop
+    table['auc'] = auc
+    table['degradation_slope'] = slope
+    table['seed_std_mean'] = group_sum(std) / n
+    table['seed_std_max'] = np.maximum.reduceat(std, starts)
+    return table
+
+
+def save_robustness_table(table: pd.DataFrame, path: Path):
+    """Save the robustness table as CSV."""
+    save_csv(table, Path(path))
+
+
+def load_robustness_table(path: Path, metric: Optional[str] = None) -> pd.DataFrame:
+    """Load a robustness table, optionally filtered to a single metric."""
+    table = pd.read_csv(path)
+    if metric is not None:
+        table = table[table['metric'] == metric].reset_index(drop=True)
+    return table
+
+
+def load_grid_long(grid_dirs: List[Path]) -> pd.DataFrame:
+    """
+    Build the long-format table for a set of severity grid directories.
+
+    Uses ``severity_grid_results.jsonl`` when present and otherwise falls
+    back to the (indexed) run directories inside each grid.
+    """
+    frames = []
+    for grid_dir in grid_dirs:
+        grid_dir = Path(grid_dir)
+        results_path = grid_dir / 'severity_grid_results.jsonl'
+        if results_path.exists():
+            df = pd.DataFrame.from_records(load_jsonl(results_path))
+        else:
+            df = pd.DataFrame(scan_runs(grid_dir))
+            if df.empty or 'severity' not in df:
+                continue
+        if df.empty:
+            continue
+        frames.append(results_to_long(df, grid=grid_dir.name))
+    if not frames:
+        return pd.DataFrame(columns=LONG_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def severity_summary(long_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Per-severity aggregates of one grid in the ``stability_summary.json`` layout.
+
+    Returns:
+        One dict per severity (ascending) with 'severity', 'n_seeds' and
+        '<metric>_mean' / '<metric>_std' for every metric in long_df
+    """
+    rows = []
+    for severity, points in severity_curves(long_df).groupby('severity', sort=True):
+        row = {'severity': float(severity), 'n_seeds': int(points['n_seeds'].max())}
+        for metric, mean, std in zip(points['metric'], points['mean'], points['std']):
+            row[f'{metric}_mean'] = float(mean)
+            row[f'{metric}_std'] = float(std)
+        rows.append(row)
+    return rows
+
+
+def load_grid_summary(grid_dir: Path) -> List[Dict[str, Any]]:
+    """Per-severity aggregates (see ``severity_summary``) of one severity grid directory."""
+    return severity_summary(load_grid_long([grid_dir]))
+
+
+def compound_surface(df: pd.DataFrame, axes: Sequence[str], metric: str) -> pd.DataFrame:
+    """
+    Mean and std across seeds of a metric over a compound severity grid.
+
+    Args:
+        df: One row per run with one column per severity axis and the metric
+        axes: Severity axis columns, e.g. ['additive_noise_severity', 'missingness_severity']
+        metric: Metric column, e.g. 'test_accuracy'
+
+    Returns:
+        Long table with the axis columns, '<metric>_mean', '<metric>_std', 'n_seeds'
+    """
+    grouped = df.groupby(list(axes), sort=True)[metric]
+    return pd.DataFrame({
+        f'{metric}_mean': grouped.mean(),
+        f'{metric}_std': grouped.std(ddof=0),
+        'n_seeds': grouped.count(),
+    }).reset_index()
+
+
+def surface_matrix(surface: pd.DataFrame, axes: Sequence[str], metric: str) -> pd.DataFrame:
+    """Pivot a two-axis surface into a matrix (rows: first axis, columns: second axis)."""
+    if len(axes) != 2:
+        raise ValueError(f"surface_matrix needs exactly two axes, got {list(axes)}")
+    return surface.pivot(index=axes[0], columns=axes[1], values=f'{metric}_mean')
@@ -0,0 +1,129 @@
+"""Persistent index of run directories for fast result summaries.
+
+Each run directory holds a ``config.json`` and a ``final_metrics.json``.
+Re-parsing thousands of them on every summary is wasteful, so we keep a
+small JSON index inside the runs directory that maps each run name to the
+file signatures (mtime + size) it was built from and the parsed row. On the
+next scan only new or modified run directories are read again.
+"""
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .io import load_json
+
+INDEX_FILENAME = '.run_index.json'
+INDEX_VERSION = 2
+
+# Files that make up a run record; a run is only indexed once both exist.
+RUN_FILES = ('config.json', 'final_metrics.json')
+
+
+def build_run_row(run_dir: Path) -> Dict[str, Any]:
+    """Parse a run directory into a flat summary row."""
+    metrics = load_json(run_dir / 'final_metrics.json')
+    config = load_json(run_dir / 'config.json')
+    corruption = config.get('corruption') or {}
+    return {
+        'run_name': run_dir.name,
+        'dataset': config.get('dataset'),
+        'model': config.get('model'),
+        'corruption': corruption.get('type', 'none'),
+        'severity': corruption.get('severity'),
+        'seed': config.get('seed'),
+        **metrics
+    }
+
+
+def _run_signature(run_dir: Path) -> Optional[List[int]]:
+    """Return (mtime_ns, size) for each run file, or None if one is missing."""
+    signature = []
+    for name in RUN_FILES:
+        try:
+            st = os.stat(run_dir / name)
+        except OSError:
+            return None
+        signature.extend([st.st_mtime_ns, st.st_size])
+    return signature
+
+
+def load_run_index(index_path: Path) -> Dict[str, Any]:
+    """Load a run index, returning an empty one if missing or stale."""
+    try:
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if index.get('version') != INDEX_VERSION:
+        return {}
+    return index.get('runs', {})
+
+
+def save_run_index(runs: Dict[str, Any], index_path: Path):
+    """Atomically write the run index next to the run directories."""
+    tmp_path = index_path.with_name(index_path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump({'version': INDEX_VERSION, 'runs': runs}, f)
+    os.replace(tmp_path, index_path)
+
+
+def scan_runs(
+    runs_dir: Path,
+    use_index: bool = True,
+    index_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    row_builder: Callable[[Path], Dict[str, Any]] = build_run_row,
+) -> List[Dict[str, Any]]:
+    """
+    Collect one summary row per completed run under ``runs_dir``.
+
+    Args:
+        runs_dir: Directory containing one sub-directory per run
+        use_index: Reuse and update the persistent index (default: True)
+        index_path: Index location (default: ``runs_dir / .run_index.json``)
+        max_workers: Thread pool size for stat/parse (default: executor default)
+        row_builder: Function turning a run directory into a row
+
+    Returns:
+        List of rows sorted by run name
+    """
+    runs_dir = Path(runs_dir)
+    if index_path is None:
+        index_path = runs_dir / INDEX_FILENAME
+    cached = load_run_index(index_path) if use_index else {}
+
+    with os.scandir(runs_dir) as it:
+        run_names = sorted(e.name for e in it if e.is_dir())
+
+    def refresh(name):
+        run_dir = runs_dir / name
+        signature = _run_signature(run_dir)
+        if signature is None:
+            return name, None, False
+        entry = cached.get(name)
+        if entry is not None and entry.get('signature') == signature:
+            return name, entry, False
+        try:
+            row = row_builder(run_dir)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not parse run {run_dir}: {e}")
+            return name, None, False
+        return name, {'signature': signature, 'row': row}, True
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        refreshed = list(pool.map(refresh, run_names))
+
+    runs = {}
+    n_parsed = 0
+    for name, entry, parsed in refreshed:
+        if entry is None:
+            continue
+        runs[name] = entry
+        n_parsed += int(parsed)
+
+    if use_index and (n_parsed > 0 or set(runs) != set(cached)):
+        save_run_index(runs, index_path)
+
+    return [runs[name]['row'] for name in sorted(runs)]
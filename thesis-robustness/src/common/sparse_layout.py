@@ -0,0 +1,88 @@
+"""Canonical sparse layout for the text pipeline.
+
+TF-IDF features travel through splitting, corruption and model fitting as
+one layout: CSR with sorted, duplicate-free int32 indices and float data of
+the configured dtype. Estimators that accept this layout use the arrays as
+they are; ``find_sparse_conversions`` reports the ones that still copy or
+convert their input internally.
+"""
+from typing import Callable, List
+
+import numpy as np
+from scipy import sparse
+
+INDEX_DTYPE = np.int32
+
+# Methods through which sklearn/scipy copy or convert a sparse matrix
+_CONVERTING_METHODS = ('asformat', 'astype', 'copy', 'tocsr', 'tocsc', 'tocoo', 'toarray', 'todense')
+
+
+def is_canonical_csr(X, dtype=None) -> bool:
+    """True if X is CSR with sorted, duplicate-free int32 indices (and data of dtype)."""
+    if not sparse.isspmatrix_csr(X):
+        return False
+    if X.indices.dtype != INDEX_DTYPE or X.indptr.dtype != INDEX_DTYPE:
+        return False
+    if dtype is not None and X.dtype != np.dtype(dtype):
+        return False
+    return bool(X.has_canonical_format)
+
+
+def canonical_csr(X, dtype=None):
+    """
+    Return X in the canonical layout, converting only what differs.
+
+    Args:
+        X: Sparse matrix (any format)
+        dtype: Data dtype (default: keep X's float dtype)
+
+    Returns:
+        X itself when already canonical, otherwise a canonical CSR copy
+        (X is never modified; it may be a shared, cached split)
+    """
+    if not sparse.issparse(X):
+        raise ValueError("canonical_csr expects a sparse matrix")
+    if is_canonical_csr(X, dtype):
+        return X
+    X = X.tocsr(copy=True)
+    if dtype is not None and X.dtype != np.dtype(dtype):
+        X = X.astype(dtype, copy=False)
+    X.sum_duplicates()  # also sorts indices
+    if X.indices.dtype != INDEX_DTYPE or X.indptr.dtype != INDEX_DTYPE:
+        if X.nnz > np.iinfo(INDEX_DTYPE).max:
+            raise ValueError(f"Matrix with {X.nnz} stored entries does not fit int32 indices")
+        X.indices = X.indices.astype(INDEX_DTYPE)
+        X.indptr = X.indptr.astype(INDEX_DTYPE)
+    return X
+
+
+def _recording_csr(X, conversions: List[str]):
+    """View of a CSR matrix that records conversions made through its methods."""
+
+    def wrap(name):
+        method = getattr(sparse.csr_matrix, name)
+
+        def recorded(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            if result is not self:
+                conversions.append(name)
+            return result
+        return recorded
+
+    cls = type('RecordingCSR', (sparse.csr_matrix,), {name: wrap(name) for name in _CONVERTING_METHODS})
+    return cls((X.data, X.indices, X.indptr), shape=X.shape, copy=False)
+
+
+def find_sparse_conversions(func: Callable, X, *args, **kwargs) -> List[str]:
+    """
+    Call ``func(X, *args, **kwargs)`` and list the copies/conversions it made of X.
+
+    Example:
+        find_sparse_conversions(model.fit, X_train, y_train) == []
+
+    Returns:
+        Names of the converting methods that returned a new object
+    """
+    conversions: List[str] = []
+    func(_recording_csr(canonical_csr(X), conversions), *args, **kwargs)
+    return conversions
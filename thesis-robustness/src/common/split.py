@@ -1,22 +1,133 @@
 """Data splitting utilities."""
+import hashlib
+import json
+from collections import OrderedDict
 from sklearn.model_selection import train_test_split
 import numpy as np
 
 
-def train_val_test_split(X, y, test_size=0.2, val_size=0.1, random_state=42):
-    """Split data into train, validation, and test sets."""
+# Split indices depend only on (y, sizes, seed), so they are computed once per
+# process and shared by every model and corruption run at that seed.
+_INDEX_CACHE = OrderedDict()
+_INDEX_CACHE_SIZE = 32
+_MAX_STRATIFY_CLASSES = 20
+
+
+def _stratify(y, n_classes=None):
+    """Stratify on y only for classification-like targets (< 20 classes)."""
+    if n_classes is None:
+        n_classes = len(np.unique(y))
+    return y if n_classes < _MAX_STRATIFY_CLASSES else None
+
+
+def _compute_indices(y, test_size, val_size, random_state):
+    indices = np.arange(len(y))
+    n_classes = len(np.unique(y))
+    
     # First split: separate test set
-    X_train_val, X_test, y_train_val, y_test = train_test_split(
-        X, y, test_size=test_size, random_state=random_state, 
-        stratify=y if len(np.unique(y)) < 20 else None
+    idx_train_val, idx_test = train_test_split(
+        indices, test_size=test_size, random_state=random_state,
+        stratify=_stratify(y, n_classes)
     )
     
-    # Second split: separate validation from train
+    # Second split: separate validation from train. A subset never has more
+    # classes than y, so its class count is only needed when y has >= 20.
     val_size_adjusted = val_size / (1 - test_size)
-    X_train, X_val, y_train, y_val = train_test_split(
-        X_train_val, y_train_val, test_size=val_size_adjusted, 
-        random_state=random_state, 
-        stratify=y_train_val if len(np.unique(y_train_val)) < 20 else None
+    y_train_val = y[idx_train_val]
+    idx_train, idx_val = train_test_split(
+        idx_train_val, test_size=val_size_adjusted,
+        random_state=random_state,
+        stratify=_stratify(y_train_val, n_classes if n_classes < _MAX_STRATIFY_CLASSES else None)
     )
+    return idx_train, idx_val, idx_test
+
+
+def train_val_test_indices(y, test_size=0.2, val_size=0.1, random_state=42):
+    """
+    Split row indices into train, validation, and test sets.
+    
+    Produces exactly the same partition as train_val_test_split on the
+    same y/random_state, but without copying X. Results are cached per
+    (y, sizes, seed) and returned read-only, since they are shared.
+    """
+    y = np.asarray(y)
+    key = split_fingerprint(y, test_size, val_size, random_state)
+    if key in _INDEX_CACHE:
+        _INDEX_CACHE.move_to_end(key)
+        return _INDEX_CACHE[key]
+    
+    splits = _compute_indices(y, test_size, val_size, random_state)
+    for idx in splits:
+        idx.setflags(write=False)
+    _INDEX_CACHE[key] = splits
+    if len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+        _INDEX_CACHE.popitem(last=False)
+    return splits
+
+
+def clear_split_cache():
+    """Drop all cached split indices."""
+    _INDEX_CACHE.clear()
+
+
+class SplitView:
+    """
+    Lazy train/val/test view of (X, y) backed by row indices.
     
-    return X_train, X_val, X_test, y_train, y_val, y_test
+    Nothing is copied until a split is requested; ``X_split`` then gathers
+    just that split's rows (contiguous, as the downstream stages need).
+    """
+    
+    SPLITS = ('train', 'val', 'test')
+    
+    def __init__(self, X, y, idx_train, idx_val, idx_test):
+        self.X = X
+        self.y = np.asarray(y)
+        self.indices = {'train': idx_train, 'val': idx_val, 'test': idx_test}
+    
+    def __len__(self):
+        return len(self.y)
+    
+    def sizes(self):
+        """Number of rows per split."""
+        return {name: len(idx) for name, idx in self.indices.items()}
+    
+    def X_split(self, name):
+        """Rows of X in the named split (a new array)."""
+        return self.X[self.indices[name]]
+    
+    def y_split(self, name):
+        """Targets of the named split."""
+        return self.y[self.indices[name]]
+    
+    def materialize(self):
+        """(X_train, X_val, X_test, y_train, y_val, y_test), copied split by split."""
+        return (tuple(self.X_split(name) for name in self.SPLITS)
+                + tuple(self.y_split(name) for name in self.SPLITS))
+
+
+def split_view(X, y, test_size=0.2, val_size=0.1, random_state=42):
+    """Cached stratified split of (X, y) as a lazy ``SplitView``."""
+    return SplitView(X, y, *train_val_test_indices(
+        y, test_size=test_size, val_size=val_size, random_state=random_state
+    ))
+
+
+def train_val_test_split(X, y, test_size=0.2, val_size=0.1, random_state=42):
+    """Split data into train, validation, and test sets."""
+    return split_view(
+        X, y, test_size=test_size, val_size=val_size, random_state=random_state
+    ).materialize()
+
+
+def split_fingerprint(y, test_size, val_size, random_state, **extra) -> str:
+    """Stable short hash identifying a split of a given dataset."""
+    y = np.asarray(y)
+    h = hashlib.sha1()
+    h.update(y.tobytes() if y.dtype != object else repr(y.tolist()).encode())
+    h.update(json.dumps(
+        {'n': len(y), 'test_size': test_size, 'val_size': val_size,
+         'random_state': random_state, **extra},
+        sort_keys=True, default=str
+    ).encode())
+    return h.hexdigest()[:16]
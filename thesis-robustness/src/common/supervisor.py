@@ -0,0 +1,169 @@
+"""Run a function in an isolated child process with time and memory limits.
+
+A stuck fit (e.g. an SVC that never converges) or a memory blow-up should
+only cost its own grid cell. ``run_supervised`` executes the call in a
+child process, kills it when it exceeds the wall-clock timeout or the memory
+ceiling, and always reports the resources the child used.
+
+The memory ceiling applies to resident memory (RSS), which the parent polls.
+It is not an address-space rlimit: BLAS/OpenMP thread arenas and memory maps
+reserve far more virtual memory than a fit touches, so capping virtual
+memory would kill fits that are well within the ceiling.
+"""
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+STATUS_TIMEOUT = 'timeout'
+STATUS_MEMORY = 'memory'
+STATUS_CRASHED = 'crashed'
+
+_CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+
+def _maxrss_mb(ru_maxrss: float) -> float:
+    """Convert ru_maxrss to MB (KB on Linux, bytes on macOS)."""
+    return ru_maxrss / (1024 ** 2) if sys.platform == 'darwin' else ru_maxrss / 1024
+
+
+def _sample_process(pid: int) -> Optional[Dict[str, float]]:
+    """Read current RSS, peak RSS and CPU time of a child from /proc (Linux only)."""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            status = f.read()
+        with open(f'/proc/{pid}/stat') as f:
+            stat = f.read().rsplit(')', 1)[1].split()
+    except (OSError, IndexError):
+        return None
+    sample = {}
+    for line in status.splitlines():
+        if line.startswith('VmRSS:'):
+            sample['rss_mb'] = int(line.split()[1]) / 1024
+        elif line.startswith('VmHWM:'):
+            sample['max_rss_mb'] = int(line.split()[1]) / 1024
+    # utime and stime are fields 14 and 15 of /proc/<pid>/stat
+    sample['cpu_time'] = (int(stat[11]) + int(stat[12])) / _CLOCK_TICKS
+    return sample
+
+
+def _child_main(conn, func, args, kwargs):
+    """Entry point of the supervised child process."""
+    try:
+        result = func(*args, **kwargs)
+        status, payload = STATUS_OK, result
+    except MemoryError:
+        status, payload = STATUS_MEMORY, traceback.format_exc()
+    except BaseException:
+        status, payload = STATUS_ERROR, traceback.format_exc()
+    usage = {}
+    if resource is not None:
+        ru = resource.getrusage(resource.RUSAGE_SELF)
+        usage = {'max_rss_mb': _maxrss_mb(ru.ru_maxrss), 'cpu_time': ru.ru_utime + ru.ru_stime}
+    try:
+        conn.send((status, payload, usage))
+    except Exception:
+        conn.send((STATUS_ERROR, traceback.format_exc(), usage))
+    conn.close()
+
+
+def run_supervised(
+    func: Callable,
+    args: tuple = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[float] = None,
+    start_method: str = 'spawn',
+    poll_interval: float = 0.2,
+) -> Dict[str, Any]:
+    """
+    Run ``func(*args, **kwargs)`` in a child process under resource limits.
+
+    Args:
+        func: Picklable (module-level) callable
+        args: Positional arguments
+        kwargs: Keyword arguments
+        timeout: Wall-clock limit in seconds (None = no limit)
+        memory_limit_mb: Resident-memory (RSS) ceiling in MB, checked by the
+            parent every poll_interval (Linux /proc; not enforced elsewhere)
+        start_method: multiprocessing start method ('spawn' avoids inheriting
+            OpenMP/BLAS thread state from the parent)
+        poll_interval: Seconds between resource checks
+
+    Returns:
+        Dict with keys: status ('ok', 'error', 'timeout', 'memory', 'crashed'),
+        result (return value when ok), error (message/traceback), wall_time,
+        cpu_time, max_rss_mb, exitcode
+    """
+    ctx = multiprocessing.get_context(start_method)
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(
+        target=_child_main,
+        args=(child_conn, func, args, kwargs or {}),
+    )
+    start = time.monotonic()
+    process.start()
+    child_conn.close()
+
+    outcome = {'status': None, 'result': None, 'error': None}
+    usage = {'max_rss_mb': None, 'cpu_time': None}
+    message = None
+    while True:
+        if parent_conn.poll(poll_interval):
+            try:
+                message = parent_conn.recv()
+            except EOFError:
+                message = None
+            break
+        sample = _sample_process(process.pid)
+        if sample:
+            usage['max_rss_mb'] = sample.get('max_rss_mb', usage['max_rss_mb'])
+            usage['cpu_time'] = sample['cpu_time']
+            if memory_limit_mb and sample.get('rss_mb', 0) > memory_limit_mb:
+                outcome['status'] = STATUS_MEMORY
+                outcome['error'] = f"Resident memory exceeded {memory_limit_mb} MB"
+                break
+        if timeout is not None and time.monotonic() - start > timeout:
+            outcome['status'] = STATUS_TIMEOUT
+            outcome['error'] = f"Exceeded timeout of {timeout} s"
+            break
+        if not process.is_alive() and not parent_conn.poll():
+            break
+
+    if message is not None:
+        status, payload, child_usage = message
+        outcome['status'] = status
+        if status == STATUS_OK:
+            outcome['result'] = payload
+        else:
+            outcome['error'] = payload
+        usage.update({k: v for k, v in child_usage.items() if v is not None})
+        process.join(timeout=5)
+
+    if process.is_alive():
+        process.terminate()
+        process.join(timeout=5)
+        if process.is_alive():
+            process.kill()
+            process.join()
+    else:
+        process.join()
+
+    if outcome['status'] is None:
+        outcome['status'] = STATUS_CRASHED
+        outcome['error'] = f"Child process exited with code {process.exitcode}"
+
+    parent_conn.close()
+    outcome.update(usage)
+    outcome['wall_time'] = time.monotonic() - start
+    outcome['exitcode'] = process.exitcode
+    return outcome
@@ -5,13 +5,32 @@ from scipy import sparse
 from .registry import register_corruption
 
 
+def _draw_noise(rng, noise_type: str, scale: np.ndarray, size, dtype=np.float64) -> np.ndarray:
+    """
+    Draw one block of zero-mean noise with per-column scale.
+    
+    The legacy RNG only samples float64, so the draws are the same for every
+    dtype; for float32 features the block is cast once and the addition runs
+    in float32.
+    """
+    if noise_type == 'gaussian':
+        noise = rng.normal(0, scale, size=size)
+    else:
+        noise = rng.uniform(-scale, scale, size=size)
+    if np.issubdtype(dtype, np.floating) and noise.dtype != dtype:
+        noise = noise.astype(dtype)
+    return noise
+
+
 @register_corruption('additive_noise')
 def add_noise(
     X: np.ndarray,
     severity: float,
     random_state: Optional[int] = None,
     noise_type: str = 'gaussian',
-    feature_mask: Optional[np.ndarray] = None
+    feature_mask: Optional[np.ndarray] = None,
+    inplace: bool = False,
+    block_rows: int = 4096
 ) -> np.ndarray:
     """
     Add zero-mean noise to numeric features.
@@ -25,26 +44,31 @@ def add_noise(
         noise_type: Type of noise ('gaussian' or 'uniform')
         feature_mask: Boolean mask indicating which features to corrupt.
                       If None, all numeric features are corrupted.
+        inplace: Modify a dense X directly instead of a copy (the caller
+                 must own X). Sparse input is always densified into a new array.
+        block_rows: Rows of noise drawn at a time (the noise stream is the
+                    same as one full draw, without a full-size noise matrix)
     
     Returns:
-        Corrupted feature matrix
+        Corrupted feature matrix (X itself when modified in place)
     """
     if random_state is not None:
         np.random.seed(random_state)
     
-    X_corrupted = X.copy()
-    
     # Handle sparse matrices
     is_sparse = sparse.issparse(X)
     if is_sparse:
-        X_corrupted = X_corrupted.toarray()
+        X_corrupted = X.toarray()
+    else:
+        X_corrupted = X if inplace else X.copy()
     
     # Determine which features to corrupt
     if feature_mask is None:
         feature_mask = np.ones(X_corrupted.shape[1], dtype=bool)
+    feature_mask = np.asarray(feature_mask, dtype=bool)
     
-    # Compute feature-wise statistics for scaling noise
-    feature_stds = np.std(X_corrupted[:, feature_mask], axis=0)
+    # Compute feature-wise statistics for scaling noise (plain np.std, so NaN entries propagate)
+    feature_stds = column_stds(X_corrupted, feature_mask)
     feature_stds = np.maximum(feature_stds, 1e-8)  # Avoid division by zero
     
     # Generate noise
@@ -54,16 +78,22 @@ def add_noise(
     if noise_type == 'gaussian':
         # Scale noise by feature standard deviation
         noise_scale = severity * feature_stds
-        noise = np.random.normal(0, noise_scale, size=(n_samples, n_corrupt_features))
     elif noise_type == 'uniform':
         # Uniform noise scaled by feature std
         noise_scale = severity * feature_stds * np.sqrt(3)  # Match variance to Gaussian
-        noise = np.random.uniform(-noise_scale, noise_scale, size=(n_samples, n_corrupt_features))
     else:
         raise ValueError(f"Unknown noise_type: {noise_type}. Use 'gaussian' or 'uniform'")
     
-    # Apply noise to selected features
-    X_corrupted[:, feature_mask] += noise
+    # Apply noise to selected features, one row block at a time
+    mask_cols = np.flatnonzero(feature_mask)
+    for start in range(0, n_samples, block_rows):
+        stop = min(start + block_rows, n_samples)
+        size = (stop - start, n_corrupt_features)
+        noise = _draw_noise(np.random, noise_type, noise_scale, size, X_corrupted.dtype)
+        if n_corrupt_features == n_features:
+            X_corrupted[start:stop] += noise
+        else:
+            X_corrupted[start:stop, mask_cols] += noise
     
     # Convert back to sparse if original was sparse
     if is_sparse:
@@ -72,13 +102,60 @@ def add_noise(
     return X_corrupted
 
 
+def column_stds(X: np.ndarray, feature_mask: np.ndarray, block_cols: int = 16) -> np.ndarray:
+    """
+    Std of the masked columns.
+    
+    Columns are reduced in small Fortran-ordered slabs, which gives the same
+    result as ``np.std(X[:, feature_mask], axis=0)`` (including NaN for
+    columns with missing values) without copying every masked column at once.
+    """
+    cols = np.flatnonzero(feature_mask)
+    stds = np.empty(len(cols))
+    for start in range(0, len(cols), block_cols):
+        slab = np.asfortranarray(X[:, cols[start:start + block_cols]])
+        stds[start:start + block_cols] = np.std(slab, axis=0)
+    return stds
+
+
+def sample_missing_indices(
+    shape: Tuple[int, int],
+    feature_mask: np.ndarray,
+    severity: float,
+    rng: Optional[np.random.RandomState] = None
+) -> np.ndarray:
+    """
+    Draw the entries masked by ``add_missingness`` as sorted flat (C-order) indices.
+    
+    Eligible entries are numbered row-major over the masked columns and a
+    fraction ``severity`` of them is drawn without replacement from ``rng``
+    (default: the global numpy RNG, which the caller seeds).
+    
+    Returns:
+        Sorted flat indices into an array of the given shape
+    """
+    n_samples, n_features = shape
+    eligible_cols = np.flatnonzero(np.asarray(feature_mask, dtype=bool))
+    n_eligible_entries = n_samples * len(eligible_cols)
+    if n_eligible_entries == 0:
+        return np.empty(0, dtype=np.intp)
+    n_to_corrupt = min(int(severity * n_eligible_entries), n_eligible_entries)
+    rng = np.random if rng is None else rng
+    corrupt_indices = np.sort(rng.choice(n_eligible_entries, size=n_to_corrupt, replace=False))
+    if len(eligible_cols) == n_features:
+        return corrupt_indices
+    rows, col_pos = np.divmod(corrupt_indices, len(eligible_cols))
+    return rows * n_features + eligible_cols[col_pos]
+
+
 @register_corruption('missingness')
 def add_missingness(
     X: np.ndarray,
     severity: float,
     random_state: Optional[int] = None,
     missing_value: float = np.nan,
-    feature_mask: Optional[np.ndarray] = None
+    feature_mask: Optional[np.ndarray] = None,
+    inplace: bool = False
 ) -> np.ndarray:
     """
     Randomly mask entries as missing according to severity.
@@ -90,48 +167,32 @@ def add_missingness(
         missing_value: Value to use for missing entries (default: np.nan)
         feature_mask: Boolean mask indicating which features can have missingness.
                       If None, all features can be corrupted.
+        inplace: Modify a dense X directly instead of a copy (the caller
+                 must own X). Sparse input is always densified into a new array.
     
     Returns:
         Feature matrix with missing entries set to missing_value
+        (X itself when modified in place)
     """
     if random_state is not None:
         np.random.seed(random_state)
     
-    X_corrupted = X.copy()
-    
     # Handle sparse matrices
     is_sparse = sparse.issparse(X)
     if is_sparse:
-        X_corrupted = X_corrupted.toarray()
+        X_corrupted = X.toarray()
+    else:
+        X_corrupted = X if inplace else X.copy()
     
     # Determine which features can be corrupted
     if feature_mask is None:
         feature_mask = np.ones(X_corrupted.shape[1], dtype=bool)
     
-    n_samples, n_features = X_corrupted.shape
-    
-    # Create mask for entries to corrupt
-    # Severity controls the fraction of entries across all eligible features
-    n_eligible_entries = n_samples * feature_mask.sum()
-    n_to_corrupt = int(severity * n_eligible_entries)
-    
-    # Sample random entries to corrupt
-    eligible_indices = []
-    for i in range(n_samples):
-        for j in range(n_features):
-            if feature_mask[j]:
-                eligible_indices.append((i, j))
-    
-    if len(eligible_indices) > 0:
-        corrupt_indices = np.random.choice(
-            len(eligible_indices),
-            size=min(n_to_corrupt, len(eligible_indices)),
-            replace=False
-        )
-        
-        for idx in corrupt_indices:
-            i, j = eligible_indices[idx]
-            X_corrupted[i, j] = missing_value
+    flat_indices = sample_missing_indices(X_corrupted.shape, feature_mask, severity)
+    if X_corrupted.flags['C_CONTIGUOUS']:
+        X_corrupted.reshape(-1)[flat_indices] = missing_value
+    else:
+        X_corrupted[np.unravel_index(flat_indices, X_corrupted.shape)] = missing_value
     
     # Convert back to sparse if original was sparse
     if is_sparse:
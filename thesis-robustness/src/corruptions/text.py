@@ -9,7 +9,8 @@ from .registry import register_corruption
 def token_dropout(
     X: sparse.spmatrix,
     severity: float,
-    random_state: Optional[int] = None
+    random_state: Optional[int] = None,
+    inplace: bool = False
 ) -> sparse.spmatrix:
     """
     Randomly drop tokens (set TF-IDF features to zero) according to severity.
@@ -21,9 +22,17 @@ def token_dropout(
         X: Sparse TF-IDF feature matrix (n_samples, n_features)
         severity: Fraction of non-zero entries to drop (in [0, 1])
         random_state: Random seed for reproducibility
+        inplace: For CSR input, store the compacted data/indices/indptr
+                 arrays on X itself instead of a new matrix (the caller must
+                 own X). Other formats always return a new matrix.
+    
+    CSR input is handled without leaving CSR: the kept entries of ``data`` and
+    ``indices`` are selected and ``indptr`` is rebuilt, so a canonical matrix
+    (see ``common.sparse_layout``) stays canonical, index dtypes included.
     
     Returns:
-        Corrupted sparse feature matrix with tokens dropped
+        Corrupted sparse feature matrix with tokens dropped (X itself when
+        modified in place)
     """
     if random_state is not None:
         np.random.seed(random_state)
@@ -31,16 +40,13 @@ def token_dropout(
     if not sparse.issparse(X):
         raise ValueError("token_dropout expects a sparse matrix (TF-IDF representation)")
     
-    # Convert to COO format for efficient manipulation
-    X_coo = X.tocoo()
-    
     # Calculate number of tokens to drop
-    n_tokens = X_coo.nnz  # Number of non-zero entries
+    n_tokens = X.nnz  # Number of stored (non-zero) entries
     n_to_drop = int(severity * n_tokens)
     n_to_drop = min(n_to_drop, n_tokens)  # Can't drop more than exist
     
     if n_to_drop == 0:
-        return X.copy()
+        return X if inplace else X.copy()
     
     # Randomly select tokens to drop
     token_indices = np.arange(n_tokens)
@@ -50,6 +56,25 @@ def token_dropout(
     keep_mask = np.ones(n_tokens, dtype=bool)
     keep_mask[drop_indices] = False
     
+    if sparse.isspmatrix_csr(X):
+        # Mask data/indices and compact indptr directly; entries are numbered
+        # in X.data order, which is also the COO order of a CSR matrix.
+        rows = np.repeat(np.arange(X.shape[0], dtype=X.indptr.dtype), np.diff(X.indptr))
+        row_counts = np.bincount(rows[keep_mask], minlength=X.shape[0])
+        indptr = np.zeros(X.shape[0] + 1, dtype=X.indptr.dtype)
+        np.cumsum(row_counts, out=indptr[1:])
+        data, indices = X.data[keep_mask], X.indices[keep_mask]
+        if inplace:
+            X.data, X.indices, X.indptr = data, indices, indptr
+            return X
+        X_corrupted = sparse.csr_matrix((data, indices, indptr), shape=X.shape, copy=False)
+        # Dropping entries keeps indices sorted and duplicate-free
+        X_corrupted.has_sorted_indices = X.has_sorted_indices
+        return X_corrupted
+    
+    # Other formats: convert to COO for efficient manipulation
+    X_coo = X.tocoo()
+    
     # Create new sparse matrix with dropped tokens
     new_row = X_coo.row[keep_mask]
     new_col = X_coo.col[keep_mask]
@@ -62,9 +87,7 @@ def token_dropout(
     )
     
     # Convert back to original format
-    if sparse.isspmatrix_csr(X):
-        X_corrupted = X_corrupted.tocsr()
-    elif sparse.isspmatrix_csc(X):
+    if sparse.isspmatrix_csc(X):
         X_corrupted = X_corrupted.tocsc()
     
     return X_corrupted
@@ -11,6 +11,7 @@ def load_adult(
     data_dir: Path = None,
     use_cache: bool = True,
     refresh_cache: bool = False,
+    dtype=np.float64,
     **kwargs
 ):
     """
@@ -18,18 +19,31 @@ def load_adult(
     
     Dataset source: https://archive.ics.uci.edu/dataset/2/adult
     
+    The cache is kept per feature dtype; a float32 cache is derived from the
+    float64 one without refetching.
+    
     Returns:
-        X: Feature matrix
+        X: Feature matrix (dtype as requested)
         y: Target labels
     """
     if data_dir is None:
         data_dir = Path('data')
-    cache_file = data_dir / 'cache' / 'adult_preprocessed.npz'
+    dtype = np.dtype(dtype)
+    base_cache_file = data_dir / 'cache' / 'adult_preprocessed.npz'
+    cache_file = base_cache_file
+    if dtype != np.float64:
+        cache_file = data_dir / 'cache' / f'adult_preprocessed_{dtype.name}.npz'
 
     if use_cache and not refresh_cache and cache_file.exists():
         print(f"Loading Adult dataset from local cache: {cache_file}")
         with np.load(cache_file) as cached:
             return cached['X'], cached['y']
+    if use_cache and not refresh_cache and base_cache_file.exists():
+        print(f"Converting Adult cache {base_cache_file} to {dtype.name}")
+        with np.load(base_cache_file) as cached:
+            X, y = cached['X'].astype(dtype), cached['y']
+        np.savez_compressed(cache_file, X=X, y=y)
+        return X, y
 
     try:
         from ucimlrepo import fetch_ucirepo
@@ -59,7 +73,7 @@ def load_adult(
         if use_cache and cache_file.exists():
             print(f"Fetch failed ({e}); falling back to local cache: {cache_file}")
             with np.load(cache_file) as cached:
-                return cached['X'], cached['y']
+                return cached['X'].astype(dtype, copy=False), cached['y']
         raise RuntimeError(f"Failed to fetch Adult dataset: {e}")
     
     # Handle missing values - replace '?' with NaN
@@ -77,7 +91,7 @@ def load_adult(
             X[col] = le.fit_transform(X[col].astype(str))
         
         # Convert to numpy
-        X = X.values.astype(float)
+        X = X.values.astype(dtype)
     
     # Ensure y is numpy array
     if not isinstance(y, np.ndarray):
@@ -7,10 +7,14 @@ from ..common.registry import register_dataset
 
 
 @register_dataset('airbnb')
-def load_airbnb(data_dir: Path = None, **kwargs):
+def load_airbnb(data_dir: Path = None, dtype=None, **kwargs):
     """
     Load and preprocess Airbnb Price Prediction dataset.
     
+    Args:
+        data_dir: Directory containing the Kaggle CSV
+        dtype: Optional feature dtype (e.g. float32)
+    
     Returns:
         X: Feature matrix
         y: Target prices (log-transformed)
@@ -86,6 +90,8 @@ def load_airbnb(data_dir: Path = None, **kwargs):
     
     # Convert to numpy (only numerical columns)
     X = X.select_dtypes(include=[np.number]).values
+    if dtype is not None:
+        X = X.astype(dtype, copy=False)
     
     # Log-transform target for regression (handles skewed distributions)
     y = np.log1p(y)  # log(1 + y) to handle zeros
@@ -13,6 +13,7 @@ def load_amazon(
     max_features=5000, 
     ngram_range=(1, 2),
     vectorize=True,
+    dtype=np.float64,
     **kwargs
 ):
     """
@@ -43,6 +44,7 @@ def load_amazon(
         max_features: Maximum number of TF-IDF features
         ngram_range: N-gram range for TF-IDF (will be converted to tuple if list)
         vectorize: If True, return TF-IDF features. If False, return raw text.
+        dtype: TF-IDF value dtype (float64 or float32)
     
     Returns:
         X: TF-IDF feature matrix
@@ -174,6 +176,7 @@ def load_amazon(
         lowercase=True,
         min_df=2,
         max_df=0.95,
+        dtype=np.dtype(dtype),
     )
     X = vectorizer.fit_transform(texts)  # Keep sparse for efficiency
 
@@ -13,6 +13,7 @@ def load_imdb(
     ngram_range=(1, 2),
     use_train=True,
     vectorize=True,
+    dtype=np.float64,
     **kwargs
 ):
     """
@@ -33,6 +34,7 @@ def load_imdb(
         ngram_range: N-gram range for TF-IDF (will be converted to tuple if list)
         use_train: If True, use train set; if False, use test set
         vectorize: If True, return TF-IDF features. If False, return raw text.
+        dtype: TF-IDF value dtype (float64 or float32)
     
     Returns:
         X: TF-IDF feature matrix
@@ -126,6 +128,7 @@ def load_imdb(
         lowercase=True,
         min_df=2,  # Ignore terms that appear in fewer than 2 documents
         max_df=0.95,  # Ignore terms that appear in more than 95% of documents
+        dtype=np.dtype(dtype),
     )
     X = vectorizer.fit_transform(texts)  # Keep sparse for efficiency
 
@@ -0,0 +1,116 @@
+"""Chunked prediction with bounded memory.
+
+``predict`` / ``predict_proba`` on a whole test split allocate their
+intermediate arrays (per-tree probabilities, kernel rows, densified sparse
+input) for every row at once. ``predict_with_scores`` instead walks the rows
+in fixed-size chunks, optionally in threads, and writes labels and scores
+into buffers allocated once (scores as float32), so peak inference memory
+depends on the chunk size, not on the size of the split.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from sklearn.ensemble._forest import ForestClassifier
+
+from .flat_forest import FlatForest
+
+DEFAULT_CHUNK_ROWS = 8192
+SCORE_DTYPE = np.float32
+
+
+def _chunk_scores(scorer, model, X_chunk):
+    """Positive-class probability (or all classes), else decision scores, else None."""
+    if hasattr(scorer, 'predict_proba'):
+        try:
+            proba = scorer.predict_proba(X_chunk)
+            return proba[:, 1] if proba.shape[1] == 2 else proba
+        except Exception:
+            pass
+    if hasattr(model, 'decision_function'):
+        try:
+            return model.decision_function(X_chunk)
+        except Exception:
+            pass
+    return None
+
+
+def _labels_from_proba(model, scorer) -> bool:
+    """True if predict() is argmax(predict_proba()), so one forest pass gives both."""
+    if scorer is not model:
+        return False
+    if isinstance(model, ForestClassifier):
+        return model.n_outputs_ == 1
+    return isinstance(model, FlatForest) and model.classes_ is not None
+
+
+def predict_with_scores(
+    model: Any,
+    X,
+    scorer: Any = None,
+    scores: bool = True,
+    chunk_rows: Optional[int] = DEFAULT_CHUNK_ROWS,
+    n_jobs: int = 1,
+    transform: Optional[Callable] = None
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Predict labels and scores for X chunk by chunk.
+
+    Args:
+        model: Fitted estimator (labels, and decision scores as fallback)
+        X: Dense or sparse feature matrix
+        scorer: Estimator providing predict_proba (default: model), e.g. a
+                validation-calibrated wrapper
+        scores: Also compute scores (False for regression)
+        chunk_rows: Rows per chunk (None predicts X in one call)
+        n_jobs: Chunks predicted concurrently in threads
+        transform: Optional per-chunk transform applied before predicting
+                   (e.g. densify + impute), so it never runs on all of X
+
+    Returns:
+        (y_pred, y_score): labels, and float32 scores or None when the
+        model provides neither probabilities nor decision scores
+    """
+    scorer = model if scorer is None else scorer
+    one_pass = scores and _labels_from_proba(model, scorer)
+    n_samples = X.shape[0]
+    chunk_rows = n_samples if not chunk_rows else max(1, int(chunk_rows))
+    bounds = [(start, min(start + chunk_rows, n_samples)) for start in range(0, max(n_samples, 1), chunk_rows)]
+    buffers: Dict[str, Optional[np.ndarray]] = {}
+
+    def run(bound):
+        start, stop = bound
+        X_chunk = X[start:stop]
+        if transform is not None:
+            X_chunk = transform(X_chunk)
+        if one_pass:
+            # Same labels as the forest's predict(), without walking the trees twice
+            proba = model.predict_proba(X_chunk)
+            y_pred = model.classes_.take(np.argmax(proba, axis=1), axis=0)
+            return y_pred, (proba[:, 1] if proba.shape[1] == 2 else proba)
+        return model.predict(X_chunk), (_chunk_scores(scorer, model, X_chunk) if scores else None)
+
+    def fill(bound):
+        # Chunks own disjoint slices of the buffers, so threads write directly
+        start, stop = bound
+        y_pred, y_score = run(bound)
+        buffers['pred'][start:stop] = y_pred
+        if buffers['score'] is not None:
+            buffers['score'][start:stop] = y_score
+
+    # The first chunk fixes the label dtype and the score shape
+    y_pred, y_score = run(bounds[0])
+    buffers['pred'] = np.empty((n_samples,) + y_pred.shape[1:], dtype=y_pred.dtype)
+    buffers['score'] = None if y_score is None else np.empty((n_samples,) + y_score.shape[1:], dtype=SCORE_DTYPE)
+    buffers['pred'][:bounds[0][1]] = y_pred
+    if y_score is not None:
+        buffers['score'][:bounds[0][1]] = y_score
+    del y_pred, y_score
+    rest = bounds[1:]
+    if n_jobs is not None and n_jobs > 1 and len(rest) > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            list(pool.map(fill, rest))
+    else:
+        for bound in rest:
+            fill(bound)
+    return buffers['pred'], buffers['score']
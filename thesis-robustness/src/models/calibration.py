@@ -0,0 +1,33 @@
+"""Post-hoc probability calibration of trained classifiers."""
+from sklearn.calibration import CalibratedClassifierCV
+
+CALIBRATION_METHODS = ('sigmoid', 'isotonic')
+
+
+def calibrate_on_validation(model, X_val, y_val, method: str = 'sigmoid'):
+    """
+    Fit a probability calibrator for an already trained classifier.
+    
+    The model is not refit: only the calibration map (Platt scaling for
+    'sigmoid') is learned from its scores on the validation split. This
+    replaces e.g. ``SVC(probability=True)``, which refits the SVM on five
+    internal folds just to calibrate.
+    
+    Args:
+        model: Fitted classifier with decision_function or predict_proba
+        X_val: Validation features
+        y_val: Validation labels
+        method: 'sigmoid' or 'isotonic'
+    
+    Returns:
+        Fitted calibrated classifier (use its predict_proba)
+    """
+    if method not in CALIBRATION_METHODS:
+        raise ValueError(f"Unknown calibration method: {method}. Use one of {CALIBRATION_METHODS}")
+    try:
+        from sklearn.frozen import FrozenEstimator
+    except ImportError:  # scikit-learn < 1.6
+        calibrated = CalibratedClassifierCV(model, method=method, cv='prefit')
+    else:
+        calibrated = CalibratedClassifierCV(FrozenEstimator(model), method=method)
+    return calibrated.fit(X_val, y_val)
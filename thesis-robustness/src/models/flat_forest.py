@@ -0,0 +1,103 @@
+"""Flat, memory-mappable form of fitted tree forests.
+
+Unpickling a scikit-learn tree copies its nodes into memory owned by the
+tree, so every process that loads a pickled random forest reads and copies
+all of it up front. ``FlatForest`` keeps the nodes of all trees in two
+contiguous numpy arrays next to a tree-less copy of the forest; saved with
+joblib they are memory-mapped on load, so loading (and inspecting) stored
+forests is cheap and processes share the on-disk nodes through the page
+cache. The first prediction rebuilds the scikit-learn forest from those
+arrays, so predictions run in the forest's own compiled code and match it
+on dense or sparse input.
+"""
+import copy
+
+import numpy as np
+from sklearn.utils.metaestimators import available_if
+
+FLATTENABLE = ('RandomForestClassifier', 'RandomForestRegressor',
+               'ExtraTreesClassifier', 'ExtraTreesRegressor')
+
+
+def is_flattenable(model) -> bool:
+    """True for fitted single-output sklearn forests."""
+    return (type(model).__name__ in FLATTENABLE and hasattr(model, 'estimators_')
+            and model.n_outputs_ == 1)
+
+
+class FlatForest:
+    """
+    Fitted forest stored as concatenated tree arrays plus a tree-less estimator.
+
+    ``nodes`` and ``values`` are the trees' own node records and node values
+    (the ``Tree`` pickle state) concatenated; tree ``i`` owns rows
+    ``offsets[i]:offsets[i + 1]`` and keeps its local child indices.
+    """
+
+    def __init__(self, skeleton, tree_init, max_depths, nodes, values, offsets):
+        self.skeleton = skeleton
+        self.tree_init = tree_init
+        self.max_depths = max_depths
+        self.nodes = nodes
+        self.values = values
+        self.offsets = offsets
+        self.classes_ = getattr(skeleton, 'classes_', None)
+        self.n_features_in_ = skeleton.n_features_in_
+        self._forest = None
+
+    def __getstate__(self):
+        # The rebuilt forest is a per-process copy; only the flat arrays are stored
+        return dict(self.__dict__, _forest=None)
+
+    @classmethod
+    def from_forest(cls, forest) -> 'FlatForest':
+        """Flatten a fitted forest (see ``is_flattenable``)."""
+        if not is_flattenable(forest):
+            raise ValueError(f"Cannot flatten {type(forest).__name__}")
+        skeleton = copy.copy(forest)
+        skeleton.estimators_ = []
+        max_depths, nodes, values = [], [], []
+        for estimator in forest.estimators_:
+            tree_type, tree_args, state = estimator.tree_.__reduce__()
+            shell = copy.copy(estimator)
+            del shell.tree_
+            skeleton.estimators_.append(shell)
+            max_depths.append(state['max_depth'])
+            nodes.append(state['nodes'])
+            values.append(state['values'])
+        return cls(
+            skeleton=skeleton,
+            tree_init=(tree_type, tree_args),
+            max_depths=np.asarray(max_depths, dtype=np.int64),
+            nodes=np.concatenate(nodes),
+            values=np.concatenate(values),
+            offsets=np.cumsum([0] + [len(n) for n in nodes]),
+        )
+
+    def _estimator(self):
+        """The sklearn forest rebuilt from the flat arrays (once per process)."""
+        if self._forest is None:
+            tree_type, tree_args = self.tree_init
+            forest = copy.copy(self.skeleton)
+            forest.estimators_ = []
+            for i, shell in enumerate(self.skeleton.estimators_):
+                start, stop = int(self.offsets[i]), int(self.offsets[i + 1])
+                tree = tree_type(*tree_args)
+                tree.__setstate__({
+                    'max_depth': int(self.max_depths[i]),
+                    'node_count': stop - start,
+                    'nodes': np.asarray(self.nodes[start:stop]),
+                    'values': np.asarray(self.values[start:stop]),
+                })
+                estimator = copy.copy(shell)
+                estimator.tree_ = tree
+                forest.estimators_.append(estimator)
+            self._forest = forest
+        return self._forest
+
+    def predict(self, X):
+        return self._estimator().predict(X)
+
+    @available_if(lambda self: self.classes_ is not None)
+    def predict_proba(self, X):
+        return self._estimator().predict_proba(X)
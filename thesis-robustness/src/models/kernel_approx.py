@@ -0,0 +1,86 @@
+"""Approximate RBF-kernel classifiers.
+
+Exact ``SVC`` scales quadratically (or worse) in the number of training rows.
+``ApproxKernelClassifier`` maps the inputs through a fixed number of
+Nyström components or random Fourier features and fits a linear head on
+top, so fit time grows linearly in the rows and ``n_components`` trades
+accuracy for speed.
+"""
+from scipy import sparse
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.kernel_approximation import Nystroem, RBFSampler
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.svm import LinearSVC
+from sklearn.utils.metaestimators import available_if
+
+METHODS = ('nystroem', 'rff')
+HEADS = ('linear_svm', 'logistic')
+
+
+def rbf_gamma_scale(X) -> float:
+    """SVC's gamma='scale': 1 / (n_features * Var(X)), for dense or sparse X."""
+    if sparse.issparse(X):
+        X_var = X.multiply(X).mean() - X.mean() ** 2
+    else:
+        X_var = X.var()
+    return 1.0 / (X.shape[1] * X_var) if X_var != 0 else 1.0
+
+
+class ApproxKernelClassifier(ClassifierMixin, BaseEstimator):
+    """
+    RBF feature map (Nyström or random Fourier features) plus a linear head.
+
+    Args:
+        method: 'nystroem' (data-dependent landmarks) or 'rff' (random
+                Fourier features)
+        n_components: Dimension of the feature map
+        gamma: RBF width, or 'scale' as in SVC
+        C: Inverse regularisation strength of the head
+        head: 'linear_svm' (decision_function only) or 'logistic' (also
+              predict_proba)
+        max_iter: Iteration limit of the head
+        random_state: Seed of the feature map and the head
+    """
+
+    def __init__(self, method='nystroem', n_components=500, gamma='scale', C=1.0,
+                 head='linear_svm', max_iter=5000, random_state=42):
+        self.method = method
+        self.n_components = n_components
+        self.gamma = gamma
+        self.C = C
+        self.head = head
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        if self.method not in METHODS:
+            raise ValueError(f"Unknown method: {self.method}. Use one of {METHODS}")
+        if self.head not in HEADS:
+            raise ValueError(f"Unknown head: {self.head}. Use one of {HEADS}")
+        self.gamma_ = rbf_gamma_scale(X) if self.gamma == 'scale' else float(self.gamma)
+        if self.method == 'nystroem':
+            # Nyström needs at most one landmark per training row
+            n_components = min(self.n_components, X.shape[0])
+            feature_map = Nystroem(kernel='rbf', gamma=self.gamma_, n_components=n_components,
+                                   random_state=self.random_state)
+        else:
+            feature_map = RBFSampler(gamma=self.gamma_, n_components=self.n_components,
+                                     random_state=self.random_state)
+        if self.head == 'linear_svm':
+            head = LinearSVC(C=self.C, max_iter=self.max_iter, random_state=self.random_state)
+        else:
+            head = LogisticRegression(C=self.C, max_iter=self.max_iter, random_state=self.random_state)
+        self.pipeline_ = make_pipeline(feature_map, head).fit(X, y)
+        self.classes_ = self.pipeline_.classes_
+        return self
+
+    def predict(self, X):
+        return self.pipeline_.predict(X)
+
+    def decision_function(self, X):
+        return self.pipeline_.decision_function(X)
+
+    @available_if(lambda self: self.head == 'logistic')
+    def predict_proba(self, X):
+        return self.pipeline_.predict_proba(X)
@@ -0,0 +1,70 @@
+"""Regularization paths for the linear models.
+
+A sweep over C (``logistic``, ``linear_svm``) or alpha (``linear_regression``)
+shares one prepared/corrupted dataset, and is walked from the strongest to
+the weakest regularization so each fit can start near its predecessor:
+
+- ``logistic`` warm-starts from the previous ``coef_`` (see
+  ``models.warm_start``).
+- ``linear_regression`` on dense data solves the whole alpha path from one
+  eigendecomposition of the centred Gram matrix (``fit_ridge_path``). Each
+  point is the exact ridge solution (what ``solver='cholesky'`` gives),
+  whereas a regular ``linear_regression`` run uses the iterative lsqr
+  solver, so a path point does not reproduce a regular run exactly.
+- ``linear_svm`` (liblinear) exposes no initial solution, so its points are
+  fit cold on the shared data.
+"""
+from typing import List, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from ..common.registry import get_model_traits
+
+
+def path_values(name: str, values: Sequence[float]) -> Tuple[str, List[float]]:
+    """
+    Regularized parameter of a model and its path values, strongest first.
+
+    Returns:
+        (param, values): 'C' values ascending or 'alpha' values descending
+    """
+    param = get_model_traits(name).get('reg_path')
+    if param is None:
+        raise ValueError(f"Model {name} has no regularization path (reg_path trait)")
+    values = sorted({float(v) for v in values}, reverse=(param == 'alpha'))
+    if not values:
+        raise ValueError("Regularization path needs at least one value")
+    return param, values
+
+
+def fit_ridge_path(models: Sequence, X, y) -> bool:
+    """
+    Fit Ridge models that differ only in alpha from one decomposition of X.
+
+    Sets ``coef_``, ``intercept_`` and ``n_features_in_`` on each model
+    (what ``Ridge(solver='cholesky')`` would fit). Sparse X is left to the
+    models' own solver.
+
+    Returns:
+        True if the models were fitted, False if X is sparse
+    """
+    if sparse.issparse(X):
+        return False
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    fit_intercept = models[0].fit_intercept if models else True
+    if fit_intercept:
+        X_offset, y_offset = X.mean(axis=0), y.mean()
+        X = X - X_offset
+        y = y - y_offset
+    else:
+        X_offset, y_offset = np.zeros(X.shape[1]), 0.0
+    eigvals, eigvecs = np.linalg.eigh(X.T @ X)
+    projected = eigvecs.T @ (X.T @ y)
+    for model in models:
+        coef = eigvecs @ (projected / (eigvals + model.alpha))
+        model.coef_ = coef
+        model.intercept_ = float(y_offset - X_offset @ coef) if fit_intercept else 0.0
+        model.n_features_in_ = X.shape[1]
+    return True
@@ -1,7 +1,8 @@
 """Regression models."""
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
 from sklearn.linear_model import Ridge
 from ..common.registry import register_model
+from .tabular import HGB_ACCEPTS_VAL_SPLIT
 
 
 @register_model('random_forest_reg')
@@ -16,7 +17,22 @@ def create_random_forest_reg(**kwargs):
     return RandomForestRegressor(**defaults)
 
 
-@register_model('linear_regression')
+@register_model('hist_gradient_boosting_reg', native_missing=True, val_split=HGB_ACCEPTS_VAL_SPLIT)
+def create_hist_gradient_boosting_reg(**kwargs):
+    """Create histogram gradient boosting regressor (see ``hist_gradient_boosting``)."""
+    defaults = {
+        'max_iter': 1000,
+        'learning_rate': 0.1,
+        'max_bins': 255,
+        'early_stopping': True,
+        'n_iter_no_change': 20,
+        'random_state': 42,
+    }
+    defaults.update(kwargs)
+    return HistGradientBoostingRegressor(**defaults)
+
+
+@register_model('linear_regression', reg_path='alpha')
 def create_linear_regression(**kwargs):
     """Create a stable linear-regression-style baseline.
 
@@ -36,9 +52,9 @@ def create_linear_regression(**kwargs):
     return Ridge(**defaults)
 
 
-@register_model('xgboost_reg')
+@register_model('xgboost_reg', native_missing=True, eval_set=True, early_stopping_rounds=20)
 def create_xgboost_reg(**kwargs):
-    """Create XGBoost regressor."""
+    """Create XGBoost regressor (same hist / early-stopping setup as ``xgboost``)."""
     try:
         from xgboost import XGBRegressor
     except (ImportError, OSError) as e:
@@ -49,10 +65,11 @@ def create_xgboost_reg(**kwargs):
             f"Original error: {e}"
         )
     defaults = {
-        'n_estimators': 100,
+        'n_estimators': 1000,
         'max_depth': 6,
+        'tree_method': 'hist',
+        'n_jobs': None,
         'random_state': 42,
-        
     }
     defaults.update(kwargs)
     return XGBRegressor(**defaults)
@@ -1,7 +1,12 @@
 """Tabular classification models."""
-from sklearn.ensemble import RandomForestClassifier
+from inspect import signature
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
 from sklearn.svm import SVC
 from ..common.registry import register_model
+from .kernel_approx import ApproxKernelClassifier
+
+# scikit-learn >= 1.7 can early-stop on a given validation split
+HGB_ACCEPTS_VAL_SPLIT = 'X_val' in signature(HistGradientBoostingClassifier.fit).parameters
 
 
 @register_model('random_forest')
@@ -16,9 +21,18 @@ def create_random_forest(**kwargs):
     return RandomForestClassifier(**defaults)
 
 
-@register_model('xgboost')
+@register_model('xgboost', native_missing=True, eval_set=True, early_stopping_rounds=20)
 def create_xgboost(**kwargs):
-    """Create XGBoost classifier."""
+    """
+    Create XGBoost classifier (hist trees, early stopping on the validation split).
+    
+    NaN and sparse input are handled natively, so the pipelines skip
+    imputation. ``n_estimators`` is only an upper bound: when the pipelines
+    pass the validation split (``get_fit_params``), fitting stops once the
+    validation loss has not improved for 20 rounds (``early_stopping_rounds``
+    trait); a plain ``fit(X, y)`` trains all rounds.
+    Set ``n_jobs`` in model_params to bound the thread count.
+    """
     try:
         from xgboost import XGBClassifier
     except (ImportError, OSError) as e:
@@ -29,21 +43,68 @@ def create_xgboost(**kwargs):
             f"Original error: {e}"
         )
     defaults = {
-        'n_estimators': 100,
+        'n_estimators': 1000,
         'max_depth': 6,
+        'tree_method': 'hist',
+        'n_jobs': None,
         'random_state': 42,
     }
     defaults.update(kwargs)
     return XGBClassifier(**defaults)
 
 
+@register_model('hist_gradient_boosting', native_missing=True, val_split=HGB_ACCEPTS_VAL_SPLIT)
+def create_hist_gradient_boosting(**kwargs):
+    """
+    Create histogram gradient boosting classifier.
+    
+    Features are binned into at most ``max_bins`` quantile bins once per fit,
+    so split finding scans bins instead of sorted values. NaN is routed
+    natively (the pipeline skips imputation), and boosting early-stops on
+    the validation split (an internal 10% hold-out on scikit-learn < 1.7).
+    """
+    defaults = {
+        'max_iter': 1000,
+        'learning_rate': 0.1,
+        'max_bins': 255,
+        'early_stopping': True,
+        'n_iter_no_change': 20,
+        'random_state': 42,
+    }
+    defaults.update(kwargs)
+    return HistGradientBoostingClassifier(**defaults)
+
+
 @register_model('svm_rbf')
 def create_svm_rbf(**kwargs):
-    """Create SVM with RBF kernel."""
+    """
+    Create SVM with RBF kernel.
+    
+    AUROC is computed from decision_function, which ranks samples the same
+    way as Platt-scaled probabilities, so the SVM is trained once instead of
+    refit on five internal folds. Set ``calibration: sigmoid`` in the config
+    to fit probabilities post hoc on the validation split.
+    """
     defaults = {
         'kernel': 'rbf',
         'C': 1.0,
         'random_state': 42,
     }
     defaults.update(kwargs)
-    return SVC(**defaults, probability=True)
+    return SVC(**defaults)
+
+
+@register_model('svm_rbf_approx')
+def create_svm_rbf_approx(**kwargs):
+    """Create approximate RBF SVM (Nyström features + logistic head)."""
+    defaults = {
+        'method': 'nystroem',
+        'n_components': 500,
+        'gamma': 'scale',
+        'C': 1.0,
+        # Logistic head keeps predict_proba, like svm_rbf's probability=True
+        'head': 'logistic',
+        'random_state': 42,
+    }
+    defaults.update(kwargs)
+    return ApproxKernelClassifier(**defaults)
@@ -2,9 +2,10 @@
 from sklearn.svm import LinearSVC, SVC
 from sklearn.linear_model import LogisticRegression
 from ..common.registry import register_model
+from .kernel_approx import ApproxKernelClassifier
 
 
-@register_model('linear_svm')
+@register_model('linear_svm', reg_path='C')
 def create_linear_svm(**kwargs):
     """Create linear SVM for text."""
     defaults = {
@@ -34,7 +35,7 @@ def create_svm_rbf_text(**kwargs):
     return SVC(**defaults)
 
 
-@register_model('logistic')
+@register_model('logistic', warm_start='coef', reg_path='C')
 def create_logistic(**kwargs):
     """Create logistic regression for text."""
     defaults = {
@@ -44,3 +45,18 @@ def create_logistic(**kwargs):
     }
     defaults.update(kwargs)
     return LogisticRegression(**defaults)
+
+
+@register_model('svm_rbf_text_approx')
+def create_svm_rbf_text_approx(**kwargs):
+    """Create approximate RBF SVM for text (Nyström features + linear SVM head)."""
+    defaults = {
+        'method': 'nystroem',
+        'n_components': 1000,
+        'gamma': 'scale',
+        'C': 1.0,
+        'head': 'linear_svm',
+        'random_state': 42,
+    }
+    defaults.update(kwargs)
+    return ApproxKernelClassifier(**defaults)
@@ -0,0 +1,48 @@
+"""Warm-starting a model from a fit on neighbouring data.
+
+Along a severity grid the optimum at severity s + 0.1 is close to the one at
+s, so a model can start from its predecessor instead of from scratch.
+
+Only convex models whose solver accepts an initial solution are
+warm-started (``warm_start='coef'`` trait: lbfgs logistic regression starts
+from the previous ``coef_`` / ``intercept_``); they converge to the same
+optimum, just in fewer iterations. liblinear (``linear_svm``) and the lsqr
+Ridge behind ``linear_regression`` expose no initial solution. Boosting is
+not warm-started: continuing from the previous booster keeps trees fit on
+less corrupted data and measurably inflates scores at higher severities.
+"""
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ..common.registry import get_model_traits
+
+
+def warm_start_params(name: str, model, previous) -> Optional[Dict[str, Any]]:
+    """
+    Prepare ``model`` to start from the fitted ``previous`` model.
+
+    Returns:
+        Extra fit() keyword arguments ({} when the model itself was
+        initialised), or None when this model cannot be warm-started
+    """
+    kind = get_model_traits(name).get('warm_start')
+    if kind == 'coef':
+        coef = getattr(previous, 'coef_', None)
+        if coef is None:
+            return None
+        model.set_params(warm_start=True)
+        model.coef_ = coef.copy()
+        model.intercept_ = np.array(previous.intercept_, copy=True)
+        return {}
+    return None
+
+
+def fit_iterations(model) -> Optional[int]:
+    """Solver iterations / boosting rounds spent by the last fit (None if unknown)."""
+    if hasattr(model, 'get_booster'):
+        return int(model.get_booster().num_boosted_rounds())
+    n_iter = getattr(model, 'n_iter_', None)
+    if n_iter is None:
+        return None
+    return int(np.max(n_iter))
@@ -1,5 +1,10 @@
 # Experiment pipelines
 from .baseline import run_baseline
-from .corruption import run_corruption_experiment, apply_corruption
+from .corruption import (
+    run_corruption_experiment, run_multi_model_experiment, run_regularization_path, apply_corruption
+)
 
-__all__ = ['run_baseline', 'run_corruption_experiment', 'apply_corruption']
+__all__ = [
+    'run_baseline', 'run_corruption_experiment', 'run_multi_model_experiment',
+    'run_regularization_path', 'apply_corruption'
+]
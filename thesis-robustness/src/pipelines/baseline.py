@@ -8,10 +8,14 @@ from scipy import sparse
 from .. import datasets, models
 
 from ..common.seed import set_seed
-from ..common.split import train_val_test_split
+from ..common.split import split_view, split_fingerprint
 from ..common.metrics import compute_classification_metrics, compute_regression_metrics
-from ..common.registry import get_dataset, get_model
-from ..common.logging import RunLogger
+from ..common.bootstrap import bootstrap_from_config
+from ..common.registry import get_dataset, get_model, get_fit_params
+from ..models.batch_predict import predict_with_scores
+from ..models.calibration import calibrate_on_validation
+from ..common.logging import RunLogger, save_split_reference
+from .corruption import _cast_features, _canonical_sparse_splits
 
 
 def _is_text_data(X) -> bool:
@@ -46,6 +50,7 @@ def _vectorize_text_splits(X_train, X_val, X_test, preprocessing_cfg):
         lowercase=True,
         min_df=2,
         max_df=0.95,
+        dtype=np.dtype(preprocessing_cfg.get('dtype', np.float64)),
     )
     X_train_vec = vectorizer.fit_transform(X_train)
     X_val_vec = vectorizer.transform(X_val)
@@ -53,14 +58,14 @@ def _vectorize_text_splits(X_train, X_val, X_test, preprocessing_cfg):
     return X_train_vec, X_val_vec, X_test_vec
 
 
-def _scale_dense_splits(X_train, X_val, X_test):
-    """Fit scaler on X_train only and transform val/test."""
+def _scale_dense_splits(X_train, X_val, X_test, copy=True):
+    """Fit scaler on X_train only and transform val/test (in place if copy=False)."""
     if sparse.issparse(X_train):
         return X_train, X_val, X_test
     if not np.issubdtype(np.asarray(X_train).dtype, np.number):
         return X_train, X_val, X_test
     from sklearn.preprocessing import StandardScaler
-    scaler = StandardScaler()
+    scaler = StandardScaler(copy=copy)
     X_train_scaled = scaler.fit_transform(X_train)
     X_val_scaled = scaler.transform(X_val)
     X_test_scaled = scaler.transform(X_test)
@@ -86,16 +91,21 @@ def run_baseline(config: Dict[str, Any], run_name: str = None):
     # Load raw text so TF-IDF can be fit on train split only.
     if dataset_name in ('imdb', 'amazon'):
         preprocessing_cfg.setdefault('vectorize', False)
+    # Numeric dtype of the features (e.g. float32), carried through loading,
+    # vectorizing, scaling and corruption.
+    if config.get('dtype') is not None:
+        preprocessing_cfg['dtype'] = config['dtype']
     X, y = get_dataset(dataset_name, **preprocessing_cfg)
+    X = _cast_features(X, preprocessing_cfg.get('dtype'))
     print(f"Dataset shape: {X.shape}, Target shape: {y.shape}")
     
-    # Split data
-    X_train, X_val, X_test, y_train, y_val, y_test = train_val_test_split(
-        X, y,
-        test_size=config.get('test_size', 0.2),
-        val_size=config.get('val_size', 0.1),
-        random_state=seed
-    )
+    # Split data (row indices are kept so prediction archives can reference them)
+    test_size = config.get('test_size', 0.2)
+    val_size = config.get('val_size', 0.1)
+    # (indices are cached per y/sizes/seed; each split is gathered once)
+    split = split_view(X, y, test_size=test_size, val_size=val_size, random_state=seed)
+    idx_train, idx_val, idx_test = (split.indices[name] for name in split.SPLITS)
+    X_train, X_val, X_test, y_train, y_val, y_test = split.materialize()
     
     print(f"Train: {X_train.shape[0]}, Val: {X_val.shape[0]}, Test: {X_test.shape[0]}")
 
@@ -105,8 +115,10 @@ def run_baseline(config: Dict[str, Any], run_name: str = None):
         X_train, X_val, X_test = _vectorize_text_splits(X_train, X_val, X_test, preprocessing_cfg)
         print(f"Vectorized shapes - Train: {X_train.shape}, Val: {X_val.shape}, Test: {X_test.shape}")
 
-    # Scale dense numeric features using train split only.
-    X_train, X_val, X_test = _scale_dense_splits(X_train, X_val, X_test)
+    # Scale dense numeric features using train split only (in place: the
+    # splits are fresh row selections of X).
+    X_train, X_val, X_test = _scale_dense_splits(X_train, X_val, X_test, copy=False)
+    X_train, X_val, X_test = _canonical_sparse_splits(X_train, X_val, X_test, preprocessing_cfg)
     
     # Get model
     model_name = config['model']
@@ -115,53 +127,29 @@ def run_baseline(config: Dict[str, Any], run_name: str = None):
     model = get_model(model_name, **model_params)
     
     print(f"Training model: {model_name}")
-    model.fit(X_train, y_train)
-    
-    # Evaluate on validation set
-    y_val_pred = model.predict(X_val)
-    y_val_proba = None
-    
-    # Try to get probability scores for AUROC
-    if hasattr(model, 'predict_proba'):
-        try:
-            y_val_proba = model.predict_proba(X_val)
-            if y_val_proba.shape[1] == 2:
-                y_val_proba = y_val_proba[:, 1]
-            else:
-                y_val_proba = None
-        except:
-            y_val_proba = None
-    elif hasattr(model, 'decision_function'):
-        # For LinearSVC and similar models without predict_proba
-        try:
-            y_val_proba = model.decision_function(X_val)
-        except:
-            y_val_proba = None
-    
-    # Evaluate on test set
-    y_test_pred = model.predict(X_test)
-    y_test_proba = None
-    
-    # Try to get probability scores for AUROC
-    if hasattr(model, 'predict_proba'):
-        try:
-            y_test_proba = model.predict_proba(X_test)
-            if y_test_proba.shape[1] == 2:
-                y_test_proba = y_test_proba[:, 1]
-            else:
-                y_test_proba = None
-        except:
-            y_test_proba = None
-    elif hasattr(model, 'decision_function'):
-        # For LinearSVC and similar models without predict_proba
-        try:
-            y_test_proba = model.decision_function(X_test)
-        except:
-            y_test_proba = None
-    
-    # Compute metrics
+    # Models with the eval_set / val_split trait early-stop on the validation split
+    model.fit(X_train, y_train, **get_fit_params(model_name, X_val, y_val, model=model))
+    
+    # Optional post-hoc calibration on the validation split (the model is not refit)
+    scorer = model
+    calibration = config.get('calibration')
+    if calibration:
+        print(f"Calibrating probabilities on validation split ({calibration})")
+        scorer = calibrate_on_validation(model, X_val, y_val, method=calibration)
+    
+    # Evaluate on validation and test sets: labels plus probabilities (or
+    # decision scores) for AUROC, predicted in row chunks into float32 buffers
     is_regression = dataset_name == 'airbnb' or 'reg' in model_name
+    prediction_cfg = config.get('prediction') or {}
+    y_val_pred, y_val_proba = predict_with_scores(model, X_val, scorer=scorer, scores=not is_regression,
+                                                  **prediction_cfg)
+    y_test_pred, y_test_proba = predict_with_scores(model, X_test, scorer=scorer, scores=not is_regression,
+                                                    **prediction_cfg)
+    if y_val_proba is not None and y_val_proba.ndim > 1:
+        # Multiclass probabilities: the baseline reports no AUROC for them
+        y_val_proba = y_test_proba = None
     
+    # Compute metrics
     if is_regression:
         val_metrics = compute_regression_metrics(y_val, y_val_pred)
         test_metrics = compute_regression_metrics(y_test, y_test_pred)
@@ -169,6 +157,13 @@ def run_baseline(config: Dict[str, Any], run_name: str = None):
         val_metrics = compute_classification_metrics(y_val, y_val_pred, y_val_proba)
         test_metrics = compute_classification_metrics(y_test, y_test_pred, y_test_proba)
     
+    # Optional bootstrap confidence intervals from the test predictions
+    test_ci = bootstrap_from_config(
+        config.get('bootstrap'), y_test, y_test_pred, y_test_proba,
+        task='regression' if is_regression else 'classification',
+        random_state=seed
+    )
+    
     # Log results
     output_dir = Path(config.get('output_dir', 'outputs/runs'))
     if run_name is None:
@@ -184,16 +179,34 @@ def run_baseline(config: Dict[str, Any], run_name: str = None):
         all_metrics[f'val_{k}'] = v
     for k, v in test_metrics.items():
         all_metrics[f'test_{k}'] = v
+    for k, v in test_ci.items():
+        all_metrics[f'test_{k}'] = v
     
     logger.log_final_metrics(all_metrics)
     
+    # Optional per-sample prediction archive (true labels live in a shared split file)
+    if config.get('save_predictions', False):
+        fingerprint = split_fingerprint(
+            y, test_size, val_size, seed, dataset=dataset_name, preprocessing=preprocessing_cfg
+        )
+        split_ref = output_dir / '_splits' / f'{dataset_name}_{fingerprint}.npz'
+        save_split_reference(split_ref, {'val': idx_val, 'test': idx_test}, y)
+        logger.log_predictions(
+            {'val': (y_val_pred, y_val_proba), 'test': (y_test_pred, y_test_proba)},
+            split_ref=split_ref,
+            is_regression=is_regression
+        )
+    
     print("\nResults:")
     print("Validation:", val_metrics)
     print("Test:", test_metrics)
+    if test_ci:
+        print("Test bootstrap CI:", test_ci)
     
     return {
         'val_metrics': val_metrics,
         'test_metrics': test_metrics,
+        'test_ci': test_ci,
         'model': model,
         'run_dir': logger.run_dir
     }
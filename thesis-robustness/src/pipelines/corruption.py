@@ -1,14 +1,29 @@
 """Corruption pipeline for robustness evaluation."""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 import numpy as np
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from scipy import sparse
 
 from ..common.seed import set_seed
-from ..common.split import train_val_test_split
+from ..common.split import split_view, split_fingerprint
+from ..common.sparse_layout import canonical_csr
 from ..common.metrics import compute_classification_metrics, compute_regression_metrics
-from ..common.registry import get_dataset, get_model
-from ..common.logging import RunLogger
+from ..common.bootstrap import bootstrap_from_config
+from ..common.registry import get_dataset, get_model, get_model_traits, get_fit_params
+from ..models.calibration import calibrate_on_validation
+from ..models.warm_start import warm_start_params, fit_iterations
+from ..models.reg_path import path_values, fit_ridge_path
+from ..models.flat_forest import FlatForest, is_flattenable
+from ..models.batch_predict import DEFAULT_CHUNK_ROWS, predict_with_scores
+from ..common.artifacts import ARTIFACTS_DIRNAME, ArtifactStore, run_hash
+from ..common.io import save_json
+from ..common.logging import RunLogger, save_split_reference
+from ..corruptions.fused import is_fusable, fused_tabular_corruption
 from ..corruptions import (
     add_noise,
     add_missingness,
@@ -36,6 +51,7 @@ def _vectorize_text_splits(X_train, X_val, X_test, preprocessing_cfg):
     """
     Fit TF-IDF on training text only, then transform val/test.
     This prevents vocabulary/IDF leakage from val/test.
+    Returns the vectorized splits and the fitted vectorizer.
     """
     from sklearn.feature_extraction.text import TfidfVectorizer
 
@@ -50,32 +66,127 @@ def _vectorize_text_splits(X_train, X_val, X_test, preprocessing_cfg):
         lowercase=True,
         min_df=2,
         max_df=0.95,
+        dtype=np.dtype(preprocessing_cfg.get('dtype', np.float64)),
     )
     X_train_vec = vectorizer.fit_transform(X_train)
+    # Pruned-term set is only kept for introspection and dominates the pickle
+    vectorizer.stop_words_ = None
     X_val_vec = vectorizer.transform(X_val)
     X_test_vec = vectorizer.transform(X_test)
-    return X_train_vec, X_val_vec, X_test_vec
+    return X_train_vec, X_val_vec, X_test_vec, vectorizer
 
 
-def _scale_dense_splits(X_train, X_val, X_test):
-    """Fit StandardScaler on train split only; transform val/test."""
-    if sparse.issparse(X_train):
+def _cast_features(X, dtype):
+    """Cast numeric features (dense or sparse) to dtype; text and None pass through."""
+    if dtype is None:
+        return X
+    if sparse.issparse(X) or np.issubdtype(np.asarray(X).dtype, np.number):
+        return X.astype(dtype, copy=False)
+    return X
+
+
+def _canonical_sparse_splits(X_train, X_val, X_test, preprocessing_cfg):
+    """Put sparse splits in the canonical CSR layout models consume without copying."""
+    if not sparse.issparse(X_train):
         return X_train, X_val, X_test
+    dtype = preprocessing_cfg.get('dtype')
+    return tuple(canonical_csr(X_split, dtype) for X_split in (X_train, X_val, X_test))
+
+
+def _scale_dense_splits(X_train, X_val, X_test, copy=True):
+    """
+    Fit StandardScaler on train split only; transform val/test (in place if copy=False).
+    Returns the splits and the fitted scaler (None for sparse/non-numeric data).
+    """
+    if sparse.issparse(X_train):
+        return X_train, X_val, X_test, None
     if not np.issubdtype(np.asarray(X_train).dtype, np.number):
-        return X_train, X_val, X_test
+        return X_train, X_val, X_test, None
     from sklearn.preprocessing import StandardScaler
-    scaler = StandardScaler()
+    scaler = StandardScaler(copy=copy)
     X_train_scaled = scaler.fit_transform(X_train)
     X_val_scaled = scaler.transform(X_val)
     X_test_scaled = scaler.transform(X_test)
-    return X_train_scaled, X_val_scaled, X_test_scaled
+    return X_train_scaled, X_val_scaled, X_test_scaled, scaler
+
+
+def _steps_key(steps, random_state) -> str:
+    return json.dumps([random_state, steps], sort_keys=True, default=str)
+
+
+def apply_compound_corruption(
+    X: np.ndarray,
+    y: Optional[np.ndarray],
+    steps: List[Dict[str, Any]],
+    random_state: Optional[int] = None,
+    cache: Optional[Dict[int, Tuple]] = None,
+    fused: bool = True,
+    inplace: bool = False
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Apply an ordered list of corruptions (e.g. noise, then missingness).
+    
+    Step i is seeded with ``random_state + i``, so the output after the first
+    k steps does not depend on later steps and can be reused. With a
+    ``cache`` dict, the result of each proper prefix is kept (one entry per
+    prefix length) and the longest matching prefix is reused, e.g. the noisy
+    matrix at noise severity 0.3 is computed once for every missingness level
+    when cells are visited in lexicographic order. The cache must only be
+    shared between calls on the same X and y.
+    
+    Without a cache, a dense noise/missingness chain is run by the fused
+    single-pass kernel (same result, one copy; see ``corruptions.fused``).
+    
+    Args:
+        X: Feature matrix
+        y: Optional target labels
+        steps: Corruption configs (each with 'type' and 'severity')
+        random_state: Base random seed
+        cache: Optional prefix cache, owned by the caller
+        fused: Allow the fused kernel for fusable chains
+        inplace: The caller owns X and it may be overwritten. Intermediate
+                 results are always owned, so later steps run in place unless
+                 they are kept in the cache.
+    
+    Returns:
+        (X_corrupted, y_corrupted): Corrupted data
+    """
+    steps = [step for step in steps if step.get('type', 'none') != 'none']
+    X_cur, y_cur = X, y
+    start = 0
+    if cache is not None:
+        for length in range(len(steps) - 1, 0, -1):
+            entry = cache.get(length)
+            if entry is not None and entry[0] == _steps_key(steps[:length], random_state):
+                _, X_cur, y_cur = entry
+                start = length
+                break
+    # X_cur may be overwritten if the caller owns X; a cached prefix never is
+    owned = inplace and start == 0
+    if fused and cache is None and len(steps) - start > 1 and is_fusable(X_cur, steps[start:]):
+        step_seed = None if random_state is None else random_state + start
+        X_cur = fused_tabular_corruption(X_cur, steps[start:], random_state=step_seed, inplace=owned)
+        return X_cur, y_cur
+    for i in range(start, len(steps)):
+        step_seed = None if random_state is None else random_state + i
+        X_cur, y_cur = apply_corruption(X_cur, y_cur, steps[i], random_state=step_seed, inplace=owned)
+        # Later steps may overwrite this result unless it is cached
+        owned = cache is None
+        if cache is not None and i < len(steps) - 1:
+            # Longer cached prefixes now belong to a different branch
+            for length in [k for k in cache if k > i + 1]:
+                del cache[length]
+            cache[i + 1] = (_steps_key(steps[:i + 1], random_state), X_cur, y_cur)
+    return X_cur, y_cur
 
 
 def apply_corruption(
     X: np.ndarray,
     y: Optional[np.ndarray],
     corruption_config: Dict[str, Any],
-    random_state: Optional[int] = None
+    random_state: Optional[int] = None,
+    cache: Optional[Dict[int, Tuple]] = None,
+    inplace: bool = False
 ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
     """
     Apply corruption to data according to configuration.
@@ -84,10 +195,14 @@ def apply_corruption(
         X: Feature matrix
         y: Optional target labels (needed for class imbalance)
         corruption_config: Configuration dict with keys:
-            - type: Corruption type ('additive_noise', 'missingness', 'class_imbalance', 'token_dropout')
+            - type: Corruption type ('additive_noise', 'missingness', 'class_imbalance',
+              'token_dropout', or 'compound' with an ordered list of 'steps')
             - severity: Severity value in [0, 1]
             - Additional parameters specific to corruption type
         random_state: Random seed
+        cache: Optional prefix cache for compound corruptions
+        inplace: The caller owns X and allows it to be overwritten (noise,
+                 missingness and token dropout then skip their copy)
     
     Returns:
         (X_corrupted, y_corrupted): Corrupted data
@@ -95,6 +210,12 @@ def apply_corruption(
     corruption_type = corruption_config['type']
     severity = corruption_config.get('severity', 0.0)
     
+    if corruption_type == 'compound':
+        return apply_compound_corruption(
+            X, y, corruption_config['steps'], random_state=random_state, cache=cache,
+            fused=corruption_config.get('fused', True), inplace=inplace
+        )
+    
     # Set seed for reproducibility
     if random_state is not None:
         np.random.seed(random_state)
@@ -106,7 +227,8 @@ def apply_corruption(
             severity=severity,
             random_state=random_state,
             noise_type=corruption_config.get('noise_type', 'gaussian'),
-            feature_mask=corruption_config.get('feature_mask', None)
+            feature_mask=corruption_config.get('feature_mask', None),
+            inplace=inplace
         )
         y_corrupted = y
     
@@ -120,7 +242,8 @@ def apply_corruption(
             severity=severity,
             random_state=random_state,
             missing_value=missing_value,
-            feature_mask=corruption_config.get('feature_mask', None)
+            feature_mask=corruption_config.get('feature_mask', None),
+            inplace=inplace
         )
         y_corrupted = y
     
@@ -141,7 +264,8 @@ def apply_corruption(
         X_corrupted = token_dropout(
             X,
             severity=severity,
-            random_state=random_state
+            random_state=random_state,
+            inplace=inplace
         )
         y_corrupted = y
     
@@ -180,9 +304,94 @@ def apply_corruption(
     return X_corrupted, y_corrupted
 
 
+def load_raw_dataset(config: Dict[str, Any]):
+    """
+    Load the dataset named in a config with its preprocessing options.
+    
+    Returns:
+        (X, y, preprocessing_cfg)
+    """
+    dataset_name = config['dataset']
+    print(f"Loading dataset: {dataset_name}")
+    preprocessing_cfg = config.get('preprocessing', {}).copy()
+    # Load raw text so TF-IDF can be fit on train split only.
+    if dataset_name in ('imdb', 'amazon'):
+        preprocessing_cfg.setdefault('vectorize', False)
+    # Numeric dtype of the features (e.g. float32), carried through loading,
+    # vectorizing, scaling and corruption.
+    if config.get('dtype') is not None:
+        preprocessing_cfg['dtype'] = config['dtype']
+    X, y = get_dataset(dataset_name, **preprocessing_cfg)
+    X = _cast_features(X, preprocessing_cfg.get('dtype'))
+    print(f"Dataset shape: {X.shape}, Target shape: {y.shape}")
+    return X, y, preprocessing_cfg
+
+
+def prepare_data(config: Dict[str, Any], raw: Optional[Tuple] = None) -> Dict[str, Any]:
+    """
+    Load, split and preprocess a dataset (everything before corruption).
+    
+    The result only depends on the dataset, preprocessing, split sizes and
+    seed, so it can be shared by every corruption and model run on that
+    (dataset, seed). Corruptions copy their input, so the shared arrays are
+    never modified.
+    
+    Args:
+        config: Experiment config (dataset, preprocessing, test_size, val_size, seed)
+        raw: Optional (X, y, preprocessing_cfg) from ``load_raw_dataset``
+    
+    Returns:
+        Dict with X_train/X_val/X_test, y_train/y_val/y_test, idx_train/
+        idx_val/idx_test, y (full targets), preprocessing_cfg, preprocessors
+        (fitted 'vectorizer' / 'scaler'), test_size, val_size
+    """
+    seed = config.get('seed', 42)
+    X, y, preprocessing_cfg = raw if raw is not None else load_raw_dataset(config)
+    
+    # Split data (row indices are kept so prediction archives can reference them)
+    test_size = config.get('test_size', 0.2)
+    val_size = config.get('val_size', 0.1)
+    # (indices are cached per y/sizes/seed; each split is gathered once)
+    split = split_view(X, y, test_size=test_size, val_size=val_size, random_state=seed)
+    idx_train, idx_val, idx_test = (split.indices[name] for name in split.SPLITS)
+    X_train, X_val, X_test, y_train, y_val, y_test = split.materialize()
+    
+    print(f"Train: {X_train.shape[0]}, Val: {X_val.shape[0]}, Test: {X_test.shape[0]}")
+
+    # Fitted transformers, in application order (persisted with saved models)
+    preprocessors = {}
+
+    # Fit text vectorizer on train split only for text datasets.
+    if _is_text_data(X_train):
+        print("Vectorizing text (fit on train split only)...")
+        X_train, X_val, X_test, preprocessors['vectorizer'] = _vectorize_text_splits(
+            X_train, X_val, X_test, preprocessing_cfg
+        )
+        print(f"Vectorized shapes - Train: {X_train.shape}, Val: {X_val.shape}, Test: {X_test.shape}")
+
+    # Standardize dense numeric splits on train only (avoids leakage).
+    # The splits are fresh row selections of X, so they are scaled in place.
+    X_train, X_val, X_test, scaler = _scale_dense_splits(X_train, X_val, X_test, copy=False)
+    if scaler is not None:
+        preprocessors['scaler'] = scaler
+    X_train, X_val, X_test = _canonical_sparse_splits(X_train, X_val, X_test, preprocessing_cfg)
+    
+    return {
+        'X_train': X_train, 'X_val': X_val, 'X_test': X_test,
+        'y_train': y_train, 'y_val': y_val, 'y_test': y_test,
+        'idx_train': idx_train, 'idx_val': idx_val, 'idx_test': idx_test,
+        'y': y,
+        'preprocessing_cfg': preprocessing_cfg,
+        'preprocessors': preprocessors,
+        'test_size': test_size,
+        'val_size': val_size,
+    }
+
+
 def run_corruption_experiment(
     config: Dict[str, Any],
-    run_name: str = None
+    run_name: str = None,
+    prepared: Optional[Dict[str, Any]] = None
 ):
     """
     Run robustness experiment with corruption.
@@ -195,6 +404,8 @@ def run_corruption_experiment(
             - seed: Random seed
             - Additional keys from baseline config
         run_name: Optional run name
+        prepared: Optional output of ``prepare_data`` for the same dataset,
+                  preprocessing, split sizes and seed (skips load/split/scale)
     
     Returns:
         Dictionary with results and metadata
@@ -203,57 +414,153 @@ def run_corruption_experiment(
     seed = config.get('seed', 42)
     set_seed(seed)
     
-    # Get dataset
-    dataset_name = config['dataset']
-    print(f"Loading dataset: {dataset_name}")
-    preprocessing_cfg = config.get('preprocessing', {}).copy()
-    # Load raw text so TF-IDF can be fit on train split only.
-    if dataset_name in ('imdb', 'amazon'):
-        preprocessing_cfg.setdefault('vectorize', False)
-    X, y = get_dataset(dataset_name, **preprocessing_cfg)
-    print(f"Dataset shape: {X.shape}, Target shape: {y.shape}")
+    # Data prepared here is private to this run, so corruption may overwrite it
+    owns_data = prepared is None
+    if owns_data:
+        prepared = prepare_data(config)
+    data = corrupt_training_data(config, prepared, inplace=owns_data)
+    del prepared
+    return fit_and_evaluate(config, data, run_name=run_name)
+
+
+def run_regularization_path(
+    config: Dict[str, Any],
+    values: Optional[List[float]] = None,
+    run_name: str = None,
+    prepared: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fit and evaluate a linear model along a regularization path.
     
-    # Split data
-    X_train, X_val, X_test, y_train, y_val, y_test = train_val_test_split(
-        X, y,
-        test_size=config.get('test_size', 0.2),
-        val_size=config.get('val_size', 0.1),
-        random_state=seed
-    )
+    Loading, splitting, corruption and imputation run once; the path is
+    walked from the strongest to the weakest regularization, warm-starting
+    or sharing one decomposition where the model allows it (see
+    ``models.reg_path``). Every point is evaluated on val/test and logged as
+    its own run, named ``{run_name}_{param}{value:g}``.
     
-    print(f"Train: {X_train.shape[0]}, Val: {X_val.shape[0]}, Test: {X_test.shape[0]}")
+    Args:
+        config: Experiment config for a model with the reg_path trait
+        values: C or alpha values (default: config['regularization_path']['values'])
+        run_name: Optional run name prefix
+        prepared: Optional output of ``prepare_data``
+    
+    Returns:
+        One result dict per path point (strongest regularization first), as
+        returned by ``fit_and_evaluate`` plus 'path_param' and 'path_value';
+        for a shared ridge solve, 'path_solve_time' is the solve's total time
+        and each point's fit_time includes an equal share of it
+    """
+    if values is None:
+        values = (config.get('regularization_path') or {}).get('values')
+    if not values:
+        raise ValueError("No regularization path values (set regularization_path.values)")
+    model_name = config['model']
+    param, values = path_values(model_name, values)
+    
+    seed = config.get('seed', 42)
+    set_seed(seed)
+    owns_data = prepared is None
+    if owns_data:
+        prepared = prepare_data(config)
+    data = corrupt_training_data(config, prepared, inplace=owns_data)
+    del prepared
+    if run_name is None:
+        run_name = _default_run_name(config, data['corruption_config'])
+    
+    point_configs = []
+    for value in values:
+        model_params = dict(config.get('model_params') or {}, **{param: value})
+        point_configs.append(dict(config, model_params=model_params))
+    
+    # Ridge: the whole alpha path from one decomposition of the training split
+    fitted = [None] * len(values)
+    solve_time = None
+    if param == 'alpha':
+        models = [get_model(model_name, **dict(c['model_params'], random_state=seed)) for c in point_configs]
+        print(f"Solving {len(values)}-point alpha path from one decomposition")
+        start = time.perf_counter()
+        if fit_ridge_path(models, data['X_train'], data['y_train']):
+            fitted = models
+            solve_time = time.perf_counter() - start
+    
+    results = []
+    previous = None
+    for value, point_config, model in zip(values, point_configs, fitted):
+        print(f"\nRegularization path: {param}={value:g}")
+        result = fit_and_evaluate(point_config, data, run_name=f"{run_name}_{param}{value:g}",
+                                  init_model=previous, fitted_model=model)
+        result['path_param'] = param
+        result['path_value'] = value
+        if solve_time is not None:
+            # fit_and_evaluate only timed the evaluation: add an equal share of the shared solve
+            result['path_solve_time'] = solve_time
+            result['fit_time'] += solve_time / len(values)
+        previous = result['model']
+        results.append(result)
+    return results
 
-    # Fit text vectorizer on train split only for text datasets.
-    if _is_text_data(X_train):
-        print("Vectorizing text (fit on train split only)...")
-        X_train, X_val, X_test = _vectorize_text_splits(X_train, X_val, X_test, preprocessing_cfg)
-        print(f"Vectorized shapes - Train: {X_train.shape}, Val: {X_val.shape}, Test: {X_test.shape}")
 
-    # Standardize dense numeric splits on train only (avoids leakage).
-    X_train, X_val, X_test = _scale_dense_splits(X_train, X_val, X_test)
+def corrupt_training_data(
+    config: Dict[str, Any],
+    prepared: Dict[str, Any],
+    cache: Optional[Dict[int, Tuple]] = None,
+    inplace: bool = False,
+    impute: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Corrupt the training split and impute any missing values it introduced.
+    
+    Args:
+        config: Experiment config (corruption, seed)
+        prepared: Output of ``prepare_data``
+        cache: Optional compound prefix cache (see ``apply_compound_corruption``)
+        inplace: ``prepared['X_train']`` is private to the caller and may be
+                 overwritten, so corruption and imputation work on it without
+                 copies. Leave False when ``prepared`` is shared between runs.
+        impute: Impute missing values (default: unless the config's model
+                has the ``native_missing`` trait, e.g. XGBoost)
+    
+    Returns:
+        Copy of ``prepared`` with corrupted/imputed X_train, y_train, X_val,
+        X_test plus 'corruption_config', 'data_stats' and 'has_missing'. It
+        can be shared by every model trained on this corruption.
+    """
+    seed = config.get('seed', 42)
+    X_train, X_val, X_test = prepared['X_train'], prepared['X_val'], prepared['X_test']
+    y_train = prepared['y_train']
     
     # Apply corruption to training data (if specified)
     corruption_config = config.get('corruption', {})
     if corruption_config and corruption_config.get('type') != 'none':
         corruption_type = corruption_config.get('type')
-        severity = corruption_config.get('severity', 0.0)
-        print(f"Applying corruption: {corruption_type} with severity {severity}")
+        if corruption_type == 'compound':
+            steps = ', '.join(f"{step['type']}={step.get('severity', 0.0)}"
+                              for step in corruption_config['steps'])
+            print(f"Applying compound corruption: {steps}")
+        else:
+            severity = corruption_config.get('severity', 0.0)
+            print(f"Applying corruption: {corruption_type} with severity {severity}")
         
         # Apply corruption to training data
         X_train_corrupted, y_train_corrupted = apply_corruption(
             X_train,
             y_train,
             corruption_config,
-            random_state=seed
+            random_state=seed,
+            cache=cache,
+            inplace=inplace
         )
         
-        # For class imbalance, we need to use the corrupted training set
-        if corruption_type == 'class_imbalance':
+        # Class imbalance (also inside a compound) changes the training set size
+        if corruption_type in ('class_imbalance', 'compound'):
+            if X_train_corrupted.shape[0] != X_train.shape[0]:
+                print(f"After class imbalance: Train size = {X_train_corrupted.shape[0]}")
             X_train = X_train_corrupted
             y_train = y_train_corrupted
-            print(f"After class imbalance: Train size = {X_train.shape[0]}")
         else:
             X_train = X_train_corrupted
+        if sparse.issparse(X_train):
+            X_train = canonical_csr(X_train)
         
         # For some corruptions, we might also corrupt validation/test
         # But by default, we only corrupt training to measure robustness
@@ -268,53 +575,188 @@ def run_corruption_experiment(
     else:
         has_nan = np.isnan(X_train).any()
     
-    if has_nan:
-        from sklearn.impute import SimpleImputer
-        print("Imputing missing values...")
-        imputer = SimpleImputer(strategy='mean')
-        if sparse.issparse(X_train):
-            X_train = X_train.toarray()
-            X_val = X_val.toarray()
-            X_test = X_test.toarray()
-        X_train = imputer.fit_transform(X_train)
+    data = dict(prepared)
+    data.update({
+        'X_train': X_train, 'X_val': X_val, 'X_test': X_test, 'y_train': y_train,
+        'corruption_config': corruption_config,
+        'data_stats': _data_stats(X_train),
+        'has_missing': bool(has_nan),
+    })
+    if impute is None:
+        impute = not get_model_traits(config.get('model', '')).get('native_missing', False)
+    if has_nan and impute:
+        # The corrupted training matrix is private unless it is the shared input
+        owns_train = inplace or X_train is not prepared['X_train']
+        data = impute_training_data(data, owns_train=owns_train)
+    elif has_nan:
+        print("Keeping missing values (model handles NaN natively)")
+    return data
+
+
+def _data_stats(X_train) -> Dict[str, int]:
+    """Size of the training matrix (used by the grid cost model)."""
+    return {
+        'n_samples': int(X_train.shape[0]),
+        'n_features': int(X_train.shape[1]),
+        'nnz': int(X_train.nnz if sparse.issparse(X_train) else X_train.size),
+    }
+
+
+def impute_training_data(data: Dict[str, Any], owns_train: bool = False) -> Dict[str, Any]:
+    """
+    Mean-impute the missing values left by ``corrupt_training_data(..., impute=False)``.
+    
+    Args:
+        data: Output of ``corrupt_training_data``; it is not modified
+        owns_train: ``data['X_train']`` is private to the caller and may be
+                    imputed in place
+    
+    Returns:
+        ``data`` itself when nothing is missing, otherwise a copy with
+        imputed (dense) X_train, X_val and X_test. Sparse val/test splits
+        stay sparse; 'eval_transform' densifies and imputes them chunk by
+        chunk at prediction time (see ``models.batch_predict``).
+    """
+    if not data.get('has_missing'):
+        return data
+    from sklearn.impute import SimpleImputer
+    print("Imputing missing values...")
+    X_train, X_val, X_test = data['X_train'], data['X_val'], data['X_test']
+    eval_transform = None
+    if sparse.issparse(X_train):
+        X_train = X_train.toarray()
+        owns_train = True
+    imputer = SimpleImputer(strategy='mean', copy=not owns_train)
+    X_train = imputer.fit_transform(X_train)
+    imputer.set_params(copy=True)
+    if sparse.issparse(X_val):
+        eval_transform = partial(densify_and_impute, imputer)
+    else:
         X_val = imputer.transform(X_val)
         X_test = imputer.transform(X_test)
     
+    imputed = dict(data)
+    imputed.update({
+        'X_train': X_train, 'X_val': X_val, 'X_test': X_test,
+        'eval_transform': eval_transform,
+        'preprocessors': dict(data.get('preprocessors') or {}, imputer=imputer),
+        'data_stats': _data_stats(X_train),
+        'has_missing': False,
+    })
+    return imputed
+
+
+def densify_and_impute(imputer, X):
+    """Dense, imputed copy of (a chunk of) a sparse split, for models fit on imputed dense data."""
+    return imputer.transform(X.toarray() if sparse.issparse(X) else X)
+
+
+def _default_run_name(config: Dict[str, Any], corruption_config: Dict[str, Any]) -> str:
+    """Timestamped run name: dataset, model, corruption type and severity."""
+    from datetime import datetime
+    corruption_str = corruption_config.get('type', 'none')
+    severity_str = f"_{corruption_config.get('severity', 0.0):.2f}" if corruption_config else ""
+    return f"{config['dataset']}_{config['model']}_{corruption_str}{severity_str}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+
+def fit_and_evaluate(
+    config: Dict[str, Any],
+    data: Dict[str, Any],
+    run_name: str = None,
+    init_model: Any = None,
+    fitted_model: Any = None,
+    log: bool = True
+) -> Dict[str, Any]:
+    """
+    Fit the config's model on (corrupted) data, evaluate it and log the run.
+    
+    Predictions are made in row chunks (config 'prediction'). With
+    ``calibration`` on sparse val rows that the model needs densified
+    (data['eval_transform']), the calibrator is fit on a seeded sample of at
+    most chunk_rows validation rows rather than on the whole split.
+    
+    Args:
+        config: Experiment config (model, model_params, seed, output_dir, ...)
+        data: Output of ``corrupt_training_data``; it is not modified
+        run_name: Optional run name
+        init_model: Optional fitted model of the same kind to warm-start
+                    from (see ``models.warm_start``); ignored for models
+                    without the warm_start trait
+        fitted_model: Optional model already fitted on data['X_train'] for
+                      this config (e.g. a ``fit_ridge_path`` point); it is
+                      evaluated and logged without refitting
+        log: Write the run directory (and any model artifact or prediction
+             archive); with False nothing is written and 'run_dir' is None,
+             e.g. for comparison fits that are not runs of their own
+    
+    Returns:
+        Dictionary with results and metadata; 'fit_time' covers building and
+        fitting the model, 'eval_time' calibration, prediction and metrics
+    """
+    seed = config.get('seed', 42)
+    dataset_name = config['dataset']
+    X_train, X_val, X_test = data['X_train'], data['X_val'], data['X_test']
+    y_train, y_val, y_test = data['y_train'], data['y_val'], data['y_test']
+    idx_val, idx_test = data['idx_val'], data['idx_test']
+    y = data['y']
+    preprocessing_cfg = data['preprocessing_cfg']
+    test_size, val_size = data['test_size'], data['val_size']
+    corruption_config = data['corruption_config']
+    data_stats = data['data_stats']
+    
     # Get model
     model_name = config['model']
     model_params = config.get('model_params', {}).copy()
     model_params['random_state'] = seed
-    model = get_model(model_name, **model_params)
-    
-    print(f"Training model: {model_name}")
-    model.fit(X_train, y_train)
-    
-    # Evaluate on validation and test sets
-    y_val_pred = model.predict(X_val)
-    y_test_pred = model.predict(X_test)
+    start = time.perf_counter()
+    warm_started = False
+    if fitted_model is not None:
+        model = fitted_model
+    else:
+        model = get_model(model_name, **model_params)
+        print(f"Training model: {model_name}")
+        # Models with the eval_set / val_split trait early-stop on the validation split
+        fit_params = get_fit_params(model_name, X_val, y_val, model=model)
+        if init_model is not None:
+            warm_params = warm_start_params(model_name, model, init_model)
+            if warm_params is not None:
+                fit_params.update(warm_params)
+                warm_started = True
+        model.fit(X_train, y_train, **fit_params)
+    fit_time = time.perf_counter() - start
+    iterations = fit_iterations(model)
+    if iterations is not None:
+        print(f"Fit took {iterations} iterations{' (warm start)' if warm_started else ''}")
     
-    # Get probabilities (or decision scores) for AUROC
-    y_val_proba = None
-    y_test_proba = None
-    if hasattr(model, 'predict_proba'):
-        try:
-            y_val_proba = model.predict_proba(X_val)
-            y_test_proba = model.predict_proba(X_test)
-            if y_val_proba.shape[1] == 2:
-                y_val_proba = y_val_proba[:, 1]
-                y_test_proba = y_test_proba[:, 1]
-        except:
-            pass
-    if y_val_proba is None and hasattr(model, 'decision_function'):
-        try:
-            y_val_proba = model.decision_function(X_val)
-            y_test_proba = model.decision_function(X_test)
-        except:
-            pass
+    # Optional post-hoc calibration on the validation split (the model is not refit)
+    start = time.perf_counter()
+    scorer = model
+    calibration = config.get('calibration')
+    eval_transform = data.get('eval_transform')
+    prediction_cfg = config.get('prediction') or {}
+    if calibration:
+        print(f"Calibrating probabilities on validation split ({calibration})")
+        X_cal, y_cal = X_val, y_val
+        if eval_transform is not None:
+            # Sparse val rows are densified for the model: calibrate on at
+            # most one chunk of them so memory stays bounded by the chunk size
+            chunk_rows = prediction_cfg.get('chunk_rows', DEFAULT_CHUNK_ROWS)
+            if chunk_rows and X_val.shape[0] > chunk_rows:
+                rows = np.sort(np.random.RandomState(seed).choice(X_val.shape[0], chunk_rows, replace=False))
+                X_cal, y_cal = X_val[rows], y_val[rows]
+            X_cal = eval_transform(X_cal)
+        scorer = calibrate_on_validation(model, X_cal, y_cal, method=calibration)
+        del X_cal
     
-    # Compute metrics
+    # Evaluate on validation and test sets: labels plus probabilities (or
+    # decision scores) for AUROC, predicted in row chunks into float32 buffers
     is_regression = dataset_name == 'airbnb' or 'reg' in model_name
+    y_val_pred, y_val_proba = predict_with_scores(model, X_val, scorer=scorer, scores=not is_regression,
+                                                  transform=eval_transform, **prediction_cfg)
+    y_test_pred, y_test_proba = predict_with_scores(model, X_test, scorer=scorer, scores=not is_regression,
+                                                    transform=eval_transform, **prediction_cfg)
     
+    # Compute metrics
     if is_regression:
         val_metrics = compute_regression_metrics(y_val, y_val_pred)
         test_metrics = compute_regression_metrics(y_test, y_test_pred)
@@ -322,16 +764,14 @@ def run_corruption_experiment(
         val_metrics = compute_classification_metrics(y_val, y_val_pred, y_val_proba)
         test_metrics = compute_classification_metrics(y_test, y_test_pred, y_test_proba)
     
-    # Log results
-    output_dir = Path(config.get('output_dir', 'outputs/runs'))
-    if run_name is None:
-        from datetime import datetime
-        corruption_str = corruption_config.get('type', 'none')
-        severity_str = f"_{corruption_config.get('severity', 0.0):.2f}" if corruption_config else ""
-        run_name = f"{dataset_name}_{model_name}_{corruption_str}{severity_str}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    eval_time = time.perf_counter() - start
     
-    logger = RunLogger(output_dir / run_name)
-    logger.log_config(config)
+    # Optional bootstrap confidence intervals from the test predictions
+    test_ci = bootstrap_from_config(
+        config.get('bootstrap'), y_test, y_test_pred, y_test_proba,
+        task='regression' if is_regression else 'classification',
+        random_state=seed
+    )
     
     # Combine metrics
     all_metrics = {}
@@ -339,17 +779,159 @@ def run_corruption_experiment(
         all_metrics[f'val_{k}'] = v
     for k, v in test_metrics.items():
         all_metrics[f'test_{k}'] = v
+    for k, v in test_ci.items():
+        all_metrics[f'test_{k}'] = v
     
-    logger.log_final_metrics(all_metrics)
+    # Log results
+    output_dir = Path(config.get('output_dir', 'outputs/runs'))
+    run_dir = None
+    artifact_key = None
+    if log:
+        if run_name is None:
+            run_name = _default_run_name(config, corruption_config)
+        logger = RunLogger(output_dir / run_name)
+        logger.log_config(config)
+        logger.log_final_metrics(all_metrics)
+        run_dir = logger.run_dir
+        
+        # Optional fitted-model artifact, shared by runs with the same config
+        if config.get('save_model', False):
+            artifact_key = save_model_artifact(config, data, model, output_dir / ARTIFACTS_DIRNAME, scorer=scorer)
+            save_json({'key': artifact_key, 'store': str(output_dir / ARTIFACTS_DIRNAME)},
+                      run_dir / 'artifact.json')
+            print(f"Model artifact: {artifact_key}")
+        
+        # Optional per-sample prediction archive (true labels live in a shared split file)
+        if config.get('save_predictions', False):
+            fingerprint = split_fingerprint(
+                y, test_size, val_size, seed, dataset=dataset_name, preprocessing=preprocessing_cfg
+            )
+            split_ref = output_dir / '_splits' / f'{dataset_name}_{fingerprint}.npz'
+            save_split_reference(split_ref, {'val': idx_val, 'test': idx_test}, y)
+            logger.log_predictions(
+                {'val': (y_val_pred, y_val_proba), 'test': (y_test_pred, y_test_proba)},
+                split_ref=split_ref,
+                is_regression=is_regression
+            )
     
     print("\nResults:")
     print("Validation:", val_metrics)
     print("Test:", test_metrics)
+    if test_ci:
+        print("Test bootstrap CI:", test_ci)
     
     return {
         'val_metrics': val_metrics,
         'test_metrics': test_metrics,
+        'test_ci': test_ci,
         'model': model,
-        'run_dir': logger.run_dir,
-        'corruption_config': corruption_config
+        'run_dir': run_dir,
+        'corruption_config': corruption_config,
+        'data_stats': data_stats,
+        'fit_time': fit_time,
+        'eval_time': eval_time,
+        'fit_iterations': iterations,
+        'warm_started': warm_started,
+        'artifact_key': artifact_key,
+    }
+
+
+def save_model_artifact(
+    config: Dict[str, Any],
+    data: Dict[str, Any],
+    model: Any,
+    store_root: Path,
+    scorer: Any = None
+) -> str:
+    """
+    Persist a fitted model with its preprocessors in an ``ArtifactStore``.
+    
+    Forests are stored as a ``FlatForest`` so loading processes memory-map
+    (and share) their nodes instead of each unpickling a copy. A calibrated
+    scorer (``config['calibration']``) is stored next to the model, so stored
+    runs score exactly as they did when logged.
+    
+    Returns:
+        Artifact key (``run_hash(config)``)
+    """
+    key = run_hash(config)
+    stored = FlatForest.from_forest(model) if is_flattenable(model) else model
+    meta = {
+        'dataset': config['dataset'],
+        'model': config['model'],
+        'seed': config.get('seed', 42),
+        'corruption': data['corruption_config'],
+        'preprocessing': data['preprocessing_cfg'],
+        'calibration': config.get('calibration'),
+        'config': config,
     }
+    scorer = None if scorer is model else scorer
+    ArtifactStore(store_root).save(key, stored, preprocessors=data.get('preprocessors'), meta=meta, scorer=scorer)
+    return key
+
+
+def run_multi_model_experiment(
+    config: Dict[str, Any],
+    models: List[Any],
+    run_names: Optional[List[str]] = None,
+    prepared: Optional[Dict[str, Any]] = None,
+    n_jobs: Optional[int] = None,
+    raise_errors: bool = True
+) -> List[Any]:
+    """
+    Train several models on one corrupted dataset.
+    
+    Loading, splitting, corruption and imputation run once (models that
+    handle NaN natively get the unimputed data); each model is then fit and evaluated on the shared arrays (in threads when n_jobs > 1)
+    and logged as its own run.
+    
+    Args:
+        config: Experiment config; 'model'/'model_params' are taken from models
+        models: Model names or {'name': ..., 'params': {...}} dicts
+        run_names: Optional run name per model
+        prepared: Optional output of ``prepare_data``
+        n_jobs: Number of models fit concurrently (default: one thread per model, capped at the CPU count)
+        raise_errors: If False, a failing model's entry is its exception
+                      instead of aborting the call
+    
+    Returns:
+        One result dict per model (same order as models), as returned by
+        ``run_corruption_experiment``
+    """
+    seed = config.get('seed', 42)
+    set_seed(seed)
+    model_configs = []
+    for entry in models:
+        name, params = (entry, None) if isinstance(entry, str) else (entry['name'], entry.get('params'))
+        model_config = dict(config, model=name)
+        if params is not None:
+            model_config['model_params'] = dict(params)
+        model_configs.append(model_config)
+    run_names = run_names or [None] * len(model_configs)
+    
+    if prepared is None:
+        prepared = prepare_data(config)
+    # Corrupt once; impute once for the models that cannot handle NaN
+    native = [get_model_traits(c['model']).get('native_missing', False) for c in model_configs]
+    raw = corrupt_training_data(config, prepared, impute=False)
+    imputed = raw
+    if not all(native):
+        owns_train = not any(native) and raw['X_train'] is not prepared['X_train']
+        imputed = impute_training_data(raw, owns_train=owns_train)
+    
+    def fit_one(i):
+        try:
+            data = raw if native[i] else imputed
+            return fit_and_evaluate(model_configs[i], data, run_name=run_names[i])
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"\nModel {model_configs[i]['model']} failed: {e}")
+            return e
+    
+    if n_jobs is None:
+        n_jobs = min(len(model_configs), os.cpu_count() or 1)
+    if n_jobs <= 1 or len(model_configs) <= 1:
+        return [fit_one(i) for i in range(len(model_configs))]
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        return list(pool.map(fit_one, range(len(model_configs))))
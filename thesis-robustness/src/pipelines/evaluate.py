@@ -0,0 +1,242 @@
+"""Evaluation-only pipeline over stored model artifacts.
+
+Fitted models saved with ``save_model`` (see ``common.artifacts``) are
+re-evaluated on any number of evaluation sets without retraining:
+
+- the run's own clean test split,
+- that test split corrupted at several severities,
+- another dataset or domain (e.g. Amazon 'dvd' for a model trained on
+  'books'), transformed by the stored vectorizer/scaler/imputer.
+
+Per model, all evaluation matrices of the same kind (dense or sparse) are
+concatenated and scored in one chunked pass (``models.batch_predict``),
+then split back into per-set metrics.
+"""
+import json
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from ..common.artifacts import ArtifactStore
+from ..common.registry import get_model_traits
+from ..common.metrics import compute_classification_metrics, compute_regression_metrics
+from ..common.sparse_layout import canonical_csr
+from ..common.split import split_view
+from ..models.batch_predict import predict_with_scores
+from .corruption import load_raw_dataset, apply_corruption, densify_and_impute
+
+EVAL_SPLITS = ('test', 'val', 'all')
+
+
+def expand_eval_sets(specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Expand evaluation-set specs into one entry per set.
+
+    A spec has a 'name' and optionally 'dataset', 'preprocessing' (merged
+    into the run's), 'split' (test/val/all, default test) and 'corruption';
+    'severities' expands a corruption into one set per severity, named
+    ``{name}_{severity:g}``.
+    """
+    eval_sets = []
+    for spec in specs:
+        if spec.get('split', 'test') not in EVAL_SPLITS:
+            raise ValueError(f"Unknown split: {spec['split']}. Use one of {EVAL_SPLITS}")
+        severities = spec.get('severities')
+        if severities is None:
+            eval_sets.append(dict(spec))
+            continue
+        if not spec.get('corruption'):
+            raise ValueError(f"Eval set {spec['name']}: 'severities' needs a 'corruption'")
+        for severity in severities:
+            eval_set = {k: v for k, v in spec.items() if k != 'severities'}
+            eval_set['name'] = f"{spec['name']}_{severity:g}"
+            eval_set['corruption'] = dict(spec['corruption'], severity=severity)
+            eval_sets.append(eval_set)
+    return eval_sets
+
+
+def apply_preprocessors(X, preprocessors: Dict[str, Any], preprocessing_cfg: Dict[str, Any]):
+    """Transform raw features the way ``prepare_data`` transformed the training rows."""
+    if 'vectorizer' in preprocessors:
+        X = canonical_csr(preprocessors['vectorizer'].transform(X), preprocessing_cfg.get('dtype'))
+    if 'scaler' in preprocessors:
+        X = preprocessors['scaler'].transform(X)
+    return X
+
+
+def _impute(X, preprocessors, native_missing=False):
+    """Mean-impute missing values as the training pipeline did (unless the model handles NaN)."""
+    imputer = preprocessors.get('imputer')
+    if imputer is not None:
+        # Sparse sets are densified and imputed chunk by chunk when predicted
+        return X if sparse.issparse(X) else imputer.transform(X)
+    if native_missing or sparse.issparse(X) or 'scaler' not in preprocessors:
+        return X
+    # Model trained without missing values: standardized features have
+    # training mean 0, so filling 0 is the training-mean imputation
+    missing = np.isnan(X)
+    if missing.any():
+        X[missing] = 0.0
+    return X
+
+
+def build_eval_set(
+    run_config: Dict[str, Any],
+    preprocessors: Dict[str, Any],
+    eval_set: Dict[str, Any],
+    raw_cache: Optional[Dict[str, Any]] = None,
+    native_missing: bool = False
+):
+    """
+    Features and targets of one evaluation set for a stored run.
+
+    Args:
+        run_config: The stored run's config (artifact meta['config'])
+        preprocessors: The stored run's fitted preprocessors
+        eval_set: One entry of ``expand_eval_sets``
+        raw_cache: Optional dict reusing loaded datasets across runs
+        native_missing: The model handles NaN itself (missing values are kept)
+
+    Returns:
+        (X, y) ready for the stored model
+    """
+    config = dict(run_config, dataset=eval_set.get('dataset', run_config['dataset']))
+    if eval_set.get('preprocessing'):
+        config['preprocessing'] = dict(run_config.get('preprocessing') or {}, **eval_set['preprocessing'])
+    raw_key = json.dumps([config['dataset'], config.get('preprocessing'), config.get('dtype')],
+                         sort_keys=True, default=str)
+    if raw_cache is not None and raw_key in raw_cache:
+        X, y, preprocessing_cfg = raw_cache[raw_key]
+    else:
+        X, y, preprocessing_cfg = load_raw_dataset(config)
+        if raw_cache is not None:
+            raw_cache[raw_key] = (X, y, preprocessing_cfg)
+
+    # Rows gathered for a split are a fresh copy, so the steps below may work
+    # in place; the whole cached dataset is copied first
+    split = eval_set.get('split', 'test')
+    if split == 'all':
+        X, y = X.copy(), y.copy()
+    else:
+        view = split_view(X, y, test_size=config.get('test_size', 0.2),
+                          val_size=config.get('val_size', 0.1), random_state=config.get('seed', 42))
+        X, y = view.X_split(split), view.y_split(split)
+    X = apply_preprocessors(X, preprocessors, preprocessing_cfg)
+
+    corruption = eval_set.get('corruption')
+    if corruption and corruption.get('type') != 'none':
+        X, y = apply_corruption(X, y, corruption, random_state=config.get('seed', 42), inplace=True)
+        if sparse.issparse(X):
+            X = canonical_csr(X)
+    return _impute(X, preprocessors, native_missing), y
+
+
+def predict_batched(
+    model,
+    matrices: List[Any],
+    is_regression: bool = False,
+    sparse_transform: Optional[Callable] = None,
+    scorer: Any = None,
+    **prediction_cfg
+):
+    """
+    Predict several matrices with one chunked pass per kind (dense / sparse).
+
+    Args:
+        model: Fitted model
+        matrices: Evaluation matrices (same features)
+        is_regression: Skip scores
+        sparse_transform: Per-chunk transform of the sparse matrices
+        scorer: Optional estimator providing the scores (default: model)
+        **prediction_cfg: chunk_rows / n_jobs for ``predict_with_scores``
+
+    Returns:
+        One (y_pred, y_score) pair per matrix, in input order
+    """
+    outputs = [None] * len(matrices)
+    kinds = {}
+    for i, X in enumerate(matrices):
+        kinds.setdefault(sparse.issparse(X), []).append(i)
+    for is_sparse, indices in kinds.items():
+        parts = [matrices[i] for i in indices]
+        if len(parts) == 1:
+            X = parts[0]
+        else:
+            X = sparse.vstack(parts, format='csr') if is_sparse else np.concatenate(parts)
+        y_pred, y_score = predict_with_scores(model, X, scorer=scorer, scores=not is_regression,
+                                              transform=sparse_transform if is_sparse else None,
+                                              **prediction_cfg)
+        offsets = np.cumsum([0] + [part.shape[0] for part in parts])
+        for i, start, stop in zip(indices, offsets[:-1], offsets[1:]):
+            outputs[i] = (y_pred[start:stop], None if y_score is None else y_score[start:stop])
+    return outputs
+
+
+def evaluate_artifacts(
+    store: ArtifactStore,
+    eval_sets: List[Dict[str, Any]],
+    keys: Optional[List[str]] = None,
+    prediction_cfg: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate stored models on a list of evaluation sets.
+
+    Args:
+        store: Artifact store holding the models
+        eval_sets: Output of ``expand_eval_sets``
+        keys: Artifact keys to evaluate (default: all in the store)
+        prediction_cfg: Optional chunk_rows / n_jobs for prediction
+
+    Returns:
+        One flat record per (artifact, eval set) with the set's metrics
+    """
+    keys = store.keys() if keys is None else keys
+    raw_cache: Dict[str, Any] = {}
+    records = []
+    for key in keys:
+        artifact = store.load(key)
+        meta, model = artifact['meta'], artifact['model']
+        run_config = meta['config']
+        is_regression = run_config['dataset'] == 'airbnb' or 'reg' in run_config['model']
+        print(f"\nEvaluating {key} ({meta['dataset']} / {meta['model']}) on {len(eval_sets)} sets")
+        native_missing = get_model_traits(run_config['model']).get('native_missing', False)
+        data = [build_eval_set(run_config, artifact['preprocessors'], s, raw_cache, native_missing)
+                for s in eval_sets]
+        start = time.perf_counter()
+        imputer = artifact['preprocessors'].get('imputer')
+        outputs = predict_batched(
+            model, [X for X, _ in data], is_regression=is_regression,
+            sparse_transform=None if imputer is None else partial(densify_and_impute, imputer),
+            scorer=artifact.get('scorer'),
+            **(prediction_cfg or {})
+        )
+        predict_time = time.perf_counter() - start
+        train_corruption = meta.get('corruption') or {}
+        for eval_set, (X, y), (y_pred, y_score) in zip(eval_sets, data, outputs):
+            if is_regression:
+                metrics = compute_regression_metrics(y, y_pred)
+            else:
+                metrics = compute_classification_metrics(y, y_pred, y_score)
+            eval_corruption = eval_set.get('corruption') or {}
+            record = {
+                'artifact': key,
+                'dataset': meta['dataset'],
+                'model': meta['model'],
+                'seed': meta.get('seed'),
+                'corruption': train_corruption.get('type', 'none'),
+                'severity': train_corruption.get('severity'),
+                'eval_set': eval_set['name'],
+                'eval_dataset': eval_set.get('dataset', meta['dataset']),
+                'eval_corruption': eval_corruption.get('type', 'none'),
+                'eval_severity': eval_corruption.get('severity'),
+                'n_samples': int(X.shape[0]),
+                'predict_time': predict_time,
+            }
+            for k, v in metrics.items():
+                record[k] = None if v is None else float(v)
+            records.append(record)
+            print(f"  {eval_set['name']:<24} {metrics}")
+    return records
@@ -0,0 +1,220 @@
+"""Execution of experiment grid cells.
+
+A grid cell is one (config, run_name) pair, e.g. a single severity/seed of a
+severity grid. Cells can run in-process (the original behaviour) or each in
+its own supervised child process with a wall-clock timeout and a memory
+ceiling, so that one stuck or crashing fit does not take down the sweep.
+With several workers, cells are dispatched longest-first according to
+predicted costs, which keeps one huge cell from finishing long after all
+the others. Alternatively, cells can run as warm-start chains: per seed and
+in increasing severity, each model starts from its predecessor's fit.
+"""
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Sequence
+
+from tqdm import tqdm
+
+from ..common.cost_model import estimate_makespan, longest_first
+from ..common.registry import get_model_traits
+from ..common.seed import set_seed
+from ..common.supervisor import run_supervised, STATUS_OK, STATUS_ERROR
+from .corruption import run_corruption_experiment, prepare_data, corrupt_training_data, fit_and_evaluate
+
+# Result keys that are cheap to send back from a child process.
+RESULT_KEYS = ('val_metrics', 'test_metrics', 'test_ci', 'run_dir', 'corruption_config', 'data_stats',
+               'fit_iterations', 'warm_started')
+WARM_START_CHECKS = ('none', 'last', 'all')
+
+
+def run_grid_cell(config: Dict[str, Any], run_name: str) -> Dict[str, Any]:
+    """Run one corruption experiment and return its picklable summary (no model)."""
+    result = run_corruption_experiment(config, run_name=run_name)
+    return {k: result[k] for k in RESULT_KEYS if k in result}
+
+
+def _run_in_process(cell: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a cell in the current process, catching failures like the supervisor does."""
+    start = time.monotonic()
+    try:
+        result = run_grid_cell(cell['config'], cell['run_name'])
+        outcome = {'status': STATUS_OK, 'result': result, 'error': None}
+    except Exception:
+        outcome = {'status': STATUS_ERROR, 'result': None, 'error': traceback.format_exc()}
+    outcome['wall_time'] = time.monotonic() - start
+    return outcome
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{secs:02d}"
+
+
+def _run_cell(cell, isolate, timeout, memory_limit_mb):
+    if isolate:
+        return run_supervised(
+            run_grid_cell,
+            args=(cell['config'], cell['run_name']),
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+        )
+    return _run_in_process(cell)
+
+
+def _report_failure(cell, outcome):
+    error = (outcome['error'] or '').strip().splitlines()
+    print(f"\nCell {cell['run_name']} failed ({outcome['status']}): "
+          f"{error[-1] if error else 'unknown error'}")
+
+
+def run_cells(
+    cells: List[Dict[str, Any]],
+    isolate: bool = False,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[float] = None,
+    desc: str = "Grid cells",
+    workers: int = 1,
+    costs: Optional[Sequence[float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run grid cells and collect one outcome per cell.
+
+    Args:
+        cells: Dicts with 'config' and 'run_name' plus any metadata
+               (e.g. 'severity', 'seed') that is copied into the outcome
+        isolate: Run each cell in a supervised child process. Implied by
+                 timeout, memory_limit_mb or workers > 1.
+        timeout: Per-cell wall-clock limit in seconds
+        memory_limit_mb: Per-cell memory ceiling in MB
+        desc: Progress bar label
+        workers: Number of cells run concurrently
+        costs: Predicted seconds per cell (see ``CostModel``). Cells are
+               dispatched longest-first and the ETA is derived from them.
+
+    Returns:
+        List of outcomes (same order as cells) with keys from the cell
+        metadata plus status, result, error, wall_time and, when isolated,
+        cpu_time and max_rss_mb
+    """
+    workers = max(1, int(workers))
+    # Pipelines seed the global numpy RNG, so concurrent cells need their own process
+    isolate = isolate or timeout is not None or memory_limit_mb is not None or workers > 1
+    if costs is None:
+        costs = [1.0] * len(cells)
+        order = list(range(len(cells)))
+    else:
+        costs = [float(c) for c in costs]
+        order = longest_first(costs)
+        print(f"Estimated grid time with {workers} worker(s): "
+              f"{_format_seconds(estimate_makespan(costs, workers))}")
+
+    outcomes = [None] * len(cells)
+    pending = set(order)
+    predicted_done = 0.0
+    actual_done = 0.0
+    with ThreadPoolExecutor(max_workers=workers) as pool, tqdm(total=len(cells), desc=desc) as bar:
+        # The executor queue is FIFO, so submission order is dispatch order
+        futures = {
+            pool.submit(_run_cell, cells[i], isolate, timeout, memory_limit_mb): i
+            for i in order
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            cell = cells[i]
+            outcome = future.result()
+            meta = {k: v for k, v in cell.items() if k != 'config'}
+            outcomes[i] = {**meta, **outcome}
+            if outcome['status'] != STATUS_OK:
+                _report_failure(cell, outcome)
+
+            pending.discard(i)
+            predicted_done += costs[i]
+            actual_done += outcome['wall_time']
+            # Rescale the remaining predictions by how far off the finished ones were
+            scale = actual_done / predicted_done if predicted_done > 0 else 1.0
+            remaining = estimate_makespan([costs[j] * scale for j in pending], workers)
+            bar.set_postfix_str(f"eta {_format_seconds(remaining)}")
+            bar.update(1)
+    return outcomes
+
+
+def run_warm_start_chains(
+    cells: List[Dict[str, Any]],
+    fitted: Optional[Dict[Any, Dict[float, Any]]] = None,
+    check: str = 'last',
+    desc: str = "Warm-start chains",
+) -> List[Dict[str, Any]]:
+    """
+    Run severity grid cells as warm-start chains (in-process, sequentially).
+
+    Cells are grouped by seed; data is prepared once per seed, and each cell
+    (in increasing severity) warm-starts from the model of the closest lower
+    severity fitted so far. Only models with the warm_start trait are kept,
+    and without ``fitted`` only the latest model of each chain (the next
+    cell's neighbour) is held in memory.
+
+    Args:
+        cells: Cells with 'config', 'run_name', 'severity' and 'seed'
+        fitted: {seed: {severity: model}} of earlier fits, updated in place
+                (lets adaptive refinement rounds continue the chains, so
+                every warm-startable fit is kept)
+        check: Fidelity check; warm-started cells that also get a cold fit
+               on the same data: 'none', 'last' (last cell of each chain)
+               or 'all'. The cold fit is not logged as a run; its test
+               metrics and iterations are added to the result as
+               'cold_test_metrics' / 'cold_fit_iterations'.
+        desc: Progress bar label
+
+    Returns:
+        Outcomes in the format of ``run_cells`` (same order as cells)
+    """
+    if check not in WARM_START_CHECKS:
+        raise ValueError(f"Unknown warm-start check: {check}. Use one of {WARM_START_CHECKS}")
+    # Later refinement rounds may insert severities anywhere, so a caller's
+    # fitted dict keeps every fit; otherwise a chain only needs its last model
+    keep_all = fitted is not None
+    fitted = {} if fitted is None else fitted
+    chains = {}
+    for i, cell in enumerate(cells):
+        chains.setdefault(cell['seed'], []).append(i)
+
+    outcomes = [None] * len(cells)
+    with tqdm(total=len(cells), desc=desc) as bar:
+        for seed, chain in chains.items():
+            chain.sort(key=lambda i: cells[i]['severity'])
+            models = fitted.setdefault(seed, {})
+            prepared = None
+            for position, i in enumerate(chain):
+                cell = cells[i]
+                config, severity = cell['config'], cell['severity']
+                start = time.monotonic()
+                try:
+                    set_seed(seed)
+                    if prepared is None:
+                        prepared = prepare_data(config)
+                    data = corrupt_training_data(config, prepared)
+                    lower = [s for s in models if s < severity]
+                    init_model = models[max(lower)] if lower else None
+                    result = fit_and_evaluate(config, data, run_name=cell['run_name'], init_model=init_model)
+                    if get_model_traits(config['model']).get('warm_start'):
+                        if not keep_all:
+                            models.clear()
+                        models[severity] = result['model']
+                    summary = {k: result[k] for k in RESULT_KEYS if k in result}
+                    # The cold comparison fit is not part of the cell's timing
+                    wall_time = time.monotonic() - start
+                    last = position == len(chain) - 1
+                    if result['warm_started'] and (check == 'all' or (check == 'last' and last)):
+                        cold = fit_and_evaluate(config, data, log=False)
+                        summary['cold_test_metrics'] = cold['test_metrics']
+                        summary['cold_fit_iterations'] = cold['fit_iterations']
+                    outcome = {'status': STATUS_OK, 'result': summary, 'error': None, 'wall_time': wall_time}
+                except Exception:
+                    outcome = {'status': STATUS_ERROR, 'result': None, 'error': traceback.format_exc(),
+                               'wall_time': time.monotonic() - start}
+                    _report_failure(cell, outcome)
+                outcomes[i] = {**{k: v for k, v in cell.items() if k != 'config'}, **outcome}
+                bar.update(1)
+    return outcomes
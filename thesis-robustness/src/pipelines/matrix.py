@@ -0,0 +1,200 @@
+"""Declarative experiment matrix: datasets x models x corruptions x severities x seeds.
+
+A matrix spec replaces per-experiment YAML files and shell loops. Cells are
+expanded from the spec, exact duplicates are dropped, and cells are grouped
+so that the dataset is loaded once per (dataset, preprocessing) and split and
+preprocessed once per (dataset, preprocessing, split sizes, seed). Every
+corruption in a group runs on the same prepared arrays, and all models of a
+(corruption, severity, seed) share one corrupted and imputed training set.
+
+Example spec::
+
+    output_dir: outputs/matrix/adult
+    datasets: [adult]
+    models:
+      - logistic
+      - name: random_forest
+        params: {n_estimators: 100}
+    corruptions:
+      - type: additive_noise
+      - type: missingness
+        severities: [0.0, 0.2, 0.4]   # overrides the top-level list
+    severities: [0.0, 0.1, 0.3, 0.5]
+    seeds: [42, 43, 44]
+    defaults:                         # merged into every cell config
+      test_size: 0.2
+"""
+import json
+import traceback
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..common.artifacts import run_hash
+from ..common.seed import set_seed
+from ..common.supervisor import STATUS_OK, STATUS_ERROR
+from .corruption import load_raw_dataset, prepare_data, run_multi_model_experiment
+from .grid import RESULT_KEYS
+
+# Config keys that determine the prepared (split + preprocessed) data.
+PREPARE_KEYS = ('dataset', 'preprocessing', 'dtype', 'test_size', 'val_size', 'seed')
+
+
+def _as_list(value) -> list:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _model_entry(entry) -> Tuple[str, Dict[str, Any]]:
+    """Normalize a model entry ('name' or {'name', 'params'})."""
+    if isinstance(entry, str):
+        return entry, {}
+    return entry['name'], dict(entry.get('params') or {})
+
+
+def _canonical(obj) -> str:
+    return json.dumps(obj, sort_keys=True, default=str)
+
+
+def expand_matrix(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Expand a matrix spec into unique cell configs.
+
+    Args:
+        spec: Matrix spec (see module docstring)
+
+    Returns:
+        List of experiment configs accepted by ``run_corruption_experiment``,
+        in spec order, without exact duplicates
+    """
+    defaults = dict(spec.get('defaults') or {})
+    output_dir = spec.get('output_dir', defaults.get('output_dir', 'outputs/matrix'))
+    corruptions = _as_list(spec.get('corruptions')) or [{'type': 'none'}]
+    severities = [float(s) for s in _as_list(spec.get('severities'))] or [0.0]
+    seeds = [int(s) for s in _as_list(spec.get('seeds'))] or [defaults.get('seed', 42)]
+
+    cells = OrderedDict()
+    for dataset in _as_list(spec['datasets']):
+        for model_entry in _as_list(spec['models']):
+            model, params = _model_entry(model_entry)
+            for corruption in corruptions:
+                corruption = dict(corruption)
+                corruption_severities = corruption.pop('severities', None)
+                if corruption.get('type', 'none') == 'none':
+                    cell_severities = [0.0]
+                elif corruption_severities is not None:
+                    cell_severities = [float(s) for s in corruption_severities]
+                else:
+                    cell_severities = severities
+                for severity in cell_severities:
+                    for seed in seeds:
+                        config = dict(defaults)
+                        config.update({
+                            'dataset': dataset,
+                            'model': model,
+                            'model_params': params,
+                            'corruption': {**corruption, 'severity': round(severity, 10)},
+                            'seed': seed,
+                            'output_dir': output_dir,
+                        })
+                        cells.setdefault(_canonical(config), config)
+    return list(cells.values())
+
+
+def prepare_key(config: Dict[str, Any]) -> str:
+    """Key of the prepared data a cell needs (dataset, preprocessing, split sizes, seed)."""
+    return _canonical({k: config.get(k) for k in PREPARE_KEYS})
+
+
+def group_cells(configs: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group cell configs by prepared data, keeping first-seen order."""
+    groups = OrderedDict()
+    for config in configs:
+        groups.setdefault(prepare_key(config), []).append(config)
+    return groups
+
+
+def model_key(config: Dict[str, Any]) -> str:
+    """Key of everything except the model, i.e. cells that can share corrupted data."""
+    return _canonical({k: v for k, v in config.items() if k not in ('model', 'model_params')})
+
+
+def cell_run_name(config: Dict[str, Any]) -> str:
+    """
+    Run directory name for a matrix cell.
+
+    The short config hash keeps cells apart that differ only in model_params
+    or corruption parameters (and are named within the same second).
+    """
+    corruption = config.get('corruption') or {}
+    ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return (f"{config['dataset']}_{config['model']}_{corruption.get('type', 'none')}_"
+            f"{corruption.get('severity', 0.0):.2f}_seed{config['seed']}_{run_hash(config)[:8]}_{ts}")
+
+
+def run_matrix(configs: List[Dict[str, Any]], n_jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run expanded matrix cells, sharing data preparation within each group.
+
+    Args:
+        configs: Cell configs from ``expand_matrix``
+        n_jobs: Models fit concurrently on a shared corrupted dataset
+                (see ``run_multi_model_experiment``)
+
+    Returns:
+        One outcome per cell (in group order) with config, run_name, status,
+        result (slim, without the fitted model), error, fit_time and
+        eval_time (the cell model's fit and its prediction and metrics, see
+        ``fit_and_evaluate``; shared data loading, preparation and
+        corruption are not included, so neither is a per-cell wall time)
+    """
+    groups = group_cells(configs)
+    print(f"Running {len(configs)} cells in {len(groups)} data groups")
+    raw_cache = {}
+    outcomes = []
+    for group_configs in groups.values():
+        first = group_configs[0]
+        raw_key = _canonical({k: first.get(k) for k in ('dataset', 'preprocessing')})
+        try:
+            if raw_key not in raw_cache:
+                # Only the current dataset is kept in memory
+                raw_cache.clear()
+                raw_cache[raw_key] = load_raw_dataset(first)
+            set_seed(first.get('seed', 42))
+            prepared = prepare_data(first, raw=raw_cache[raw_key])
+        except Exception:
+            error = traceback.format_exc()
+            print(f"\nData preparation failed for {first['dataset']} seed {first.get('seed')}")
+            for config in group_configs:
+                outcomes.append({'config': config, 'run_name': None, 'status': STATUS_ERROR,
+                                 'result': None, 'error': error, 'fit_time': 0.0, 'eval_time': 0.0})
+            continue
+
+        corruption_groups = OrderedDict()
+        for config in group_configs:
+            corruption_groups.setdefault(model_key(config), []).append(config)
+        for model_configs in corruption_groups.values():
+            run_names = [cell_run_name(config) for config in model_configs]
+            models = [{'name': c['model'], 'params': c.get('model_params') or {}} for c in model_configs]
+            try:
+                results = run_multi_model_experiment(
+                    model_configs[0], models, run_names=run_names,
+                    prepared=prepared, n_jobs=n_jobs, raise_errors=False
+                )
+            except Exception as e:
+                # Corruption itself failed: every model of this cell group fails
+                results = [e] * len(model_configs)
+            for config, run_name, result in zip(model_configs, run_names, results):
+                if isinstance(result, Exception):
+                    error = ''.join(traceback.format_exception(type(result), result, result.__traceback__))
+                    outcome = {'status': STATUS_ERROR, 'result': None, 'error': error,
+                               'fit_time': 0.0, 'eval_time': 0.0}
+                    print(f"\nCell {run_name} failed: {error.strip().splitlines()[-1]}")
+                else:
+                    outcome = {'status': STATUS_OK, 'error': None, 'fit_time': result['fit_time'],
+                               'eval_time': result['eval_time'],
+                               'result': {k: result[k] for k in RESULT_KEYS if k in result}}
+                outcome.update({'config': config, 'run_name': run_name})
+                outcomes.append(outcome)
+    return outcomes
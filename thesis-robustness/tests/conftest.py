@@ -0,0 +1,54 @@
+"""Synthetic datasets and config helpers shared by the end-to-end tests."""
+import numpy as np
+import pytest
+
+from src.common.registry import register_dataset
+
+
+@register_dataset('synthetic_tabular')
+def load_synthetic_tabular(n_samples=600, n_features=6, **kwargs):
+    """Small binary classification dataset for pipeline tests."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(n_samples, n_features)
+    y = (X[:, 0] + 0.5 * X[:, 1] + 0.3 * rng.randn(n_samples) > 0).astype(int)
+    return X, y
+
+
+@register_dataset('synthetic_multiclass')
+def load_synthetic_multiclass(n_samples=600, n_features=6, **kwargs):
+    """Small three-class classification dataset for pipeline tests."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(n_samples, n_features)
+    y = np.digitize(X[:, 0] + 0.3 * rng.randn(n_samples), [-0.5, 0.5])
+    return X, y
+
+
+@register_dataset('synthetic_text')
+def load_synthetic_text(n_samples=300, **kwargs):
+    """Small raw-text sentiment dataset for text pipeline tests."""
+    rng = np.random.RandomState(0)
+    positive, negative = ['great', 'good', 'love', 'fine'], ['bad', 'awful', 'hate', 'poor']
+    filler = ['movie', 'plot', 'actor', 'scene', 'story', 'music', 'ending', 'cast']
+    y = rng.randint(0, 2, n_samples)
+    texts = np.array([
+        ' '.join(rng.choice(filler + (positive if label else negative), size=12))
+        for label in y
+    ])
+    return texts, y
+
+
+@pytest.fixture
+def make_config(tmp_path):
+    """Build a random forest run config on synthetic_tabular, writing under tmp_path."""
+    def _config(**overrides):
+        config = {
+            'dataset': 'synthetic_tabular',
+            'model': 'random_forest',
+            'model_params': {'n_estimators': 20},
+            'seed': 42,
+            'corruption': {'type': 'additive_noise', 'severity': 0.3},
+            'output_dir': str(tmp_path),
+        }
+        config.update(overrides)
+        return config
+    return _config
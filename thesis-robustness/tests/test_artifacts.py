@@ -0,0 +1,91 @@
+"""Tests for stored model artifacts and evaluation-only runs."""
+import numpy as np
+from scipy import sparse
+
+from src.common.artifacts import ARTIFACTS_DIRNAME, ArtifactStore, run_hash
+from src.models.flat_forest import FlatForest
+from src.pipelines.corruption import prepare_data, run_corruption_experiment
+from src.pipelines.evaluate import evaluate_artifacts, expand_eval_sets
+
+
+def test_model_artifacts(tmp_path, make_config):
+    """Saved models reload memory-mapped and reproduce the run's predictions."""
+    config = make_config(save_model=True, corruption={'type': 'missingness', 'severity': 0.2})
+    result = run_corruption_experiment(config, run_name='saved')
+    assert result['artifact_key'] == run_hash(config)
+    assert run_hash(dict(config, output_dir='elsewhere')) == run_hash(config)
+
+    store = ArtifactStore(tmp_path / ARTIFACTS_DIRNAME)
+    assert store.keys() == [result['artifact_key']]
+    artifact = store.load(result['artifact_key'])
+    assert store.load(result['artifact_key']) is artifact, "Loads are memoised"
+    model, preprocessors = artifact['model'], artifact['preprocessors']
+    assert type(model).__name__ == 'FlatForest' and isinstance(model.nodes, np.memmap)
+    assert set(preprocessors) == {'scaler', 'imputer'}
+
+    # Scaled test split (test rows are never corrupted) through the stored imputer
+    X_test = preprocessors['imputer'].transform(prepare_data(config)['X_test'])
+    np.testing.assert_array_equal(model.predict(X_test), result['model'].predict(X_test))
+    np.testing.assert_array_equal(model.predict_proba(X_test), result['model'].predict_proba(X_test))
+
+
+def test_flat_forest_sparse_text(tmp_path, make_config):
+    """Flattened forests trained on TF-IDF features predict sparse rows like the forest."""
+    config = make_config(dataset='synthetic_text', save_model=True,
+                         corruption={'type': 'token_dropout', 'severity': 0.3})
+    result = run_corruption_experiment(config, run_name='text_forest')
+    model = ArtifactStore(tmp_path / ARTIFACTS_DIRNAME).load(result['artifact_key'])['model']
+    assert type(model).__name__ == 'FlatForest'
+
+    X_test = prepare_data(config)['X_test']
+    assert sparse.issparse(X_test)
+    np.testing.assert_array_equal(model.predict(X_test), result['model'].predict(X_test))
+    np.testing.assert_array_equal(model.predict_proba(X_test), result['model'].predict_proba(X_test))
+    # Predictions come from the sklearn forest rebuilt out of the memory-mapped nodes
+    rebuilt = model._estimator()
+    assert type(rebuilt) is type(result['model']) and isinstance(model.nodes, np.memmap)
+    assert [e.tree_.node_count for e in rebuilt.estimators_] == [e.tree_.node_count for e in result['model'].estimators_]
+
+    records = evaluate_artifacts(ArtifactStore(tmp_path / ARTIFACTS_DIRNAME), expand_eval_sets([{'name': 'clean'}]))
+    assert np.isclose(records[0]['accuracy'], result['test_metrics']['accuracy'])
+
+
+def test_calibrated_artifact(tmp_path, make_config):
+    """Calibrated runs store their calibrated scorer and evaluate with it."""
+    result = run_corruption_experiment(make_config(save_model=True, calibration='isotonic'))
+    store = ArtifactStore(tmp_path / ARTIFACTS_DIRNAME)
+    artifact = store.load(result['artifact_key'])
+    assert artifact['meta']['calibration'] == 'isotonic'
+    assert type(artifact['scorer']).__name__ == 'CalibratedClassifierCV'
+
+    record, = evaluate_artifacts(store, expand_eval_sets([{'name': 'clean'}]))
+    assert np.isclose(record['accuracy'], result['test_metrics']['accuracy'])
+    assert np.isclose(record['auroc'], result['test_metrics']['auroc'])
+
+
+def test_evaluate_stored_models(tmp_path, monkeypatch, make_config):
+    """Stored models are scored on many eval sets with one predict call each."""
+    forest = run_corruption_experiment(make_config(save_model=True))
+    linear = run_corruption_experiment(make_config(save_model=True, model='logistic', model_params={}))
+    eval_sets = expand_eval_sets([
+        {'name': 'clean'},
+        {'name': 'noise', 'corruption': {'type': 'additive_noise'}, 'severities': [0.0, 1.0]},
+        {'name': 'missing', 'corruption': {'type': 'missingness', 'severity': 0.3}},
+        {'name': 'everything', 'split': 'all'},
+    ])
+    assert [s['name'] for s in eval_sets] == ['clean', 'noise_0', 'noise_1', 'missing', 'everything']
+
+    calls = []
+    predict_proba = FlatForest.predict_proba
+    monkeypatch.setattr(FlatForest, 'predict_proba',
+                        lambda self, X: calls.append(X.shape[0]) or predict_proba(self, X))
+    records = evaluate_artifacts(ArtifactStore(tmp_path / ARTIFACTS_DIRNAME), eval_sets)
+    assert len(records) == 2 * len(eval_sets)
+    assert len(calls) == 1 and calls[0] == sum(r['n_samples'] for r in records if r['model'] == 'random_forest')
+
+    for result in (forest, linear):
+        rows = {r['eval_set']: r for r in records if r['artifact'] == result['artifact_key']}
+        assert np.isclose(rows['clean']['accuracy'], result['test_metrics']['accuracy'])
+        assert np.isclose(rows['noise_0']['auroc'], rows['clean']['auroc'])
+        assert rows['noise_1']['accuracy'] < rows['clean']['accuracy']
+        assert rows['everything']['n_samples'] == 600
@@ -1,11 +1,18 @@
 """Test corruption pipeline integration without requiring datasets."""
+import time
+
 import numpy as np
 from scipy import sparse
 import yaml
 from pathlib import Path
+from sklearn.model_selection import train_test_split
 
 from src.corruptions import add_noise, add_missingness, create_class_imbalance, token_dropout
-from src.pipelines.corruption import apply_corruption
+from src.common.registry import get_dataset, get_model
+from src.common.sparse_layout import canonical_csr, is_canonical_csr, find_sparse_conversions
+from src.common.split import train_val_test_indices, split_view, clear_split_cache
+from src.pipelines import corruption
+from src.pipelines.corruption import apply_corruption, apply_compound_corruption, corrupt_training_data
 
 
 def test_apply_corruption():
@@ -110,6 +117,150 @@ def test_severity_scaling():
     print("✓ Severity scaling works correctly\n")
 
 
+def test_compound_corruption():
+    """Test compound corruption and reuse of cached prefixes."""
+    X = np.random.RandomState(0).randn(200, 8)
+    noise = {'type': 'additive_noise', 'severity': 0.3}
+    
+    # A single-step compound is the plain corruption
+    config = {'type': 'compound', 'steps': [noise]}
+    X_single, _ = apply_corruption(X, None, noise, random_state=42)
+    X_compound, _ = apply_corruption(X, None, config, random_state=42)
+    assert np.array_equal(X_single, X_compound), "Single-step compound should match"
+    
+    # Cached 2-D grid matches uncached runs; the noisy prefix is computed once per level
+    calls = []
+    cache = {}
+    for noise_severity in (0.0, 0.5):
+        for missing_severity in (0.0, 0.1, 0.2):
+            steps = [
+                {'type': 'additive_noise', 'severity': noise_severity},
+                {'type': 'missingness', 'severity': missing_severity},
+            ]
+            before = len(cache) and cache[1][1]
+            X_cached, _ = apply_compound_corruption(X, None, steps, random_state=42, cache=cache)
+            X_fresh, _ = apply_compound_corruption(X, None, steps, random_state=42)
+            assert np.array_equal(np.isnan(X_cached), np.isnan(X_fresh))
+            assert np.allclose(X_cached, X_fresh, equal_nan=True), "Cache must not change results"
+            calls.append(before is cache[1][1])
+    assert calls == [False, True, True, False, True, True], "Noisy prefix reused within a noise level"
+
+
+def test_shared_training_data_is_not_modified():
+    """Corrupting shared prepared data leaves it intact; owned data is reused."""
+    rng = np.random.RandomState(0)
+    prepared = {
+        'X_train': rng.randn(300, 5), 'X_val': rng.randn(50, 5), 'X_test': rng.randn(50, 5),
+        'y_train': rng.randint(0, 2, 300),
+    }
+    original = prepared['X_train'].copy()
+    config = {'seed': 42, 'corruption': {'type': 'missingness', 'severity': 0.2}}
+    
+    shared = corrupt_training_data(config, prepared)
+    assert np.array_equal(prepared['X_train'], original), "Shared input must not change"
+    
+    owned = corrupt_training_data(config, prepared, inplace=True)
+    assert owned['X_train'] is prepared['X_train'], "Owned input is corrupted and imputed in place"
+    assert np.allclose(owned['X_train'], shared['X_train'])
+    assert not np.isnan(owned['X_train']).any()
+
+
+def test_multi_model_shares_corruption(tmp_path, monkeypatch, make_config):
+    """Several models on one corrupted dataset match separate single-model runs."""
+    config = make_config(corruption={'type': 'missingness', 'severity': 0.2})
+    models = [{'name': 'random_forest', 'params': {'n_estimators': 20}}, {'name': 'logistic', 'params': {}}]
+
+    calls = []
+    original = corruption.apply_corruption
+    monkeypatch.setattr(corruption, 'apply_corruption', lambda *a, **k: calls.append(1) or original(*a, **k))
+    results = corruption.run_multi_model_experiment(config, models, n_jobs=2)
+    assert len(calls) == 1
+    assert len({str(r['run_dir']) for r in results}) == 2
+
+    for entry, result in zip(models, results):
+        single = corruption.run_corruption_experiment(
+            dict(config, model=entry['name'], model_params=entry['params'], output_dir=str(tmp_path / 'ref'))
+        )
+        assert result['test_metrics'] == single['test_metrics']
+
+
+def test_cached_split_indices():
+    """Cached index splits match sklearn's two-stage split and are shared read-only."""
+    X, y = get_dataset('synthetic_tabular')
+    clear_split_cache()
+    idx_train, idx_val, idx_test = train_val_test_indices(y, random_state=7)
+    X_tv, X_test, y_tv, _ = train_test_split(X, y, test_size=0.2, random_state=7, stratify=y)
+    X_train, X_val, _, _ = train_test_split(X_tv, y_tv, test_size=0.1 / 0.8, random_state=7, stratify=y_tv)
+    assert np.array_equal(X[idx_train], X_train) and np.array_equal(X[idx_val], X_val)
+    assert np.array_equal(X[idx_test], X_test)
+
+    assert train_val_test_indices(y.copy(), random_state=7)[0] is idx_train, "Indices are cached"
+    assert not idx_train.flags.writeable
+    assert train_val_test_indices(y, random_state=8)[0] is not idx_train
+
+    split = split_view(X, y, random_state=7)
+    assert split.sizes() == {'train': len(idx_train), 'val': len(idx_val), 'test': len(idx_test)}
+    assert np.array_equal(split.X_split('val'), X_val)
+    assert split.X_split('train').flags['C_CONTIGUOUS']
+
+
+def test_float32_mode(make_config):
+    """dtype: float32 keeps features float32 through corruption and fitting."""
+    config = make_config(dtype='float32', model='logistic', model_params={},
+                         corruption={'type': 'compound', 'steps': [
+                             {'type': 'additive_noise', 'severity': 0.3},
+                             {'type': 'missingness', 'severity': 0.2}]})
+    prepared = corruption.prepare_data(config)
+    assert all(prepared[k].dtype == np.float32 for k in ('X_train', 'X_val', 'X_test'))
+    data = corrupt_training_data(config, prepared)
+    assert data['X_train'].dtype == np.float32 and not np.isnan(data['X_train']).any()
+
+    # The model is fit in float32 and only differs from the float64 run by rounding
+    result = corruption.fit_and_evaluate(config, data, run_name='f32')
+    reference = corruption.run_corruption_experiment(dict(config, dtype=None), run_name='f64')
+    assert result['model'].coef_.dtype == np.float32
+    np.testing.assert_allclose(result['model'].coef_, reference['model'].coef_, atol=1e-5)
+
+
+def test_text_pipeline_canonical_csr(make_config):
+    """Text splits stay canonical CSR through corruption and models fit them without conversion."""
+    config = make_config(dataset='synthetic_text',
+                         corruption={'type': 'token_dropout', 'severity': 0.3})
+    prepared = corruption.prepare_data(config)
+    assert all(is_canonical_csr(prepared[k]) for k in ('X_train', 'X_val', 'X_test'))
+    data = corrupt_training_data(config, prepared)
+    assert is_canonical_csr(data['X_train']) and data['X_train'].nnz < prepared['X_train'].nnz
+
+    for name in ('logistic', 'linear_svm', 'svm_rbf_text'):
+        model = get_model(name)
+        assert find_sparse_conversions(model.fit, data['X_train'], data['y_train']) == [], name
+        assert find_sparse_conversions(model.predict, data['X_test']) == [], name
+
+
+def test_fit_time_excludes_evaluation(monkeypatch, make_config):
+    """fit_time stops after fitting; prediction and metrics are timed as eval_time."""
+    config = make_config(model='logistic', model_params={})
+    data = corrupt_training_data(config, corruption.prepare_data(config))
+    predict = corruption.predict_with_scores
+    monkeypatch.setattr(corruption, 'predict_with_scores',
+                        lambda *a, **k: time.sleep(0.2) or predict(*a, **k))
+    result = corruption.fit_and_evaluate(config, data, run_name='timed')
+    assert result['fit_time'] < 0.2 <= result['eval_time'] / 2, "Val and test predictions are eval_time"
+
+
+def test_canonical_csr_leaves_input_unchanged():
+    """canonical_csr returns a fixed copy and never sorts or re-types the caller's matrix."""
+    data, indices, indptr = np.array([1.0, 2.0, 3.0]), np.array([2, 0, 2]), np.array([0, 3, 3])
+    X = sparse.csr_matrix((data, indices, indptr), shape=(2, 3))
+    before = (X.data.copy(), X.indices.copy(), X.indptr.copy())
+    Y = canonical_csr(X)
+    assert Y is not X and is_canonical_csr(Y)
+    np.testing.assert_array_equal(Y.toarray(), [[2.0, 0.0, 4.0], [0.0, 0.0, 0.0]])
+    assert all(np.array_equal(a, b) for a, b in zip((X.data, X.indices, X.indptr), before))
+    assert X.indices.dtype == before[1].dtype and not X.has_canonical_format
+    assert canonical_csr(Y) is Y, "Canonical input is returned as is"
+
+
 if __name__ == '__main__':
     print("="*60)
     print("CORRUPTION PIPELINE INTEGRATION TESTS")
@@ -120,6 +271,8 @@ if __name__ == '__main__':
         test_apply_corruption()
         test_config_parsing()
         test_severity_scaling()
+        test_compound_corruption()
+        test_shared_training_data_is_not_modified()
         
         print("="*60)
         print("✓ ALL PIPELINE TESTS PASSED")
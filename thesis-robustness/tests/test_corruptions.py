@@ -1,7 +1,9 @@
 """Test script to validate corruption modules."""
 import numpy as np
 from scipy import sparse
-from src.corruptions.tabular import add_noise, add_missingness, create_class_imbalance
+from src.corruptions import get_corruption
+from src.corruptions.fused import fused_tabular_corruption, is_fusable
+from src.corruptions.tabular import add_noise, add_missingness, create_class_imbalance, column_stds
 from src.corruptions.text import token_dropout
 
 
@@ -93,6 +95,74 @@ def test_reproducibility():
     print("  ✓ Reproducibility test passed")
 
 
+def test_missingness_matches_reference_loop():
+    """Vectorized missingness masks the same entries as the per-entry loop."""
+    X = np.random.randn(50, 6)
+    feature_mask = np.array([True, False, True, True, False, True])
+    X_corrupted = add_missingness(X, severity=0.3, random_state=7, feature_mask=feature_mask)
+    
+    # Reference: enumerate eligible entries row-major and draw as before
+    np.random.seed(7)
+    eligible = [(i, j) for i in range(50) for j in range(6) if feature_mask[j]]
+    chosen = np.random.choice(len(eligible), size=int(0.3 * len(eligible)), replace=False)
+    expected = np.zeros_like(X, dtype=bool)
+    for idx in chosen:
+        expected[eligible[idx]] = True
+    assert np.array_equal(np.isnan(X_corrupted), expected), "Masked entries should match"
+
+
+def test_fused_compound_kernel():
+    """Fused noise+missingness kernel reproduces sequential corruption exactly."""
+    X = np.random.randn(1000, 12)
+    steps = [
+        {'type': 'additive_noise', 'severity': 0.4, 'feature_mask': [True, False] * 6},
+        {'type': 'missingness', 'severity': 0.2},
+    ]
+    X_seq = add_noise(X, severity=0.4, random_state=42, feature_mask=np.array([True, False] * 6))
+    X_seq = add_missingness(X_seq, severity=0.2, random_state=43)
+    X_fused = fused_tabular_corruption(X, steps, random_state=42, block_rows=128)
+    assert np.array_equal(X_seq, X_fused, equal_nan=True), "Fused result should match sequential"
+    assert not is_fusable(X, steps[::-1]), "Noise after missingness is not fusable"
+
+
+def test_inplace_corruption():
+    """In-place corruption reuses the input buffer and matches the copying path."""
+    X = np.random.randn(200, 10)
+    
+    for corrupt in (add_noise, add_missingness):
+        expected = corrupt(X, severity=0.3, random_state=42)
+        buffer = X.copy()
+        result = corrupt(buffer, severity=0.3, random_state=42, inplace=True)
+        assert result is buffer, f"{corrupt.__name__} should return the input buffer"
+        assert np.array_equal(result, expected, equal_nan=True), f"{corrupt.__name__} results should match"
+    
+    X_sparse = sparse.random(100, 500, density=0.1, format='csr', random_state=42)
+    expected = token_dropout(X_sparse, severity=0.3, random_state=42)
+    buffer = X_sparse.copy()
+    result = token_dropout(buffer, severity=0.3, random_state=42, inplace=True)
+    assert result is buffer, "token_dropout should return the input matrix"
+    assert (result != expected).nnz == 0 and result.nnz == expected.nnz, "Dropped tokens should match"
+
+
+def test_column_stds_matches_np_std():
+    """Blocked column stds equal np.std over the masked columns, NaN columns included."""
+    X = np.random.randn(100, 40)
+    X[3, 5] = np.nan
+    feature_mask = np.arange(40) % 3 != 0
+    expected = np.std(X[:, feature_mask], axis=0)
+    assert np.array_equal(column_stds(X, feature_mask), expected, equal_nan=True)
+
+
+def test_registered_corruptions():
+    """Registry entries are the corruption functions and accept their normal arguments."""
+    X = np.random.randn(100, 10)
+    
+    corrupt = get_corruption('additive_noise')
+    assert corrupt is add_noise
+    assert np.array_equal(corrupt(X, severity=0.3, random_state=42), add_noise(X, severity=0.3, random_state=42))
+    assert get_corruption('missingness') is add_missingness
+
+
 if __name__ == '__main__':
     print("Running corruption module tests...\n")
     
@@ -102,6 +172,11 @@ if __name__ == '__main__':
         test_class_imbalance()
         test_token_dropout()
         test_reproducibility()
+        test_missingness_matches_reference_loop()
+        test_fused_compound_kernel()
+        test_inplace_corruption()
+        test_column_stds_matches_np_std()
+        test_registered_corruptions()
         
         print("\n✓ All tests passed!")
     except Exception as e:
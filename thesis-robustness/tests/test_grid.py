@@ -0,0 +1,114 @@
+"""Tests for supervised cells, the experiment matrix and severity-grid chains."""
+import math
+import mmap
+import time
+
+import numpy as np
+
+from src.cli.run_severity_grid import build_cells, grid_result_record
+from src.common.supervisor import run_supervised, STATUS_OK, STATUS_ERROR, STATUS_TIMEOUT, STATUS_MEMORY
+from src.pipelines import matrix
+from src.pipelines.corruption import run_corruption_experiment
+from src.pipelines.grid import run_warm_start_chains
+
+
+def _allocate(reserve_mb, touch_mb):
+    """Reserve address space without touching it, then touch some resident memory."""
+    reserved = mmap.mmap(-1, reserve_mb * 1024 * 1024) if reserve_mb else None
+    touched = np.ones(touch_mb * 1024 * 1024 // 8)
+    time.sleep(2.0)
+    return float(touched[0]) + (0 if reserved is None else len(reserved))
+
+
+def test_supervised_cells():
+    """Supervised calls report ok, error, timeout and memory outcomes with resource usage."""
+    ok = run_supervised(math.sqrt, args=(16.0,), timeout=30)
+    assert ok['status'] == STATUS_OK and ok['result'] == 4.0
+    assert ok['max_rss_mb'] is not None and ok['wall_time'] > 0
+
+    error = run_supervised(math.sqrt, args=(-1.0,), timeout=30)
+    assert error['status'] == STATUS_ERROR and 'ValueError' in error['error']
+
+    timeout = run_supervised(time.sleep, args=(30,), timeout=1.0)
+    assert timeout['status'] == STATUS_TIMEOUT
+    assert timeout['wall_time'] < 10
+
+    # The ceiling is on resident memory, not on reserved address space
+    reserved = run_supervised(_allocate, args=(2048, 10), timeout=30, memory_limit_mb=300)
+    assert reserved['status'] == STATUS_OK and reserved['max_rss_mb'] < 300
+    resident = run_supervised(_allocate, args=(0, 500), timeout=30, memory_limit_mb=300)
+    assert resident['status'] == STATUS_MEMORY
+
+
+def test_matrix_shares_data_preparation(tmp_path, monkeypatch):
+    """Matrix cells are deduplicated, load data once and match standalone runs."""
+    spec = {
+        'output_dir': str(tmp_path),
+        'datasets': ['synthetic_tabular'],
+        'models': [{'name': 'random_forest', 'params': {'n_estimators': 20}}, 'logistic',
+                   {'name': 'random_forest', 'params': {'n_estimators': 20}}],
+        'corruptions': [{'type': 'additive_noise'}, {'type': 'missingness', 'severities': [0.2]}],
+        'severities': [0.0, 0.3, 0.30],
+        'seeds': [42, 43],
+    }
+    configs = matrix.expand_matrix(spec)
+    assert len(configs) == 2 * 2 * (2 + 1), "Duplicate models/severities are dropped"
+    assert len(matrix.group_cells(configs)) == 2
+
+    loads = []
+    original_load = matrix.load_raw_dataset
+    monkeypatch.setattr(matrix, 'load_raw_dataset', lambda config: loads.append(1) or original_load(config))
+    outcomes = matrix.run_matrix(configs)
+    assert len(loads) == 1
+    assert all(o['status'] == 'ok' and o['fit_time'] > 0 and o['eval_time'] > 0 for o in outcomes)
+
+    outcome = next(o for o in outcomes if o['config']['model'] == 'random_forest'
+                   and o['config']['seed'] == 43 and o['config']['corruption']['severity'] == 0.3)
+    standalone = run_corruption_experiment(dict(outcome['config'], output_dir=str(tmp_path / 'ref')))
+    assert outcome['result']['test_metrics'] == standalone['test_metrics']
+
+
+def test_matrix_cells_differing_in_params(tmp_path):
+    """Cells that differ only in model or corruption parameters get separate runs and records."""
+    spec = {
+        'output_dir': str(tmp_path),
+        'datasets': ['synthetic_tabular'],
+        'models': [{'name': 'random_forest', 'params': {'n_estimators': 5}},
+                   {'name': 'random_forest', 'params': {'n_estimators': 10}}],
+        'corruptions': [{'type': 'additive_noise', 'noise_type': 'gaussian'},
+                        {'type': 'additive_noise', 'noise_type': 'uniform'}],
+        'severities': [0.3],
+    }
+    configs = matrix.expand_matrix(spec)
+    assert len({matrix.cell_run_name(c) for c in configs}) == 4
+    outcomes = matrix.run_matrix(configs)
+    assert len({o['result']['run_dir'] for o in outcomes}) == 4
+
+    records = [grid_result_record(dict(o['result'], severity=0.3, seed=42), o['config']) for o in outcomes]
+    assert {(r['model_params']['n_estimators'], r['corruption_params']['noise_type']) for r in records} == {
+        (5, 'gaussian'), (5, 'uniform'), (10, 'gaussian'), (10, 'uniform')}
+
+
+def test_warm_start_chain(tmp_path, make_config):
+    """Warm-started logistic fits match cold fits in fewer iterations; other models fit cold."""
+    base = make_config(model='logistic', model_params={})
+    cells = build_cells(base, [0.2, 0.0, 0.1], [42], str(tmp_path))
+    outcomes = run_warm_start_chains(cells, check='all')
+    results = {o['severity']: o['result'] for o in outcomes}
+    assert not results[0.0]['warm_started'] and results[0.1]['warm_started']
+    for severity in (0.1, 0.2):
+        r = results[severity]
+        assert r['fit_iterations'] <= r['cold_fit_iterations']
+        assert abs(r['test_metrics']['accuracy'] - r['cold_test_metrics']['accuracy']) < 0.01
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(c['run_name'] for c in cells), \
+        "Cold comparison fits are not logged as runs"
+
+    fitted = {}
+    run_warm_start_chains(build_cells(base, [0.3, 0.5], [42], str(tmp_path)), fitted=fitted, check='none')
+    assert sorted(fitted[42]) == [0.3, 0.5], "Refinement rounds keep every warm-startable fit"
+
+    fitted = {}
+    cells = build_cells(make_config(), [0.0, 0.1], [42], str(tmp_path))
+    outcomes = run_warm_start_chains(cells, fitted=fitted)
+    assert not any(o['result']['warm_started'] for o in outcomes), "random_forest has no warm_start trait"
+    assert fitted[42] == {}, "Models without the warm_start trait are not kept"
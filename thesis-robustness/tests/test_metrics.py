@@ -0,0 +1,80 @@
+"""Tests for evaluation metric utilities."""
+import numpy as np
+from sklearn.metrics import accuracy_score, f1_score, roc_auc_score, mean_absolute_error
+
+from src.cli.run_severity_grid import _default_adaptive_metric
+from src.common.adaptive import plan_next_round
+from src.common.bootstrap import bootstrap_metrics, bootstrap_ci
+
+
+def _resample_indices(n, n_resamples, seed):
+    """Reproduce the index matrix drawn by the bootstrap engine."""
+    return np.random.RandomState(seed).randint(0, n, size=(n_resamples, n))
+
+
+def test_bootstrap_matches_sklearn_per_resample():
+    """Batched bootstrap metrics equal sklearn on each individual resample."""
+    rng = np.random.RandomState(0)
+    n = 300
+    y_true = rng.randint(0, 2, size=n)
+    y_score = np.round(y_true * 0.5 + rng.rand(n), 1)  # rounded to create ties
+    y_pred = (y_score > 0.75).astype(int)
+
+    samples = bootstrap_metrics(y_true, y_pred, y_score, n_resamples=5, random_state=7)
+    for b, idx in enumerate(_resample_indices(n, 5, 7)):
+        assert np.isclose(samples['accuracy'][b], accuracy_score(y_true[idx], y_pred[idx]))
+        assert np.isclose(samples['f1'][b], f1_score(y_true[idx], y_pred[idx], average='weighted'))
+        assert np.isclose(samples['auroc'][b], roc_auc_score(y_true[idx], y_score[idx]))
+
+    y_reg = rng.randn(n)
+    y_reg_pred = y_reg + 0.3 * rng.randn(n)
+    samples = bootstrap_metrics(y_reg, y_reg_pred, task='regression', n_resamples=5, random_state=3)
+    for b, idx in enumerate(_resample_indices(n, 5, 3)):
+        assert np.isclose(samples['mae'][b], mean_absolute_error(y_reg[idx], y_reg_pred[idx]), rtol=1e-5)
+        rmse = np.sqrt(np.mean((y_reg[idx] - y_reg_pred[idx]) ** 2))
+        assert np.isclose(samples['rmse'][b], rmse, rtol=1e-5)
+
+
+def test_bootstrap_ci_covers_point_estimate():
+    """Confidence intervals bracket the full-sample estimate."""
+    rng = np.random.RandomState(1)
+    y_true = rng.randint(0, 2, size=2000)
+    y_score = y_true + rng.randn(2000)
+    y_pred = (y_score > 0.5).astype(int)
+    ci = bootstrap_ci(y_true, y_pred, y_score, n_resamples=2000, random_state=0)
+    for name, value in (('accuracy', accuracy_score(y_true, y_pred)),
+                        ('auroc', roc_auc_score(y_true, y_score))):
+        assert ci[name]['ci_low'] < value < ci[name]['ci_high']
+        assert ci[name]['std'] > 0
+
+
+def test_adaptive_refinement_finds_knee():
+    """Adaptive refinement concentrates severities around the knee of the curve."""
+    def curve(severity):
+        return 0.85 - 0.3 / (1.0 + np.exp(-(severity - 0.62) / 0.03))
+
+    seeds = [0, 1]
+    results = []
+
+    def evaluate(severities):
+        for s in severities:
+            for seed in seeds:
+                # A flat test curve: refinement must follow the validation split
+                results.append({'severity': s, 'seed': seed, 'val_metrics': {'accuracy': curve(s)},
+                                'test_metrics': {'accuracy': 0.85}})
+
+    evaluate(np.linspace(0, 1, 5).tolist())
+    metric = _default_adaptive_metric(results)
+    assert metric == 'val_accuracy'
+    budget = 11 * len(seeds)
+    while True:
+        new = plan_next_round(results, metric, n_seeds=len(seeds), runs_done=len(results),
+                              max_runs=budget, tolerance=0.01, batch=2)
+        if not new:
+            break
+        evaluate(new)
+    assert len(results) <= budget
+    severities = sorted({r['severity'] for r in results})
+    spacing = min(b - a for a, b in zip(severities, severities[1:]) if a <= 0.62 <= b)
+    assert spacing <= 0.1 / 2, "Knee is resolved finer than the uniform 11-point grid"
+    assert [s for s in severities if s < 0.5] == [0.0, 0.25], "Flat region stays coarse"
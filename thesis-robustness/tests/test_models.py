@@ -0,0 +1,159 @@
+"""End-to-end tests of model-specific fitting, scoring and prediction paths."""
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import Ridge
+from sklearn.svm import SVC
+
+from src.common.registry import get_dataset, get_model
+from src.models.batch_predict import predict_with_scores
+from src.models.reg_path import fit_ridge_path
+from src.pipelines import corruption
+from src.pipelines.baseline import run_baseline
+from src.pipelines.corruption import run_corruption_experiment
+
+
+def test_approximate_kernel_models(make_config):
+    """Approximate RBF models use SVC's gamma='scale' and a fixed-size feature map, dense or sparse."""
+    X, y = get_dataset('synthetic_tabular')
+    dense = get_model('svm_rbf_approx', n_components=1000).fit(X, y)
+    assert np.isclose(dense.gamma_, SVC(gamma='scale').fit(X, y)._gamma)
+    assert dense.pipeline_[0].components_.shape[0] == X.shape[0], "At most one landmark per row"
+    assert dense.predict_proba(X).shape == (X.shape[0], 2)
+
+    config = make_config(dataset='synthetic_text', model='svm_rbf_text_approx',
+                         model_params={'method': 'rff', 'n_components': 200})
+    prepared = corruption.prepare_data(config)
+    X_text, y_text = prepared['X_train'], prepared['y_train']
+    text = get_model('svm_rbf_text_approx', method='rff', n_components=200).fit(X_text, y_text)
+    assert np.isclose(text.gamma_, SVC(gamma='scale').fit(X_text, y_text)._gamma)
+    assert text.pipeline_[0].random_weights_.shape == (X_text.shape[1], 200)
+    assert not hasattr(text, 'predict_proba'), "linear_svm head"
+
+    # In the pipeline, AUROC comes from the head's decision scores
+    result = corruption.run_corruption_experiment(config, prepared=prepared)
+    assert 'auroc' in result['test_metrics']
+
+
+def test_baseline_and_sparse_calibration(tmp_path, make_config):
+    """The baseline predicts in chunks; calibration densifies at most one chunk of sparse val rows."""
+    config = make_config(model='logistic', model_params={}, corruption={'type': 'none'})
+    chunked = run_baseline(dict(config, prediction={'chunk_rows': 16, 'n_jobs': 2}), run_name='chunked')
+    whole = run_baseline(dict(config, prediction={'chunk_rows': None}), run_name='whole')
+    assert chunked['test_metrics'] == whole['test_metrics']
+
+    config = make_config(dataset='synthetic_text', model='logistic', model_params={}, calibration='sigmoid',
+                         corruption={'type': 'missingness', 'severity': 0.1}, prediction={'chunk_rows': 20})
+    data = corruption.corrupt_training_data(config, corruption.prepare_data(config))
+    densified = []
+    transform = data['eval_transform']
+    data['eval_transform'] = lambda X: densified.append(X.shape[0]) or transform(X)
+    result = corruption.fit_and_evaluate(config, data, run_name='calibrated')
+    assert data['X_val'].shape[0] > 20 and max(densified) == 20, "Calibration sample is one chunk"
+    assert 'auroc' in result['test_metrics']
+
+
+def test_svm_decision_scores_and_validation_calibration(make_config):
+    """svm_rbf scores AUROC from decision_function; opt-in calibration keeps the ranking."""
+    assert not hasattr(get_model('svm_rbf'), 'predict_proba'), "No internal Platt cross-validation"
+
+    config = make_config(model='svm_rbf', model_params={})
+    data = corruption.corrupt_training_data(config, corruption.prepare_data(config))
+    plain = corruption.fit_and_evaluate(config, data, run_name='svm_plain')
+    calibrated = corruption.fit_and_evaluate(dict(config, calibration='sigmoid'), data, run_name='svm_calibrated')
+    assert plain['test_metrics']['accuracy'] == calibrated['test_metrics']['accuracy']
+    assert np.isclose(plain['test_metrics']['auroc'], calibrated['test_metrics']['auroc'])
+
+
+def test_xgboost_native_missing_and_early_stopping(make_config):
+    """XGBoost trains on unimputed NaN data and early-stops; other models still get imputed data."""
+    pytest.importorskip('xgboost')
+    config = make_config(model='xgboost', model_params={},
+                         corruption={'type': 'missingness', 'severity': 0.2})
+    prepared = corruption.prepare_data(config)
+    data = corruption.corrupt_training_data(config, prepared)
+    assert data['has_missing'] and np.isnan(data['X_train']).any(), "No imputation for XGBoost"
+
+    # logistic cannot fit NaN, so it only runs if it got the imputed copy
+    xgb, logistic = corruption.run_multi_model_experiment(
+        config, ['xgboost', {'name': 'logistic', 'params': {}}], run_names=['xgb', 'lr'], prepared=prepared
+    )
+    assert xgb['model'].best_iteration + 1 < xgb['model'].n_estimators, "Rounds follow the validation loss"
+    assert logistic['model'].n_features_in_ == data['X_train'].shape[1]
+
+    # Without a validation split the model trains normally instead of failing
+    plain = get_model('xgboost', n_estimators=10).fit(data['X_train'], data['y_train'])
+    assert plain.get_booster().num_boosted_rounds() == 10
+
+
+def test_hist_gradient_boosting_native_missing(make_config):
+    """HistGradientBoosting skips imputation and early-stops on the validation split."""
+    config = make_config(model='hist_gradient_boosting', model_params={},
+                         corruption={'type': 'missingness', 'severity': 0.3})
+    data = corruption.corrupt_training_data(config, corruption.prepare_data(config))
+    assert data['has_missing'] and np.isnan(data['X_train']).any(), "No imputation for histogram gradient boosting"
+    model = corruption.fit_and_evaluate(config, data, run_name='hgb')['model']
+    assert model.n_iter_ < model.max_iter, "Iterations follow the validation split"
+
+    reg = get_model('hist_gradient_boosting_reg', max_iter=50)
+    reg.fit(data['X_train'], data['y_train'].astype(float))
+    assert np.isfinite(reg.predict(data['X_test'])).all()
+
+
+def test_regularization_path(make_config):
+    """Path points are logged as separate runs; logistic warm-starts, ridge shares one decomposition."""
+    config = make_config(model='logistic', model_params={},
+                     regularization_path={'values': [10.0, 0.01, 1.0]})
+    results = corruption.run_regularization_path(config, run_name='path')
+    assert [r['path_value'] for r in results] == [0.01, 1.0, 10.0], "Strongest regularization first"
+    assert [r['warm_started'] for r in results] == [False, True, True]
+    assert len({r['run_dir'] for r in results}) == 3
+    cold = run_corruption_experiment(make_config(model='logistic', model_params={'C': 1.0}))
+    np.testing.assert_allclose(results[1]['model'].coef_, cold['model'].coef_, atol=5e-3)  # within solver tolerance
+
+    svm = corruption.run_regularization_path(make_config(model='linear_svm', model_params={}), values=[0.1, 1.0])
+    assert not any(r['warm_started'] for r in svm)
+
+    ridge = corruption.run_regularization_path(make_config(model='linear_regression', model_params={}), values=[1.0, 10.0])
+    assert [r['path_value'] for r in ridge] == [10.0, 1.0]
+    assert all(r['fit_time'] >= r['path_solve_time'] / 2 > 0 for r in ridge), "Shared solve is timed"
+
+    rng = np.random.RandomState(0)
+    X = rng.randn(200, 5)
+    y = X @ rng.randn(5) + 3.0 + 0.1 * rng.randn(200)
+    models = [Ridge(alpha=a) for a in (100.0, 1.0, 1e-6)]
+    assert fit_ridge_path(models, X, y)
+    for model in models:
+        exact = Ridge(alpha=model.alpha, solver='cholesky').fit(X, y)
+        assert np.allclose(model.coef_, exact.coef_) and np.isclose(model.intercept_, exact.intercept_)
+        assert np.allclose(model.predict(X), exact.predict(X))
+
+
+def test_chunked_prediction(make_config):
+    """Chunked (threaded) prediction matches one-shot prediction with float32 scores."""
+    X, y = get_dataset('synthetic_tabular')
+    for model in (RandomForestClassifier(n_estimators=20, random_state=0), SVC()):
+        model.fit(X[:400], y[:400])
+        y_pred, y_score = predict_with_scores(model, X[400:], chunk_rows=37, n_jobs=3)
+        np.testing.assert_array_equal(y_pred, model.predict(X[400:]))
+        assert y_score.dtype == np.float32
+        expected = model.predict_proba(X[400:])[:, 1] if hasattr(model, 'predict_proba') else model.decision_function(X[400:])
+        np.testing.assert_allclose(y_score, expected, rtol=1e-6, atol=1e-6)
+
+    # Sparse val/test splits stay sparse after imputation and are densified per chunk
+    config = make_config(dataset='synthetic_text', model='logistic', model_params={},
+                     corruption={'type': 'missingness', 'severity': 0.1})
+    data = corruption.corrupt_training_data(config, corruption.prepare_data(config))
+    assert isinstance(data['X_train'], np.ndarray) and not isinstance(data['X_test'], np.ndarray)
+    chunked = run_corruption_experiment(dict(config, prediction={'chunk_rows': 16, 'n_jobs': 2}))
+    whole = run_corruption_experiment(dict(config, prediction={'chunk_rows': None}))
+    assert chunked['test_metrics'] == whole['test_metrics']
+
+
+def test_baseline_multiclass_leaves_out_auroc(make_config):
+    """The baseline reports no AUROC for multiclass probabilities instead of NaN."""
+    config = make_config(dataset='synthetic_multiclass', corruption={'type': 'none'},
+                         prediction={'chunk_rows': 16})
+    result = run_baseline(config, run_name='multiclass')
+    assert len(result['model'].classes_) == 3
+    assert 'auroc' not in result['val_metrics'] and 'auroc' not in result['test_metrics']
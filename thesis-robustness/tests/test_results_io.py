@@ -0,0 +1,186 @@
+"""Tests for result indexing and summary utilities."""
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.cli.analyze_severity_grid import load_severity_grid_summary, extract_metrics
+from src.cli.run_severity_grid import _aggregate_stability, grid_result_record, RESULTS_FILENAME
+from src.common.bootstrap import bootstrap_ci_from_run
+from src.common.cost_model import CostModel, estimate_makespan, longest_first
+from src.common.io import save_jsonl
+from src.common.logging import load_predictions
+from src.common.registry import get_dataset
+from src.common.robustness import compute_robustness_table, load_grid_summary, results_to_long
+from src.common.run_index import INDEX_FILENAME, build_run_row, scan_runs
+from src.pipelines.corruption import run_corruption_experiment
+
+
+def _write_run(runs_dir, name, accuracy):
+    run_dir = Path(runs_dir) / name
+    run_dir.mkdir(parents=True, exist_ok=True)
+    with open(run_dir / 'config.json', 'w') as f:
+        json.dump({'dataset': 'adult', 'model': 'random_forest'}, f)
+    with open(run_dir / 'final_metrics.json', 'w') as f:
+        json.dump({'test_accuracy': accuracy}, f)
+    return run_dir
+
+
+def test_run_index_reuses_unchanged_runs(tmp_path):
+    """Second scan only re-parses new or modified run directories."""
+    _write_run(tmp_path, 'run_a', 0.80)
+    run_b = _write_run(tmp_path, 'run_b', 0.70)
+    (tmp_path / 'incomplete').mkdir()
+
+    parsed = []
+
+    def counting_builder(run_dir):
+        parsed.append(run_dir.name)
+        return build_run_row(run_dir)
+
+    rows = scan_runs(tmp_path, row_builder=counting_builder)
+    assert [r['run_name'] for r in rows] == ['run_a', 'run_b']
+    assert (tmp_path / INDEX_FILENAME).exists(), "Index should be written"
+    assert sorted(parsed) == ['run_a', 'run_b']
+
+    # Nothing changed: nothing re-parsed
+    parsed.clear()
+    rows = scan_runs(tmp_path, row_builder=counting_builder)
+    assert parsed == []
+    assert rows[1]['test_accuracy'] == 0.70
+
+    # Modify one run and add another
+    with open(run_b / 'final_metrics.json', 'w') as f:
+        json.dump({'test_accuracy': 0.75, 'test_f1': 0.7}, f)
+    st = os.stat(run_b / 'final_metrics.json')
+    os.utime(run_b / 'final_metrics.json', ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    _write_run(tmp_path, 'run_c', 0.60)
+    rows = scan_runs(tmp_path, row_builder=counting_builder)
+    assert sorted(parsed) == ['run_b', 'run_c']
+    assert rows[1]['test_accuracy'] == 0.75
+    assert len(rows) == 3
+
+
+def test_grid_results_roundtrip(tmp_path):
+    """Grid results written as JSON Lines load back with typed columns."""
+    config = {'dataset': 'adult', 'model': 'random_forest',
+              'corruption': {'type': 'additive_noise'}}
+    results = [
+        {'severity': sev, 'seed': 42, 'run_dir': tmp_path / f'run_{sev}',
+         'val_metrics': {'accuracy': np.float64(0.8 - sev / 10)},
+         'test_metrics': {'accuracy': np.float64(0.8 - sev / 5), 'auroc': np.nan}}
+        for sev in (0.0, 0.5, 1.0)
+    ]
+    path = tmp_path / RESULTS_FILENAME
+    save_jsonl((grid_result_record(r, config) for r in results), path)
+
+    summary = load_severity_grid_summary(path)
+    assert summary['severities'] == [0.0, 0.5, 1.0]
+    assert np.isclose(summary['results'][1]['test_metrics']['accuracy'], 0.7)
+    severities, values = extract_metrics(summary, metric='accuracy', split='test')
+    assert severities.dtype == np.float64
+    assert np.allclose(values, [0.8, 0.7, 0.6])
+    severities, values = extract_metrics(summary, metric='auroc', split='test')
+    assert len(values) == 0, "NaN metrics should be skipped"
+
+
+def test_robustness_table_matches_per_curve_stats():
+    """Batch robustness statistics agree with per-curve numpy computations."""
+    rng = np.random.RandomState(0)
+    severities = np.array([0.0, 0.25, 0.5, 1.0])
+    rows = []
+    for grid, model in (('adult_noise', 'random_forest'), ('airbnb_noise', 'xgboost_reg')):
+        for seed in (42, 43, 44):
+            for sev in severities:
+                rows.append({
+                    'model': model, 'corruption': 'additive_noise', 'seed': seed,
+                    'severity': sev, 'grid': grid,
+                    'test_accuracy': 0.85 - 0.2 * sev + 0.01 * rng.randn(),
+                    'test_rmse': 0.5 + 0.3 * sev + 0.01 * rng.randn(),
+                })
+    long_df = results_to_long(pd.DataFrame(rows))
+    table = compute_robustness_table(long_df)
+    assert len(table) == 4, "One row per (grid, model, corruption, metric)"
+
+    for _, row in table.iterrows():
+        sub = long_df[(long_df['grid'] == row['grid']) & (long_df['metric'] == row['metric'])]
+        curve = sub.groupby('severity')['value'].mean()
+        x, y = curve.index.to_numpy(), curve.to_numpy()
+        area = np.sum(np.diff(x) * (y[1:] + y[:-1]) / 2)
+        assert np.isclose(row['auc'], area / (x.max() - x.min()))
+        assert np.isclose(row['degradation_slope'], np.polyfit(x, y, 1)[0])
+        assert np.isclose(row['clean_performance'], y[0])
+        if row['metric'] == 'test_rmse':
+            assert np.isclose(row['worst_performance'], y.max())
+            assert row['max_drop'] > 0, "RMSE increases are degradation"
+        else:
+            assert np.isclose(row['worst_performance'], y.min())
+        seed_std = sub.groupby('severity')['value'].std(ddof=0)
+        assert np.isclose(row['seed_std_mean'], seed_std.mean())
+        assert row['n_seeds'] == 3
+
+
+def test_grid_summary_matches_stability_layout(tmp_path):
+    """Per-severity aggregates read from run dirs match the severity grid's stability summary."""
+    results = []
+    for i, (severity, seed) in enumerate((s, seed) for s in (0.0, 0.5) for seed in (42, 43, 44)):
+        run_dir = tmp_path / f'run_{i}'
+        run_dir.mkdir()
+        metrics = {'accuracy': 0.9 - 0.2 * severity + 0.01 * (seed - 43), 'f1': 0.8 - 0.1 * severity}
+        config = {'dataset': 'adult', 'model': 'random_forest', 'seed': seed,
+                  'corruption': {'type': 'additive_noise', 'severity': severity}}
+        with open(run_dir / 'config.json', 'w') as f:
+            json.dump(config, f)
+        with open(run_dir / 'final_metrics.json', 'w') as f:
+            json.dump({f'test_{k}': v for k, v in metrics.items()}, f)
+        results.append({'severity': severity, 'val_metrics': {}, 'test_metrics': metrics})
+
+    summary = load_grid_summary(tmp_path)
+    expected = _aggregate_stability(results, [0.0, 0.5])
+    assert [r['severity'] for r in summary] == [0.0, 0.5]
+    for row, ref in zip(summary, expected):
+        assert row.keys() == ref.keys()
+        assert all(np.isclose(row[k], ref[k]) for k in ref)
+
+def test_cost_model_and_longest_first():
+    """Cost model recovers a power law from timings; LPT order and makespan."""
+    records = []
+    for severity in (0.0, 0.5, 1.0):
+        nnz = 1000.0 * (1.0 - 0.5 * severity)
+        for model, rate in (('svm_rbf', 1e-3), ('logistic', 1e-5)):
+            records.append({
+                'dataset': 'adult', 'model': model, 'corruption': 'class_imbalance',
+                'severity': severity, 'nnz': nnz, 'wall_time': rate * nnz ** 2,
+            })
+    cost_model = CostModel.from_records(records)
+
+    # Unseen severity: size is interpolated, time follows the fitted power law
+    expected = 1e-3 * (1000.0 * 0.875) ** 2
+    assert np.isclose(cost_model.predict('adult', 'svm_rbf', 'class_imbalance', 0.25), expected, rtol=1e-6)
+    assert cost_model.predict('adult', 'unknown_model') > 0
+
+    costs = [1.0, 5.0, 2.0, 4.0]
+    assert longest_first(costs) == [1, 3, 2, 0]
+    assert estimate_makespan(costs, workers=2) == 6.0
+    assert estimate_makespan(costs, workers=1) == sum(costs)
+
+
+def test_prediction_archive(tmp_path, make_config):
+    """Stored predictions reproduce the logged test metrics from disk."""
+    result = run_corruption_experiment(make_config(save_predictions=True), run_name='run_a')
+    run_corruption_experiment(make_config(save_predictions=True, model='logistic', model_params={}), run_name='run_b')
+    assert len(list((tmp_path / '_splits').iterdir())) == 1, "Split reference is shared"
+
+    stored = load_predictions(result['run_dir'])
+    test = stored['test']
+    assert test['y_pred'].dtype == np.int8 and test['task'] == 'classification'
+    assert test['y_score'].dtype == np.float16
+    accuracy = np.mean(test['y_pred'] == test['y_true'])
+    assert np.isclose(accuracy, result['test_metrics']['accuracy'])
+    _, y = get_dataset('synthetic_tabular')
+    assert np.array_equal(y[test['index']], test['y_true'])
+
+    ci = bootstrap_ci_from_run(result['run_dir'], n_resamples=200, random_state=0)
+    assert ci['accuracy']['ci_low'] <= accuracy <= ci['accuracy']['ci_high']